@@ -0,0 +1,111 @@
+# jobsboard/api/cache.py
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+
+# ---------------------------------------------------------
+# Namespace versions
+# ---------------------------------------------------------
+# Cache invalidation by version counters instead of key deletion.
+# - Every cached entry embeds its namespace's current version in its key.
+# - Writes call bump_namespace(), so old entries are never read again and
+#   simply expire.
+# - Versions start from the current time in milliseconds, so a counter that
+#   was evicted never restarts at a value old entries were stored under.
+def _namespace_key(namespace):
+    return f"ns:{namespace}:version"
+
+
+def get_namespace_version(namespace):
+    """Return the current version of a cache namespace, creating it if missing."""
+    return get_namespace_versions([namespace])[namespace]
+
+
+def get_namespace_versions(namespaces):
+    """Return {namespace: version} with a single cache round trip when all exist."""
+    keys = {namespace: _namespace_key(namespace) for namespace in namespaces}
+    found = cache.get_many(keys.values())
+    versions = {}
+    for namespace, key in keys.items():
+        version = found.get(key)
+        if version is None:
+            cache.add(key, int(time.time() * 1000), timeout=None)
+            version = cache.get(key)
+        versions[namespace] = version
+    return versions
+
+
+def bump_namespace(*namespaces):
+    """Invalidate everything cached under the given namespaces."""
+    for namespace in namespaces:
+        bump_namespace_version(namespace)
+
+
+def bump_namespace_version(namespace):
+    """Move one namespace to a new version and return that version."""
+    key = _namespace_key(namespace)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Counter missing or evicted: restart it from the clock
+        version = int(time.time() * 1000)
+        cache.set(key, version, timeout=None)
+        return version
+
+
+def versioned_key(namespaces, *parts):
+    """
+    Build a cache key for `parts` that is only valid for the current
+    version of the given namespace (or tuple of namespaces).
+    """
+    if isinstance(namespaces, str):
+        namespaces = (namespaces,)
+    versions = get_namespace_versions(namespaces)
+    prefix = ":".join(f"{namespace}.v{versions[namespace]}" for namespace in namespaces)
+    digest = hashlib.md5(repr(parts).encode("utf-8")).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+def normalized_query_params(request, ignore=()):
+    """
+    Query params as a sorted, hashable structure, so `?a=1&b=2` and
+    `?b=2&a=1` share a cache entry. Empty values are dropped.
+    """
+    return tuple(sorted(
+        (key, tuple(sorted(value for value in values if value != "")))
+        for key, values in request.query_params.lists()
+        if key not in ignore and any(value != "" for value in values)
+    ))
+
+
+# ---------------------------------------------------------
+# CachedListMixin
+# ---------------------------------------------------------
+# Response cache for public, read-heavy list endpoints.
+# - Caches the serialized list (including the page) per absolute URL and
+#   normalized query params; the response does not depend on the user.
+# - Keys embed the versions of `cache_namespaces`, which signals bump on
+#   writes, so stale pages are never served after a change.
+# - Timeout: settings.API_LIST_CACHE_TIMEOUT seconds.
+class CachedListMixin:
+    cache_namespaces = ()
+
+    def list(self, request, *args, **kwargs):
+        cache_key = versioned_key(
+            self.cache_namespaces,
+            "list",
+            request.build_absolute_uri(request.path),
+            normalized_query_params(request),
+        )
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(cache_key, response.data, settings.API_LIST_CACHE_TIMEOUT)
+        return response
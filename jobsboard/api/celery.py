@@ -21,6 +21,32 @@ app.conf.beat_schedule = {
         'schedule': crontab(minute=0, hour='*/1'),
         'args': (),
     },
+    'process-job-schedule': {
+        'task': 'jobs.tasks.process_job_schedule',
+        'schedule': crontab(minute='*/5'),
+    },
+    'send-job-alerts': {
+        'task': 'jobs.tasks.send_job_alerts',
+        'schedule': crontab(minute='*/5'),
+    },
+    'refresh-similar-jobs-index': {
+        'task': 'jobs.tasks.refresh_similar_jobs_index',
+        'schedule': crontab(minute='*/5'),
+    },
+    'build-similar-jobs-index': {
+        'task': 'jobs.tasks.build_similar_jobs_index',
+        'schedule': crontab(minute=30, hour=3),
+    },
+    # Seconds: emails queued within this window share one SMTP connection
+    'send-queued-emails': {
+        'task': 'notifications.tasks.send_queued_emails',
+        'schedule': 10.0,
+    },
+    # Seconds: delay between a commit and its outbox tasks reaching the broker
+    'relay-outbox': {
+        'task': 'outbox.tasks.relay_outbox_task',
+        'schedule': 2.0,
+    },
 }
 
 @app.task(bind=True)
@@ -0,0 +1,74 @@
+# jobsboard/api/conditional.py
+import hashlib
+
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+from .cache import get_namespace_versions
+
+
+# ---------------------------------------------------------
+# ConditionalGetMixin
+# ---------------------------------------------------------
+# ETag support for list/retrieve on ViewSets.
+# - The ETag is a hash of the view's cache namespace versions (bumped by
+#   signals on writes), the full request path and, when `etag_per_user` is set,
+#   the requesting user. Computing it costs one cache lookup and no queries.
+# - A matching If-None-Match returns 304 Not Modified: for list before the
+#   queryset is touched, for retrieve after get_object() (so 404s and object
+#   permissions still apply) but before anything is serialized.
+# - Responses always carry the ETag (and Vary when the ETag is per user).
+class ConditionalGetMixin:
+    etag_namespaces = ()
+    etag_per_user = False
+
+    def get_etag_namespaces(self, request):
+        return self.etag_namespaces
+
+    def get_etag(self, request):
+        namespaces = self.get_etag_namespaces(request)
+        versions = get_namespace_versions(namespaces)
+        parts = [
+            sorted(versions.items()),
+            request.get_full_path(),
+            request.accepted_media_type,
+        ]
+        if self.etag_per_user:
+            parts.append(request.user.pk if request.user.is_authenticated else None)
+        digest = hashlib.md5(repr(parts).encode("utf-8")).hexdigest()
+        return f'W/"{digest}"'
+
+    def _is_not_modified(self, request, etag):
+        if_none_match = request.headers.get("If-None-Match")
+        if not if_none_match:
+            return False
+        candidates = parse_etags(if_none_match)
+        # Weak comparison (RFC 9110 13.1.2): ignore the W/ prefix
+        opaque = etag.removeprefix("W/")
+        return "*" in candidates or any(c.removeprefix("W/") == opaque for c in candidates)
+
+    def _conditional(self, request, handler, *args, **kwargs):
+        etag = self.get_etag(request)
+        if self._is_not_modified(request, etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+        response["ETag"] = etag
+        if self.etag_per_user:
+            patch_vary_headers(response, ("Authorization", "Cookie"))
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._conditional(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+
+        def serialize(request, *args, **kwargs):
+            return Response(self.get_serializer(instance).data)
+
+        return self._conditional(request, serialize, *args, **kwargs)
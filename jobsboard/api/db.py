@@ -0,0 +1,25 @@
+# jobsboard/api/db.py
+from django.db import connections, migrations
+
+
+def is_postgres(using="default"):
+    """Return True when the given database alias is backed by PostgreSQL."""
+    return connections[using].vendor == "postgresql"
+
+
+# ---------------------------------------------------------
+# AddPostgresIndex
+# ---------------------------------------------------------
+# Migration operation for PostgreSQL-only index types (GIN, trigram opclasses).
+# - The index is always recorded in the migration state, so the models and
+#   migrations stay in sync for `makemigrations`.
+# - The index is only created/dropped on PostgreSQL, which keeps the SQLite
+#   test database migratable.
+class AddPostgresIndex(migrations.AddIndex):
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
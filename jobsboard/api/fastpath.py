@@ -0,0 +1,206 @@
+# jobsboard/api/fastpath.py
+from collections import defaultdict
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import models
+from rest_framework import fields as drf_fields
+from rest_framework import relations, serializers
+from rest_framework.fields import empty
+from rest_framework.response import Response
+
+# Marker for a field that DRF would omit from the output (SkipField)
+SKIP = object()
+
+# Field types whose output cannot be built from plain column values
+UNSUPPORTED_FIELDS = (
+    drf_fields.SerializerMethodField,
+    drf_fields.ModelField,
+    relations.HyperlinkedRelatedField,
+    relations.SlugRelatedField,
+    relations.StringRelatedField,
+)
+
+
+# ---------------------------------------------------------
+# FastListSerializer
+# ---------------------------------------------------------
+# Read-only list serialization straight from `.values()` rows.
+# - Compiled once per request from a bound ModelSerializer: every readable
+#   field becomes a (values key, converter) pair, reusing the DRF field's own
+#   to_representation() on the raw column value.
+# - Many-to-many primary keys and nested `many=True` serializers are loaded
+#   with one extra query each for the whole page.
+# - Mirrors DRF's None handling and SkipField rules for dotted sources, so the
+#   rendered output is byte-identical to the ModelSerializer's.
+# - Raises ImproperlyConfigured for fields it cannot reproduce
+#   (method fields, hyperlinks, `source="*"`, ...).
+class FastListSerializer:
+    def __init__(self, serializer):
+        self.model = serializer.Meta.model
+        self.pk_key = self.model._meta.pk.attname
+        self.keys = {self.pk_key}
+        self.plan = [self._compile(field) for field in serializer._readable_fields]
+
+    # -------------------------
+    # Compilation
+    # -------------------------
+    def _compile(self, field):
+        name = field.field_name
+        if isinstance(field, serializers.ListSerializer):
+            return name, True, self._compile_nested(field)
+        if isinstance(field, relations.ManyRelatedField):
+            return name, True, self._compile_many_pks(field)
+        if isinstance(field, serializers.BaseSerializer) or isinstance(field, UNSUPPORTED_FIELDS):
+            raise ImproperlyConfigured(f"FastListSerializer cannot handle field `{name}` ({type(field).__name__})")
+        if field.source == "*":
+            raise ImproperlyConfigured(f"FastListSerializer cannot handle `source='*'` on field `{name}`")
+        return name, False, self._compile_column(field)
+
+    def _compile_column(self, field):
+        attrs = field.source_attrs
+        key = "__".join(attrs)
+        # Foreign keys crossed by a dotted source: a NULL one makes DRF's
+        # get_attribute() raise AttributeError, handled by _missing().
+        null_keys = ["__".join(attrs[:i]) for i in range(1, len(attrs))]
+        self.keys.update([key, *null_keys])
+
+        if isinstance(field, relations.PrimaryKeyRelatedField):
+            if field.pk_field is not None:
+                raise ImproperlyConfigured(f"FastListSerializer cannot handle `pk_field` on `{field.field_name}`")
+            convert = _identity
+        elif isinstance(field, drf_fields.FileField):
+            convert = _file_converter(self.model, attrs, field)
+        else:
+            convert = field.to_representation
+
+        def column(row):
+            for null_key in null_keys:
+                if row[null_key] is None:
+                    value = _missing(field)
+                    break
+            else:
+                value = row[key]
+            if value is SKIP or value is None:
+                return value
+            return convert(value)
+
+        return column
+
+    def _compile_many_pks(self, field):
+        child = field.child_relation
+        if not isinstance(child, relations.PrimaryKeyRelatedField) or child.pk_field is not None:
+            raise ImproperlyConfigured(f"FastListSerializer cannot handle field `{field.field_name}`")
+        model_field = self.model._meta.get_field(field.source)
+        lookup = model_field.related_query_name()
+        related_model = model_field.related_model
+
+        def load(pks):
+            # Same default ordering as `instance.<field>.all()`
+            grouped = defaultdict(list)
+            rows = related_model._default_manager.filter(**{f"{lookup}__in": pks}).values_list(lookup, "pk")
+            for parent_pk, pk in rows:
+                grouped[parent_pk].append(pk)
+            return grouped
+
+        return load
+
+    def _compile_nested(self, field):
+        relation = self.model._meta.get_field(field.source)
+        if not isinstance(relation, models.ManyToOneRel):
+            raise ImproperlyConfigured(f"FastListSerializer cannot handle nested field `{field.field_name}`")
+        child = FastListSerializer(field.child)
+        fk_name = relation.field.name
+        child_model = relation.related_model
+
+        def load(pks):
+            grouped = defaultdict(list)
+            rows = child.values(child_model._default_manager.filter(**{f"{fk_name}__in": pks}), extra=[fk_name])
+            rows = list(rows)
+            for row, item in zip(rows, child.serialize(rows)):
+                grouped[row[fk_name]].append(item)
+            return grouped
+
+        return load
+
+    # -------------------------
+    # Execution
+    # -------------------------
+    def values(self, queryset, extra=()):
+        """The `.values()` queryset carrying every column the plan needs."""
+        return queryset.prefetch_related(None).values(*sorted(self.keys.union(extra)))
+
+    def serialize(self, rows):
+        """List of `.values()` rows -> list of dicts, as ModelSerializer(many=True).data."""
+        rows = list(rows)
+        pks = [row[self.pk_key] for row in rows]
+        loaded = {name: load(pks) for name, many, load in self.plan if many}
+
+        data = []
+        for row in rows:
+            item = {}
+            for name, many, build in self.plan:
+                if many:
+                    item[name] = loaded[name].get(row[self.pk_key], [])
+                else:
+                    value = build(row)
+                    if value is not SKIP:
+                        item[name] = value
+            data.append(item)
+        return data
+
+
+def _identity(value):
+    return value
+
+
+def _missing(field):
+    """DRF's Field.get_attribute() fallbacks when a dotted source hits None."""
+    if field.default is not empty:
+        return field.get_default()
+    if field.allow_null:
+        return None
+    if not field.required:
+        return SKIP
+    raise AttributeError(f"Field `{field.field_name}` source `{field.source}` crosses a NULL relation")
+
+
+def _file_converter(model, attrs, field):
+    """FileField.to_representation() needs a FieldFile; build one from the stored name."""
+    model_field = model._meta.get_field(attrs[0])
+    for attr in attrs[1:]:
+        model_field = model_field.related_model._meta.get_field(attr)
+
+    def convert(name):
+        return field.to_representation(model_field.attr_class(None, model_field, name))
+
+    return convert
+
+
+# ---------------------------------------------------------
+# FastListMixin
+# ---------------------------------------------------------
+# Serves a ViewSet's `list` through FastListSerializer.
+# - Same filtering, pagination (page-number and cursor) and response shape.
+# - Columns used for ordering are always selected, for cursor positions.
+# - Set `fast_list = False` to fall back to the regular serializer.
+class FastListMixin:
+    fast_list = True
+
+    def get_fast_list_extra_columns(self):
+        columns = {field.lstrip("-") for field in getattr(self, "cursor_ordering", ())}
+        ordering_fields = getattr(self, "ordering_fields", None)
+        if isinstance(ordering_fields, (list, tuple)):
+            columns.update(ordering_fields)
+        return columns
+
+    def list(self, request, *args, **kwargs):
+        if not self.fast_list:
+            return super().list(request, *args, **kwargs)
+
+        fast = FastListSerializer(self.get_serializer())
+        queryset = fast.values(self.filter_queryset(self.get_queryset()), self.get_fast_list_extra_columns())
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(fast.serialize(page))
+        return Response(fast.serialize(queryset))
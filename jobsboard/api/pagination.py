@@ -0,0 +1,161 @@
+# jobsboard/api/pagination.py
+import json
+
+from django.conf import settings
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+
+from .db import is_postgres
+
+
+# ---------------------------------------------------------
+# KeysetCursorPagination
+# ---------------------------------------------------------
+# Cursor (keyset) pagination ordered by the view's `cursor_ordering`.
+# - Each page is a `WHERE <ordering field> < <last seen value>` range scan,
+#   so deep pages cost the same as the first one and no COUNT(*) is issued.
+# - An explicit `?ordering=` (OrderingFilter) still takes precedence.
+class KeysetCursorPagination(CursorPagination):
+    ordering = "-id"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.ordering = getattr(view, "cursor_ordering", self.ordering)
+        return super().paginate_queryset(queryset, request, view)
+
+
+# ---------------------------------------------------------
+# OptionalCursorPagination
+# ---------------------------------------------------------
+# Page-number pagination with a per-request cursor mode.
+# - Default: `?page=N`, unchanged response shape (count/next/previous/results).
+# - `?pagination=cursor` (or any request carrying a `cursor`) switches to
+#   KeysetCursorPagination; the response then has next/previous/results only.
+class OptionalCursorPagination(PageNumberPagination):
+    mode_query_param = "pagination"
+    cursor_mode = "cursor"
+    cursor_pagination_class = KeysetCursorPagination
+
+    def __init__(self):
+        self.cursor_paginator = None
+
+    def use_cursor(self, request):
+        return (
+            request.query_params.get(self.mode_query_param) == self.cursor_mode
+            or self.cursor_pagination_class.cursor_query_param in request.query_params
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.use_cursor(request):
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+
+# ---------------------------------------------------------
+# EstimatedCountPaginator
+# ---------------------------------------------------------
+# Django Paginator whose `count` may come from the PostgreSQL planner.
+# - Tables below API_ESTIMATED_COUNT_THRESHOLD rows (per pg_class.reltuples)
+#   get an exact COUNT(*) in the same query as the size check.
+# - On bigger tables an unfiltered queryset uses reltuples; a filtered one
+#   uses the EXPLAIN row estimate, falling back to an exact COUNT(*) when
+#   the filter is selective (estimate below the threshold).
+# - `count_is_exact` tells which one was returned. With an estimate, pages
+#   past the estimated last page are still served, and `has_next` follows
+#   whether the page came back full.
+class EstimatedCountPaginator(Paginator):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._count_is_exact = True
+
+    @property
+    def count_is_exact(self):
+        return self.count is not None and self._count_is_exact
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet) or not is_postgres(queryset.db) or queryset.query.distinct:
+            return super().count
+
+        threshold = settings.API_ESTIMATED_COUNT_THRESHOLD
+        connection = connections[queryset.db]
+        subquery, params = queryset.order_by().values("pk").query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT CASE WHEN reltuples < %s THEN (SELECT COUNT(*) FROM (" + subquery + ") subquery) END, "
+                "reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                (threshold, *params, connection.ops.quote_name(queryset.model._meta.db_table)),
+            )
+            exact, table_rows = cursor.fetchone()
+        if exact is not None:
+            return exact
+
+        estimate = table_rows if not queryset.query.where else self.explain_rows(queryset)
+        if estimate < threshold:
+            return super().count
+        self._count_is_exact = False
+        return estimate
+
+    @staticmethod
+    def explain_rows(queryset):
+        """The planner's row estimate for the queryset."""
+        plan = json.loads(queryset.order_by().explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def validate_number(self, number):
+        if self.count_is_exact:
+            return super().validate_number(number)
+        # An estimate may be short: serve pages past it, only reject pages below 1
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_("That page number is not an integer"))
+        if number < 1:
+            raise EmptyPage(_("That page number is less than 1"))
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if self.count_is_exact:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        page = self._get_page(self.object_list[bottom:bottom + self.per_page], number, self)
+        page.has_next = lambda: len(page) == self.per_page
+        return page
+
+
+# ---------------------------------------------------------
+# EstimatedCountPagination
+# ---------------------------------------------------------
+# OptionalCursorPagination for big tables, using EstimatedCountPaginator.
+# - Page-number responses gain `count_is_estimate`; cursor mode is unchanged.
+class EstimatedCountPagination(OptionalCursorPagination):
+    django_paginator_class = EstimatedCountPaginator
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return Response({
+            "count": self.page.paginator.count,
+            "count_is_estimate": not self.page.paginator.count_is_exact,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        schema["properties"]["count_is_estimate"] = {"type": "boolean", "example": False}
+        return schema
@@ -45,6 +45,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',  # full-text search and trigram lookups
 
     # 3rd party apps
     'rest_framework',
@@ -61,6 +62,7 @@ INSTALLED_APPS = [
     'notifications',
     'rate_limit',
     'request_logs',
+    'outbox',
     
    
 ]
@@ -169,6 +171,53 @@ else:
     }
 
 
+# -------------------------
+# Cache
+# -------------------------
+# Local memory by default; set CACHE_URL (e.g. redis://localhost:6379/1)
+# to share the cache between processes in production.
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+
+# Seconds to keep cached public list pages (/api/jobs/, /api/skills/, /api/industries/)
+API_LIST_CACHE_TIMEOUT = env.int("API_LIST_CACHE_TIMEOUT", default=60)
+
+# Rows fetched per server-side cursor round trip by the CSV/NDJSON export endpoints
+API_EXPORT_CHUNK_SIZE = env.int("API_EXPORT_CHUNK_SIZE", default=2000)
+
+# Row count above which EstimatedCountPagination reports planner estimates
+# instead of running COUNT(*) (PostgreSQL only)
+API_ESTIMATED_COUNT_THRESHOLD = env.int("API_ESTIMATED_COUNT_THRESHOLD", default=100000)
+
+# Seconds to keep /api/jobs/facets/ counts (also invalidated on job writes)
+JOBS_FACETS_CACHE_TIMEOUT = env.int("JOBS_FACETS_CACHE_TIMEOUT", default=300)
+
+# Minimum pg_trgm word similarity for fuzzy job filters (?fuzzy=true)
+JOBS_TRIGRAM_SIMILARITY_THRESHOLD = env.float("JOBS_TRIGRAM_SIMILARITY_THRESHOLD", default=0.5)
+
+# Rows validated and inserted together by the bulk job import (jobs/importers.py)
+JOBS_IMPORT_CHUNK_SIZE = env.int("JOBS_IMPORT_CHUNK_SIZE", default=500)
+
+# Row errors returned in full by POST /api/jobs/import/ (the rest are only counted)
+JOBS_IMPORT_MAX_REPORTED_ERRORS = env.int("JOBS_IMPORT_MAX_REPORTED_ERRORS", default=100)
+
+# Score weights for /api/jobs/recommended/ (jobs/matching.py)
+JOBS_MATCH_WEIGHTS = {"skills": 0.7, "experience": 0.2, "salary": 0.1}
+
+# Seconds before a process rebuilds its in-memory job match index from scratch
+JOBS_MATCH_INDEX_MAX_AGE = env.int("JOBS_MATCH_INDEX_MAX_AGE", default=900)
+
+# Seconds job change log entries are kept for the match and similar-jobs indexes (jobs/changes.py)
+JOBS_CHANGE_LOG_TIMEOUT = env.int("JOBS_CHANGE_LOG_TIMEOUT", default=3600)
+
+# On-disk TF-IDF index for /api/jobs/{id}/similar/ (jobs/similarity.py)
+JOBS_SIMILARITY_INDEX_DIR = env.str("JOBS_SIMILARITY_INDEX_DIR", default=str(BASE_DIR / "var" / "similar_jobs"))
+# Vocabulary size cap, and changed jobs kept in the delta segment before a full rebuild
+JOBS_SIMILARITY_MAX_TERMS = env.int("JOBS_SIMILARITY_MAX_TERMS", default=50000)
+JOBS_SIMILARITY_MAX_DELTA = env.int("JOBS_SIMILARITY_MAX_DELTA", default=5000)
+
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -210,6 +259,13 @@ EMAIL_HOST_USER = env("EMAIL_HOST_USER").strip()
 EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD").strip()
 DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL").strip()
 
+# Queued emails (notifications.emails) sent per batch over one connection
+EMAIL_DISPATCH_BATCH_SIZE = env.int("EMAIL_DISPATCH_BATCH_SIZE", default=100)
+# Tries before a queued email is dead-lettered
+EMAIL_DISPATCH_MAX_ATTEMPTS = env.int("EMAIL_DISPATCH_MAX_ATTEMPTS", default=5)
+# Seconds before the first retry of a failed email; doubles with each try
+EMAIL_DISPATCH_RETRY_DELAY = env.int("EMAIL_DISPATCH_RETRY_DELAY", default=60)
+
 # -----------------------
 # Celery
 # -----------------------
@@ -221,6 +277,18 @@ CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "Africa/Nairobi"
 
 
+# Rows per UPDATE when the job scheduler closes/publishes jobs
+JOBS_SCHEDULE_BATCH_SIZE = env.int("JOBS_SCHEDULE_BATCH_SIZE", default=500)
+
+# New jobs matched against saved searches per batch by the job alerts task
+JOBS_ALERT_BATCH_SIZE = env.int("JOBS_ALERT_BATCH_SIZE", default=500)
+
+# Most application ids one bulk status change may list
+APPLICATIONS_BULK_STATUS_MAX_IDS = env.int("APPLICATIONS_BULK_STATUS_MAX_IDS", default=1000)
+
+# Outbox rows published to the broker per batch by the relay
+OUTBOX_RELAY_BATCH_SIZE = env.int("OUTBOX_RELAY_BATCH_SIZE", default=500)
+
 # Optional: retry configuration
 CELERY_TASK_ACKS_LATE = True
 CELERY_WORKER_PREFETCH_MULTIPLIER = 1
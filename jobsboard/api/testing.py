@@ -0,0 +1,63 @@
+# jobsboard/api/testing.py
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+# ---------------------------------------------------------
+# QueryBudgetMixin
+# ---------------------------------------------------------
+# Test mixin that guards list endpoints against N+1 regressions.
+# - Requests the endpoint, adds more rows, then requests it again.
+# - Both requests must stay within the same fixed number of queries,
+#   so a per-row lookup fails the test instead of slipping into CI.
+# - Budgets count every query of the request, including the request-log
+#   INSERT that RequestLoggingMiddleware makes for authenticated users.
+# - Use with a TestCase that has an APIClient at `self.client`.
+class QueryBudgetMixin:
+    def count_queries(self, url, params=None):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200, response.content[:500])
+        return response, context
+
+    def assertQueryBudget(self, url, budget, add_rows, params=None, rows=5):
+        """
+        Assert `url` runs at most `budget` queries, before and after
+        `add_rows(rows)` creates more rows visible on the same page.
+        """
+        before, first = self.count_queries(url, params)
+        add_rows(rows)
+        after, second = self.count_queries(url, params)
+
+        self.assertGreater(
+            len(after.data["results"]), len(before.data["results"]),
+            "add_rows() did not add rows to the page",
+        )
+        for context in (first, second):
+            queries = "\n".join(query["sql"] for query in context.captured_queries)
+            self.assertLessEqual(
+                len(context), budget,
+                f"{url} ran {len(context)} queries (budget {budget}):\n{queries}",
+            )
+        self.assertEqual(
+            len(first), len(second),
+            f"{url} query count grew with the number of rows ({len(first)} -> {len(second)})",
+        )
+
+
+# ---------------------------------------------------------
+# FastListAssertionsMixin
+# ---------------------------------------------------------
+# Test mixin checking that FastListSerializer reproduces a ModelSerializer.
+# - Renders both outputs to JSON and compares the bytes.
+class FastListAssertionsMixin:
+    def assertFastListIdentical(self, serializer_class, queryset, context=None, **kwargs):
+        from rest_framework.renderers import JSONRenderer
+        from api.fastpath import FastListSerializer
+
+        expected = serializer_class(list(queryset), many=True, context=context or {}, **kwargs).data
+        fast = FastListSerializer(serializer_class(context=context or {}, **kwargs))
+        actual = fast.serialize(fast.values(queryset))
+
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(JSONRenderer().render(actual), JSONRenderer().render(expected))
@@ -0,0 +1,58 @@
+# jobsboard/api/tracking.py
+
+
+# ---------------------------------------------------------
+# TrackedFieldsMixin
+# ---------------------------------------------------------
+# Model mixin that remembers the stored values of `tracked_fields`, so signal
+# handlers can detect changes (status transitions) without re-reading the row.
+# - Values are captured in from_db() when the row is loaded, and again after
+#   save() / refresh_from_db(), so they always describe the database row.
+# - post_save receivers still see the values from before the save.
+# - Names are attnames ("company_id" for a ForeignKey).
+# - New instances have no stored values (None), also in post_save.
+# - A tracked field that was deferred at load falls back to one query the
+#   first time it is asked for.
+class TrackedFieldsMixin:
+    tracked_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            name: value for name, value in zip(field_names, values) if name in cls.tracked_fields
+        }
+        return instance
+
+    def _capture_tracked_fields(self, names):
+        loaded = self.__dict__.setdefault("_loaded_values", {})
+        for name in names:
+            attname = self._meta.get_field(name).attname
+            if attname in self.tracked_fields and attname in self.__dict__:
+                loaded[attname] = self.__dict__[attname]
+
+    def loaded_value(self, name):
+        """Value of `name` in the database row this instance came from (None for a new instance)."""
+        loaded = self.__dict__.setdefault("_loaded_values", {})
+        if name not in loaded:
+            if self._state.adding:
+                return None
+            row = type(self)._base_manager.using(self._state.db).filter(pk=self.pk).values(*self.tracked_fields).first()
+            loaded.update(row or dict.fromkeys(self.tracked_fields))
+        return loaded[name]
+
+    def has_changed(self, name):
+        """Whether `name` differs from its stored value; always True for a new instance."""
+        return self._state.adding or getattr(self, name) != self.loaded_value(name)
+
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            # No stored row yet: post_save receivers see None as the old values
+            self._loaded_values = dict.fromkeys(self.tracked_fields)
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get("update_fields")
+        self._capture_tracked_fields(self.tracked_fields if update_fields is None else update_fields)
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._capture_tracked_fields(self.tracked_fields if fields is None else fields)
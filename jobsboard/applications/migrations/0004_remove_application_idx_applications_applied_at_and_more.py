@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-18 05:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0003_remove_applicationfile_file_path_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='application',
+            name='idx_applications_applied_at',
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['applied_at', 'id'], name='idx_applications_applied_at_id'),
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
 from django.core.exceptions import ValidationError
 
+from api.tracking import TrackedFieldsMixin
+
 
 def validate_file_size(file):
     """Validate that file size is not greater than 5MB."""
@@ -18,7 +20,9 @@ def validate_file_size(file):
 # - Includes reviewer details for recruiters/admins.
 # - Enforces uniqueness: an applicant can apply to a job only once.
 # - Indexed for efficient filtering/searching on key fields.
-class Application(models.Model):
+# - Remembers its stored status (TrackedFieldsMixin), so status transition
+#   signals need no extra query.
+class Application(TrackedFieldsMixin, models.Model):
     APPLICATION_STATUS_CHOICES = [
         ('pending', 'Pending'),
         ('reviewed', 'Reviewed'),
@@ -27,6 +31,8 @@ class Application(models.Model):
         ('accepted', 'Accepted'),
     ]
 
+    tracked_fields = ("status",)
+
     job = models.ForeignKey('jobs.Job', on_delete=models.CASCADE)
     applicant = models.ForeignKey('users.User', on_delete=models.CASCADE)
     cover_letter = models.TextField(blank=True, null=True)
@@ -49,7 +55,7 @@ class Application(models.Model):
             models.Index(fields=['applicant'], name='idx_applications_applicant'),
             models.Index(fields=['status'], name='idx_applications_status'),
             models.Index(fields=['reviewed_by'], name='idx_applications_reviewed_by'),
-            models.Index(fields=['applied_at'], name='idx_applications_applied_at'),
+            models.Index(fields=['applied_at', 'id'], name='idx_applications_applied_at_id'),
         ]
 
     def __str__(self):
@@ -1,3 +1,4 @@
+from django.conf import settings
 from rest_framework import serializers
 from .models import Application, ApplicationFile
 
@@ -85,3 +86,19 @@ class ApplicationSerializer(serializers.ModelSerializer):
             if Application.objects.filter(job=job, applicant=applicant).exists():
                 raise serializers.ValidationError("This applicant has already applied for this job.")
         return attrs
+
+
+# ---------------------------------------------------------
+# ApplicationBulkStatusSerializer
+# ---------------------------------------------------------
+# Request body of ApplicationViewSet.bulk_status.
+# - `ids` picks the applications; without it the list filters in the
+#   query string (?job=, ?status=, ?applicant=) do.
+class ApplicationBulkStatusSerializer(serializers.Serializer):
+    status = serializers.ChoiceField(choices=Application.APPLICATION_STATUS_CHOICES)
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False,
+        max_length=settings.APPLICATIONS_BULK_STATUS_MAX_IDS,
+    )
@@ -1,42 +1,55 @@
 # applications/signals.py
-from django.db.models.signals import pre_save, post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
+from companies.stats import adjust_company_stats
+from jobs.models import Job
+from outbox.relay import enqueue_task
 from .models import Application
 from .tasks import send_reviewed_email_task
 
 
-@receiver(pre_save, sender=Application)
-def track_old_status(sender, instance, **kwargs):
-    """
-    Before saving, track the old status of the Application.
-    This allows us to detect status changes in post_save.
-    """
-    if instance.pk:
-        try:
-            old_instance = Application.objects.get(pk=instance.pk)
-            instance._old_status = old_instance.status
-        except Application.DoesNotExist:
-            instance._old_status = None
-    else:
-        instance._old_status = None
-
-
 @receiver(post_save, sender=Application)
 def trigger_reviewed_email(sender, instance, created, **kwargs):
     """
     After saving, trigger an email if the application status changes to 'reviewed'.
-    Uses Celery to send email asynchronously.
+    The previous status comes from the loaded row (TrackedFieldsMixin), not a query.
+    The email task goes through the outbox, so it is only sent if the save
+    commits and the request never waits on the broker.
     """
     # Skip on creation
     if created:
         return
 
-    old_status = getattr(instance, "_old_status", None)
-    if instance.status == "reviewed" and old_status != "reviewed":
+    if instance.status == "reviewed" and instance.loaded_value("status") != "reviewed":
         # Ensure applicant has an email before queuing the task
         if instance.applicant and instance.applicant.email:
-            send_reviewed_email_task.delay(
+            enqueue_task(
+                send_reviewed_email_task,
                 username=instance.applicant.username,
                 job_title=instance.job.title,
                 email=instance.applicant.email,
             )
+
+
+def _company_id(application):
+    """Company of the application's job, without loading the job when it is not cached."""
+    if Application.job.is_cached(application):
+        return application.job.company_id
+    return Job.objects.filter(pk=application.job_id).values_list("company_id", flat=True).first()
+
+
+@receiver(post_save, sender=Application)
+def update_company_stats_on_save(sender, instance, created, raw=False, **kwargs):
+    """New applications and transitions to/from "accepted" move the company counters."""
+    if raw:
+        return
+    was_accepted = instance.loaded_value("status") == "accepted"
+    hires = (instance.status == "accepted") - was_accepted
+    if created or hires:
+        adjust_company_stats(_company_id(instance), applications=int(created), hires=hires)
+
+
+@receiver(post_delete, sender=Application)
+def update_company_stats_on_delete(sender, instance, **kwargs):
+    """Deleted applications (also via a job or company delete) leave the counters."""
+    adjust_company_stats(_company_id(instance), applications=-1, hires=-(instance.status == "accepted"))
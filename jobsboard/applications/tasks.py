@@ -1,7 +1,10 @@
 # jobsboard/applications/tasks.py
 from celery import shared_task
-from django.core.mail import send_mail
-from django.conf import settings
+
+from notifications.emails import queue_email, queue_emails
+from notifications.models import Notification
+from notifications.signals import bump_notification_versions
+from .models import Application
 
 
 @shared_task
@@ -17,10 +20,45 @@ def send_reviewed_email_task(username, job_title, email):
         "Thank you for applying!"
     )
 
-    send_mail(
-        subject,
-        message,
-        settings.DEFAULT_FROM_EMAIL,
-        [email],
-        fail_silently=False,
+    # Sent with the other queued emails by notifications.tasks.send_queued_emails
+    queue_email(subject, message, [email])
+
+
+@shared_task
+def notify_status_change_task(application_ids, status):
+    """
+    Tell the applicants of a bulk status change (ApplicationViewSet.bulk_status):
+    one in-app notification each, created with bulk_create, and one queued
+    email each, inserted in one query. One task per bulk change, not per row.
+    """
+    label = dict(Application.APPLICATION_STATUS_CHOICES).get(status, status)
+    rows = list(
+        Application.objects.filter(pk__in=application_ids)
+        .values_list("applicant_id", "applicant__username", "applicant__email", "job_id", "job__title")
     )
+    Notification.objects.bulk_create([
+        Notification(
+            user_id=applicant_id,
+            title=f"Application update: {job_title}",
+            message=f"Your application for '{job_title}' is now {label.lower()}.",
+            link=f"/api/jobs/{job_id}/",
+            type="info",
+        )
+        for applicant_id, _, _, job_id, job_title in rows
+    ])
+    bump_notification_versions(applicant_id for applicant_id, _, _, _, _ in rows)
+
+    queue_emails([
+        (
+            f"Your application for {job_title} is now {label.lower()}",
+            (
+                f"Hello {username},\n\n"
+                f"The status of your application for '{job_title}' is now: {label}.\n\n"
+                "Thank you for applying!"
+            ),
+            [email],
+        )
+        for _, username, email, _, job_title in rows
+        if email
+    ])
+    return len(rows)
@@ -1,11 +1,26 @@
 # jobsboard/applications/tests.py
-from django.test import TestCase
+import json
+
+from django.core import mail
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
 
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory
+
+from api.testing import FastListAssertionsMixin, QueryBudgetMixin
+from applications.serializers import ApplicationSerializer
+
 from applications.models import Application, ApplicationFile
+from applications.tasks import notify_status_change_task, send_reviewed_email_task
+from notifications.emails import dispatch_queued_emails
+from notifications.models import Notification
+from outbox.models import OutboxMessage
 from jobs.models import Job
 from companies.models import Company, Industry
 
@@ -26,7 +41,7 @@ class ApplicationTestCase(TestCase):
             username="recruiter",
             email="recruiter@example.com",
             password="testpass123",
-            role="RECRUITER"
+            role="EMPLOYER"
         )
 
         # Create Industry
@@ -73,6 +88,42 @@ class ApplicationTestCase(TestCase):
                 status="pending"
             )
 
+    def test_status_change_detected_without_reading_the_row(self):
+        email_tasks = OutboxMessage.objects.filter(task=send_reviewed_email_task.name)
+        application = Application.objects.select_related("job", "applicant").get(pk=self.application.pk)
+        application.status = "reviewed"
+        with CaptureQueriesContext(connection) as context:
+            application.save()
+        self.assertEqual(email_tasks.count(), 1)
+        selects = [q["sql"] for q in context.captured_queries if q["sql"].startswith("SELECT")]
+        self.assertEqual(selects, [])
+
+        # Saving again is no transition; nor is a status that was already stored
+        application.save()
+        fresh = Application.objects.get(pk=self.application.pk)
+        fresh.cover_letter = "Updated"
+        fresh.save()
+        self.assertEqual(email_tasks.count(), 1)
+
+    def test_tracked_values_follow_the_stored_row(self):
+        application = Application.objects.get(pk=self.application.pk)
+        self.assertFalse(application.has_changed("status"))
+        application.status = "interview"
+        self.assertTrue(application.has_changed("status"))
+        self.assertEqual(application.loaded_value("status"), "pending")
+        application.save(update_fields=["status"])
+        self.assertFalse(application.has_changed("status"))
+
+        Application.objects.filter(pk=application.pk).update(status="rejected")
+        application.refresh_from_db()
+        self.assertEqual(application.loaded_value("status"), "rejected")
+
+        # A deferred tracked field is read once, on demand
+        deferred = Application.objects.only("id").get(pk=application.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(deferred.loaded_value("status"), "rejected")
+            self.assertEqual(deferred.loaded_value("status"), "rejected")
+
 
 class ApplicationFileTests(TestCase):
     """Tests for ApplicationFile API."""
@@ -93,7 +144,7 @@ class ApplicationFileTests(TestCase):
             username="recruiter",
             email="recruiter@test.com",
             password="pass123",
-            role="RECRUITER"
+            role="EMPLOYER"
         )
 
         # ✅ Industry required for Company
@@ -143,4 +194,311 @@ class ApplicationFileTests(TestCase):
             self.file_url,
             {"application": self.application.id, "file_type": "resume"}
         )
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ApplicationQueryBudgetTests(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seeker = User.objects.create_user(
+            username="seeker",
+            email="seeker@example.com",
+            password="testpass123",
+            role="SEEKER"
+        )
+        self.recruiter = User.objects.create_user(
+            username="recruiter",
+            email="recruiter@example.com",
+            password="testpass123",
+            role="EMPLOYER"
+        )
+        self.company = Company.objects.create(
+            name="Tech Corp",
+            description="A software company",
+            industry=Industry.objects.create(name="Software"),
+            owner=self.recruiter
+        )
+        self.client.force_authenticate(user=self.seeker)
+        self.add_applications(1)
+
+    def add_applications(self, count):
+        for i in range(count):
+            job = Job.objects.create(
+                title=f"Backend Developer {i}",
+                description="Build APIs",
+                company=self.company,
+                employment_type="full_time",
+                location="Remote"
+            )
+            application = Application.objects.create(
+                job=job,
+                applicant=self.seeker,
+                status="reviewed",
+                reviewed_by=self.recruiter
+            )
+            ApplicationFile.objects.create(application=application, file_type="resume")
+
+    def test_application_list_query_budget(self):
+        """Usernames, job titles and files load in a constant number of queries"""
+        # count + page + files prefetch + request log
+        self.assertQueryBudget(reverse("application-list"), 4, self.add_applications)
+
+    def test_application_list_query_budget_per_role(self):
+        """Recruiter and admin scopes cost the same queries as the seeker's"""
+        admin = User.objects.create_user(
+            username="staffadmin", email="staffadmin@example.com", password="testpass123", role="ADMIN"
+        )
+        for user in (self.recruiter, admin):
+            with self.subTest(role=user.role):
+                self.client.force_authenticate(user=user)
+                self.assertQueryBudget(reverse("application-list"), 4, self.add_applications, rows=2)
+
+    def test_application_file_list_query_budget_per_role(self):
+        """File pages are one query whatever the role: count + page + request log"""
+        admin = User.objects.create_user(
+            username="staffadmin", email="staffadmin@example.com", password="testpass123", role="ADMIN"
+        )
+        for user in (self.seeker, self.recruiter, admin):
+            with self.subTest(role=user.role):
+                self.client.force_authenticate(user=user)
+                self.assertQueryBudget(reverse("applicationfile-list"), 3, self.add_applications, rows=2)
+
+    def test_recruiters_only_see_applications_to_their_jobs(self):
+        other = User.objects.create_user(
+            username="otherrecruiter", email="otherrecruiter@example.com", password="testpass123", role="EMPLOYER"
+        )
+        self.client.force_authenticate(user=self.recruiter)
+        self.assertEqual(self.client.get(reverse("application-list")).data["count"], 1)
+        self.client.force_authenticate(user=other)
+        self.assertEqual(self.client.get(reverse("application-list")).data["count"], 0)
+        self.assertEqual(self.client.get(reverse("applicationfile-list")).data["count"], 0)
+
+
+    def test_list_applications_cursor_pagination(self):
+        """?pagination=cursor walks every application newest first, without a count"""
+        self.add_applications(11)
+        response = self.client.get(reverse("application-list"), {"pagination": "cursor"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+
+        seen = [application["id"] for application in response.data["results"]]
+        response = self.client.get(response.data["next"])
+        seen += [application["id"] for application in response.data["results"]]
+
+        self.assertIsNone(response.data["next"])
+        expected = Application.objects.order_by("-applied_at", "-id").values_list("id", flat=True)
+        self.assertEqual(seen, list(expected))
+
+
+class ApplicationFastListTests(FastListAssertionsMixin, TestCase):
+    def setUp(self):
+        self.seeker = User.objects.create_user(
+            username="seeker",
+            email="seeker@example.com",
+            password="testpass123",
+            role="SEEKER"
+        )
+        self.recruiter = User.objects.create_user(
+            username="recruiter",
+            email="recruiter@example.com",
+            password="testpass123",
+            role="EMPLOYER"
+        )
+        company = Company.objects.create(
+            name="Tech Corp",
+            description="A software company",
+            industry=Industry.objects.create(name="Software"),
+            owner=self.recruiter
+        )
+        reviewed = Application.objects.create(
+            job=Job.objects.create(title="Backend Developer", company=company, location="Remote"),
+            applicant=self.seeker,
+            cover_letter="I am excited to apply",
+            status="reviewed",
+            ip_address="10.0.0.1",
+            reviewed_by=self.recruiter
+        )
+        ApplicationFile.objects.create(
+            application=reviewed,
+            file_type="resume",
+            file=SimpleUploadedFile("resume.pdf", b"%PDF-1.4 fake")
+        )
+        ApplicationFile.objects.create(application=reviewed, file_type="cover_letter")
+        # Not reviewed yet: reviewed_by_username is omitted by the serializer
+        Application.objects.create(
+            job=Job.objects.create(title="Frontend Developer", company=company, location="Remote"),
+            applicant=self.seeker,
+            status="pending"
+        )
+
+    def test_fast_list_matches_application_serializer(self):
+        """Nested files, file URLs and skipped fields are byte-identical"""
+        context = {"request": RequestFactory().get("/api/applications/")}
+        self.assertFastListIdentical(ApplicationSerializer, Application.objects.all(), context=context)
+
+
+class ApplicationExportTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seeker = User.objects.create_user(
+            username="seeker",
+            email="seeker@example.com",
+            password="testpass123",
+            role="SEEKER"
+        )
+        other_seeker = User.objects.create_user(
+            username="otherseeker",
+            email="otherseeker@example.com",
+            password="testpass123",
+            role="SEEKER"
+        )
+        owner = User.objects.create_user(
+            username="owner",
+            email="owner@example.com",
+            password="testpass123",
+            role="EMPLOYER"
+        )
+        company = Company.objects.create(
+            name="Tech Corp",
+            description="A software company",
+            industry=Industry.objects.create(name="Software"),
+            owner=owner
+        )
+        for i in range(5):
+            job = Job.objects.create(title=f"Developer {i}", company=company, location="Remote")
+            application = Application.objects.create(job=job, applicant=self.seeker, status="pending")
+            ApplicationFile.objects.create(application=application, file_type="resume")
+        Application.objects.create(
+            job=Job.objects.create(title="Other", company=company, location="Remote"),
+            applicant=other_seeker,
+            status="pending"
+        )
+        self.client.force_authenticate(user=self.seeker)
+
+    def export(self, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("application-export"), params)
+            content = b"".join(response.streaming_content).decode()
+        return response, content, len(queries)
+
+    @override_settings(API_EXPORT_CHUNK_SIZE=2)
+    def test_ndjson_export_streams_own_applications_in_chunks(self):
+        """Seekers export only their applications; files load once per chunk"""
+        response, content, queries = self.export(export_format="ndjson")
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual({row["applicant_username"] for row in rows}, {"seeker"})
+        self.assertTrue(all(len(row["files"]) == 1 for row in rows))
+        # one streamed SELECT, files for each of the 3 chunks, the request log
+        self.assertEqual(queries, 5)
+
+    def test_csv_export_respects_filters(self):
+        Application.objects.filter(job__title="Developer 0").update(status="accepted")
+        response, content, _ = self.export(status="accepted")
+
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="applications.csv"')
+        header, *lines = content.splitlines()
+        self.assertTrue(header.startswith("id,job,job_title,"))
+        self.assertEqual(len(lines), 1)
+        self.assertIn("Developer 0", lines[0])
+
+
+class ApplicationBulkStatusTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("application-bulk-status")
+        self.recruiter = User.objects.create_user(
+            username="recruiter",
+            email="recruiter@example.com",
+            password="testpass123",
+            role="EMPLOYER"
+        )
+        other_recruiter = User.objects.create_user(
+            username="otherrecruiter",
+            email="otherrecruiter@example.com",
+            password="testpass123",
+            role="EMPLOYER"
+        )
+        industry = Industry.objects.create(name="Software")
+        self.company = Company.objects.create(
+            name="Tech Corp", description="A software company", industry=industry, owner=self.recruiter
+        )
+        other_company = Company.objects.create(
+            name="Other Corp", description="Another software company", industry=industry, owner=other_recruiter
+        )
+        self.job = self.create_job(self.company)
+        self.applications = [self.apply(self.job, f"seeker{i}") for i in range(5)]
+        self.foreign = self.apply(self.create_job(other_company), "outsider")
+        self.client.force_authenticate(user=self.recruiter)
+
+    def create_job(self, company):
+        return Job.objects.create(
+            title="Backend Developer", description="Build APIs", company=company,
+            employment_type="full_time", location="Remote"
+        )
+
+    def apply(self, job, username):
+        seeker = User.objects.create_user(
+            username=username, email=f"{username}@example.com", password="testpass123", role="SEEKER"
+        )
+        return Application.objects.create(job=job, applicant=seeker, status="pending")
+
+    def test_recruiter_moves_selected_applications_in_one_update(self):
+        ids = [application.id for application in self.applications[:3]] + [self.foreign.id]
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.url, {"status": "reviewed", "ids": ids}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.data["updated"], 3)
+
+        updates = [q["sql"] for q in context.captured_queries if q["sql"].startswith('UPDATE "applications_application"')]
+        self.assertEqual(len(updates), 1)
+        reviewed = Application.objects.filter(status="reviewed")
+        self.assertEqual(set(reviewed.values_list("id", flat=True)), set(ids[:3]))
+        self.assertTrue(all(a.reviewed_by_id == self.recruiter.id and a.reviewed_at for a in reviewed))
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.foreign.status, "pending")
+
+        # One task for the whole batch, queued in the outbox
+        message = OutboxMessage.objects.get(task=notify_status_change_task.name)
+        self.assertEqual(sorted(message.args[0]), sorted(ids[:3]))
+        self.assertEqual(message.args[1], "reviewed")
+
+    def test_filters_select_applications_and_hires_are_counted(self):
+        self.applications[0].status = "rejected"
+        self.applications[0].save()
+        response = self.client.post(
+            f"{self.url}?job={self.job.id}&status=pending", {"status": "accepted"}, format="json"
+        )
+        self.assertEqual(response.data["updated"], 4)
+        self.company.stats.refresh_from_db()
+        self.assertEqual(self.company.stats.hires, 4)
+
+        response = self.client.post(self.url, {"status": "accepted"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_filtered_selection_is_capped(self):
+        with override_settings(APPLICATIONS_BULK_STATUS_MAX_IDS=3):
+            response = self.client.post(f"{self.url}?job={self.job.id}", {"status": "reviewed"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Application.objects.filter(status="reviewed").exists())
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_seekers_cannot_change_status_in_bulk(self):
+        self.client.force_authenticate(user=self.applications[0].applicant)
+        response = self.client.post(self.url, {"status": "accepted", "ids": [self.applications[0].id]}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_notify_task_sends_one_batch(self):
+        ids = [application.id for application in self.applications]
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(notify_status_change_task(ids, "interview"), 5)
+        inserts = [q["sql"] for q in context.captured_queries if q["sql"].startswith('INSERT INTO "notifications_notification"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(Notification.objects.filter(title="Application update: Backend Developer").count(), 5)
+        # Emails are queued (one INSERT) and sent by the dispatcher
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(dispatch_queued_emails(batch_size=100)["sent"], 5)
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertIn("is now interview", mail.outbox[0].subject)
@@ -1,29 +1,53 @@
 import logging
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework import viewsets, permissions, status
+from rest_framework.decorators import action
 from django_filters import rest_framework as django_filters
 from rest_framework import filters
 from rest_framework.response import Response
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import PermissionDenied, ValidationError
 
+from users.models import User
 from .models import Application, ApplicationFile
-from .serializers import ApplicationSerializer, ApplicationFileSerializer
+from .serializers import ApplicationSerializer, ApplicationFileSerializer, ApplicationBulkStatusSerializer
+from .tasks import notify_status_change_task
+from companies.stats import adjust_company_stats
+from outbox.relay import enqueue_task
+from api.export import StreamingExportMixin
+from api.fastpath import FastListMixin
+from api.pagination import OptionalCursorPagination
 
 logger = logging.getLogger(__name__)
 
 
+def is_admin(user):
+    """Admins see every application: the ADMIN role or Django staff, whatever their role."""
+    return user.is_staff or getattr(user, "role", None) == User.ROLE_ADMIN
+
+
 # ---------------------------------------------------------
 # ApplicationViewSet
 # ---------------------------------------------------------
 # Handles job application logic:
 # - Seekers can create applications (with IP tracking).
 # - Prevents duplicate applications to the same job.
-# - Recruiters can view/update applications for their jobs.
+# - Recruiters (employers) can view/update applications for their jobs.
 # - Seekers can only see their own applications.
-# - Admins can view and manage all applications.
+# - Admins can view and manage all applications; other users see none.
 # Includes filtering, searching, ordering, and role-based restrictions.
-class ApplicationViewSet(viewsets.ModelViewSet):
+# Every role-scoped queryset joins the job and usernames and prefetches
+# files, so pages cost a fixed number of queries.
+# Lists are serialized from `.values()` rows by FastListMixin (same output).
+# `export/` streams the same rows as CSV or NDJSON (StreamingExportMixin).
+# `bulk-status/` moves many applications to one status in a single UPDATE.
+class ApplicationViewSet(FastListMixin, StreamingExportMixin, viewsets.ModelViewSet):
     """ViewSet for managing job applications."""
-    queryset = Application.objects.all()
+    queryset = Application.objects.select_related("job", "applicant", "reviewed_by").prefetch_related("files")
     serializer_class = ApplicationSerializer
     permission_classes = [permissions.IsAuthenticated]
 
@@ -34,6 +58,12 @@ class ApplicationViewSet(viewsets.ModelViewSet):
     ordering_fields = ["applied_at", "status"]  
     ordering = ["-applied_at"]
 
+    # Page numbers by default, keyset pagination with `?pagination=cursor`
+    pagination_class = OptionalCursorPagination
+    cursor_ordering = ("-applied_at", "-id")
+
+    export_filename = "applications"
+
     def perform_create(self, serializer):
         """Attach applicant and IP address when seeker creates an application."""
         application = serializer.save(
@@ -52,20 +82,23 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         qs = super().get_queryset()
         user = self.request.user
 
-        if getattr(user, "role", None) == "SEEKER":
+        if is_admin(user):
+            logger.debug(f"Admin {user} fetching all applications")
+            return qs
+
+        elif getattr(user, "role", None) == User.ROLE_SEEKER:
             logger.debug(f"Seeker {user} fetching own applications")
             return qs.filter(applicant=user)
 
-        elif getattr(user, "role", None) == "RECRUITER":
+        elif getattr(user, "role", None) == User.ROLE_EMPLOYER:
             logger.debug(f"Recruiter {user} fetching applications for owned jobs")
             return qs.filter(job__company__owner=user)
 
-        logger.debug(f"Admin {user} fetching all applications")
-        return qs
+        return qs.none()
 
     def create(self, request, *args, **kwargs):
         """Prevent duplicate applications for the same job by the same seeker."""
-        if getattr(request.user, "role", None) != "SEEKER":
+        if getattr(request.user, "role", None) != User.ROLE_SEEKER:
             logger.warning(f"Unauthorized create attempt by {request.user} (role={getattr(request.user, 'role', None)})")
             raise PermissionDenied("Only job seekers can apply for jobs.")
 
@@ -79,6 +112,64 @@ class ApplicationViewSet(viewsets.ModelViewSet):
 
         return super().create(request, *args, **kwargs)
 
+    @swagger_auto_schema(request_body=ApplicationBulkStatusSerializer)
+    @action(detail=False, methods=["post"], url_path="bulk-status")
+    def bulk_status(self, request):
+        """
+        Move applications to one status, recording the reviewer, with a
+        single set-based UPDATE (no per-row signals). Recruiters only reach
+        applications to their own jobs; admins reach all.
+        - `ids` in the body, or the list filters in the query string, pick
+          the applications; ones already in the status are left alone.
+        - At most APPLICATIONS_BULK_STATUS_MAX_IDS applications per call,
+          either way; a larger filtered selection is rejected with 400.
+        - Applicants are told by one notify_status_change_task for the batch,
+          queued through the outbox in the same transaction.
+        """
+        user = request.user
+        if not (is_admin(user) or getattr(user, "role", None) == User.ROLE_EMPLOYER):
+            logger.warning(f"Unauthorized bulk status change attempt by {user}")
+            raise PermissionDenied("Only recruiters and admins can change application status.")
+
+        params = ApplicationBulkStatusSerializer(data=request.data)
+        params.is_valid(raise_exception=True)
+        new_status = params.validated_data["status"]
+        if "ids" in params.validated_data:
+            queryset = self.get_queryset().filter(pk__in=params.validated_data["ids"])
+        elif any(request.query_params.get(name) for name in self.filterset_fields):
+            queryset = self.filter_queryset(self.get_queryset())
+        else:
+            raise ValidationError({"ids": "Give application ids, or filter by job, status or applicant."})
+
+        limit = settings.APPLICATIONS_BULK_STATUS_MAX_IDS
+        with transaction.atomic():
+            rows = list(
+                queryset.exclude(status=new_status)
+                .select_for_update(of=("self",))
+                .values_list("id", "status", "job__company_id")[:limit + 1]
+            )
+            if len(rows) > limit:
+                raise ValidationError(
+                    {"detail": f"The filters select more than {limit} applications; narrow them or give ids."}
+                )
+            ids = [application_id for application_id, _, _ in rows]
+            Application.objects.filter(pk__in=ids).update(
+                status=new_status, reviewed_by=user, reviewed_at=timezone.now()
+            )
+
+            # The per-row company stats signals do not run for a queryset UPDATE
+            hires = Counter()
+            for _, old_status, company_id in rows:
+                hires[company_id] += (new_status == "accepted") - (old_status == "accepted")
+            for company_id, delta in hires.items():
+                adjust_company_stats(company_id, hires=delta)
+
+            if ids:
+                enqueue_task(notify_status_change_task, ids, new_status)
+
+        logger.info(f"{len(ids)} applications moved to {new_status} by {user}")
+        return Response({"updated": len(ids), "status": new_status})
+
     def update(self, request, *args, **kwargs):
         """
         Restrict who can update applications:
@@ -90,12 +181,12 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         partial = kwargs.pop("partial", False)
         instance = self.get_object()
 
-        if getattr(user, "role", None) == "SEEKER":
+        if getattr(user, "role", None) == User.ROLE_SEEKER:
             if any(field in request.data for field in ["status", "reviewed_by", "reviewed_at"]):
                 logger.error(f"Seeker {user} attempted unauthorized status/review update on Application {instance.id}")
                 raise PermissionDenied("You cannot change status or review fields.")
 
-        elif getattr(user, "role", None) == "RECRUITER":
+        elif getattr(user, "role", None) == User.ROLE_EMPLOYER:
             allowed_fields = {"status", "reviewed_by", "reviewed_at"}
             if not set(request.data.keys()).issubset(allowed_fields): 
                 logger.error(f"Recruiter {user} attempted unauthorized update on Application {instance.id}")
@@ -117,9 +208,10 @@ class ApplicationViewSet(viewsets.ModelViewSet):
 # ---------------------------------------------------------
 # Handles application file uploads and management:
 # - Seekers can upload files (e.g., CV, cover letter) for their own applications.
-# - Recruiters can view files attached to applications for their jobs.
-# - Admins can view/manage all files.
+# - Recruiters (employers) can view files attached to applications for their jobs.
+# - Admins can view/manage all files; other users see none.
 # Includes role-based access restrictions and validation.
+# Files serialize from their own columns only: a page is one query.
 class ApplicationFileViewSet(viewsets.ModelViewSet):
     """ViewSet for managing application files."""
     queryset = ApplicationFile.objects.all()
@@ -136,20 +228,23 @@ class ApplicationFileViewSet(viewsets.ModelViewSet):
         """Limit file access depending on user role."""
         user = self.request.user
 
-        if getattr(user, "role", None) == "SEEKER":
+        if is_admin(user):
+            logger.debug(f"Admin {user} fetching all application files")
+            return self.queryset
+
+        elif getattr(user, "role", None) == User.ROLE_SEEKER:
             logger.debug(f"Seeker {user} fetching own application files")
             return self.queryset.filter(application__applicant=user)
 
-        elif getattr(user, "role", None) == "RECRUITER":
+        elif getattr(user, "role", None) == User.ROLE_EMPLOYER:
             logger.debug(f"Recruiter {user} fetching application files for owned jobs")
             return self.queryset.filter(application__job__company__owner=user)
 
-        logger.debug(f"Admin {user} fetching all application files")
-        return self.queryset
+        return self.queryset.none()
 
     def create(self, request, *args, **kwargs):
         """Attach files to an application (seekers only)."""
-        if getattr(request.user, "role", None) != "SEEKER":
+        if getattr(request.user, "role", None) != User.ROLE_SEEKER:
             logger.warning(f"Unauthorized file upload attempt by {request.user}")
             raise PermissionDenied("Only seekers can upload application files.")
 
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Industry, Company
+from .models import Industry, Company, CompanyStats
 
 @admin.register(Industry)
 class IndustryAdmin(admin.ModelAdmin):
@@ -11,3 +11,9 @@ class CompanyAdmin(admin.ModelAdmin):
     list_display = ("id", "name", "description", "website", "location", "industry")
     search_fields = ["name", "location", "industry__name"]
     list_filter = ("industry",)
+
+@admin.register(CompanyStats)
+class CompanyStatsAdmin(admin.ModelAdmin):
+    list_display = ("company", "open_jobs", "applications", "hires", "updated_at")
+    search_fields = ["company__name"]
+    readonly_fields = ("open_jobs", "applications", "hires", "updated_at")
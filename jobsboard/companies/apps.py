@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class CompaniesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'companies'
+
+    def ready(self):
+        """
+        Import signals when the app is ready.
+        This ensures Django connects all receivers at startup.
+        """
+        import companies.signals
@@ -0,0 +1,21 @@
+# jobsboard/companies/management/commands/rebuild_company_stats.py
+from django.core.management.base import BaseCommand
+
+from companies.stats import refresh_company_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount the per-company open job, application and hire counters "
+        "(CompanyStats) from the jobs and applications tables."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--company", type=int, action="append", dest="companies",
+            help="Only recount this company id (repeatable)",
+        )
+
+    def handle(self, *args, **options):
+        updated = refresh_company_stats(options["companies"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt stats for {updated} companies."))
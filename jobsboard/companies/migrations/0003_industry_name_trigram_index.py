@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-18 05:20
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+from api.db import AddPostgresIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0002_initial'),
+        ('jobs', '0005_job_trigram_indexes'),  # creates the pg_trgm extension
+    ]
+
+    operations = [
+        AddPostgresIndex(
+            model_name='industry',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='idx_industry_name_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
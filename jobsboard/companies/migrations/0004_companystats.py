@@ -0,0 +1,57 @@
+# Generated by Django 4.2 on 2026-10-18 05:55
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+
+def populate_company_stats(apps, schema_editor):
+    Company = apps.get_model('companies', 'Company')
+    CompanyStats = apps.get_model('companies', 'CompanyStats')
+    Job = apps.get_model('jobs', 'Job')
+    Application = apps.get_model('applications', 'Application')
+
+    def counts(queryset, group_by):
+        return dict(queryset.order_by().values(group_by).annotate(total=Count('id')).values_list(group_by, 'total'))
+
+    open_jobs = counts(Job.objects.filter(status='open'), 'company_id')
+    applications = counts(Application.objects.all(), 'job__company_id')
+    hires = counts(Application.objects.filter(status='accepted'), 'job__company_id')
+    CompanyStats.objects.bulk_create(
+        [
+            CompanyStats(
+                company_id=pk,
+                open_jobs=open_jobs.get(pk, 0),
+                applications=applications.get(pk, 0),
+                hires=hires.get(pk, 0),
+            )
+            for pk in Company.objects.values_list('pk', flat=True).iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0003_industry_name_trigram_index'),
+        ('jobs', '0010_saved_searches_and_job_alerts'),
+        ('applications', '0004_remove_application_idx_applications_applied_at_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompanyStats',
+            fields=[
+                ('company', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='companies.company')),
+                ('open_jobs', models.IntegerField(default=0)),
+                ('applications', models.IntegerField(default=0)),
+                ('hires', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Company stats',
+            },
+        ),
+        migrations.RunPython(populate_company_stats, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import URLValidator, MinLengthValidator
 from django.core.exceptions import ValidationError
 
@@ -19,6 +20,7 @@ def validate_https(url):
 # Represents an industry category for companies (e.g., IT, Healthcare).
 # - Used to group companies under a specific industry.
 # - Provides ordering by ID for consistent listing.
+# - Name carries a pg_trgm GIN index for the fuzzy industry filter on jobs.
 class Industry(models.Model):
     name = models.CharField(max_length=100)
 
@@ -26,6 +28,9 @@ class Industry(models.Model):
         app_label = 'companies'
         verbose_name_plural = "Industries"
         ordering = ["id"]
+        indexes = [
+            GinIndex(fields=['name'], name='idx_industry_name_trgm', opclasses=['gin_trgm_ops']),
+        ]
 
     def __str__(self):
         return self.name
@@ -93,3 +98,32 @@ class Company(models.Model):
 
     def __str__(self):
         return self.name
+
+
+# ---------------------------------------------------------
+# CompanyStats Model
+# ---------------------------------------------------------
+# Per-company counters for company pages and employer dashboards.
+# - open_jobs: jobs with status "open"; applications: all applications to
+#   the company's jobs; hires: the accepted ones.
+# - Kept current incrementally (companies/stats.py): Job and Application
+#   signals apply +/-1 deltas, bulk writes recount the companies they touched.
+# - `rebuild_company_stats` recounts every company from scratch.
+class CompanyStats(models.Model):
+    company = models.OneToOneField(
+        Company,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='stats'
+    )
+    open_jobs = models.IntegerField(default=0)
+    applications = models.IntegerField(default=0)
+    hires = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = 'companies'
+        verbose_name_plural = 'Company stats'
+
+    def __str__(self):
+        return f"Stats for company {self.company_id}"
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Industry, Company
+from .models import Industry, Company, CompanyStats
 
 
 # ---------------------------------------------------------
@@ -17,20 +17,33 @@ class IndustrySerializer(serializers.ModelSerializer):
         read_only_fields = ['id']
 
 
+# ---------------------------------------------------------
+# CompanyStatsSerializer
+# ---------------------------------------------------------
+# Read-only company counters (see CompanyStats).
+class CompanyStatsSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CompanyStats
+        fields = ["open_jobs", "applications", "hires"]
+        read_only_fields = fields
+
+
 # ---------------------------------------------------------
 # CompanySerializer
 # ---------------------------------------------------------
 # Serializes Company model data.
 # - Includes company details such as name, description, industry, and owner.
+# - `stats` carries the maintained open job / application / hire counts.
 # - Owner is automatically set to the logged-in user during creation.
 # - ID, owner, and timestamps are read-only fields.
 class CompanySerializer(serializers.ModelSerializer):
     owner = serializers.ReadOnlyField(source="owner.username")  # owner is read-only
+    stats = CompanyStatsSerializer(read_only=True)
 
     class Meta:
         model = Company
-        fields = ["id", "name", "description", "industry", "owner", "created_at", "updated_at"]
-        read_only_fields = ["id", "owner", "created_at", "updated_at"]
+        fields = ["id", "name", "description", "industry", "owner", "stats", "created_at", "updated_at"]
+        read_only_fields = ["id", "owner", "stats", "created_at", "updated_at"]
 
     def create(self, validated_data):
         # Automatically assign the logged-in user as the owner, if available
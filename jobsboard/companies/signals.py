@@ -0,0 +1,25 @@
+# jobsboard/companies/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from api.cache import bump_namespace
+from .models import Company, CompanyStats, Industry
+
+
+@receiver([post_save, post_delete], sender=Industry)
+def invalidate_industries_cache(sender, **kwargs):
+    """Industry writes invalidate the cached industry list."""
+    bump_namespace("industries")
+
+
+@receiver([post_save, post_delete], sender=Company)
+def invalidate_companies_cache(sender, **kwargs):
+    """Company writes invalidate company ETags."""
+    bump_namespace("companies")
+
+
+@receiver(post_save, sender=Company)
+def create_company_stats(sender, instance, created, raw=False, **kwargs):
+    """Every company starts with zeroed counters (companies/stats.py)."""
+    if created and not raw:
+        CompanyStats.objects.get_or_create(company=instance)
@@ -0,0 +1,64 @@
+# jobsboard/companies/stats.py
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from api.cache import bump_namespace
+from applications.models import Application
+from jobs.models import Job
+from .models import Company, CompanyStats
+
+# Cache namespace bumped when every company's counters are recounted; a
+# single company's changes bump company_stats_namespace(id) (company ETags)
+COMPANY_STATS_NAMESPACE = "company-stats"
+
+
+def company_stats_namespace(company_id):
+    return f"{COMPANY_STATS_NAMESPACE}:{company_id}"
+
+
+def adjust_company_stats(company_id, **deltas):
+    """
+    Add `deltas` ({counter: +n or -n}) to one company's counters with a
+    single UPDATE. Never creates the row, so it is safe while the company
+    itself is being deleted.
+    """
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if company_id is None or not deltas:
+        return
+    CompanyStats.objects.filter(company_id=company_id).update(
+        updated_at=timezone.now(),
+        **{name: F(name) + delta for name, delta in deltas.items()},
+    )
+    bump_namespace(company_stats_namespace(company_id))
+
+
+def _count(queryset, group_by):
+    """Correlated COUNT(*) subquery for the outer CompanyStats row; 0 when empty."""
+    counts = queryset.order_by().values(group_by).annotate(total=Count("pk")).values("total")
+    return Coalesce(Subquery(counts), 0)
+
+
+def refresh_company_stats(company_ids=None):
+    """
+    Recount the counters of `company_ids` (None: every company) from the
+    jobs and applications tables, creating missing rows first. For bulk
+    writes that bypass the signals; one INSERT and one UPDATE.
+    """
+    companies = Company.objects.all() if company_ids is None else Company.objects.filter(pk__in=company_ids)
+    missing = companies.filter(stats__isnull=True).values_list("pk", flat=True)
+    CompanyStats.objects.bulk_create([CompanyStats(company_id=pk) for pk in missing], ignore_conflicts=True)
+
+    stats = CompanyStats.objects.all() if company_ids is None else CompanyStats.objects.filter(company_id__in=company_ids)
+    applications = Application.objects.filter(job__company_id=OuterRef("company_id"))
+    updated = stats.update(
+        open_jobs=_count(Job.objects.filter(company_id=OuterRef("company_id"), status="open"), "company_id"),
+        applications=_count(applications, "job__company_id"),
+        hires=_count(applications.filter(status="accepted"), "job__company_id"),
+        updated_at=timezone.now(),
+    )
+    if company_ids is None:
+        bump_namespace(COMPANY_STATS_NAMESPACE)
+    else:
+        bump_namespace(*(company_stats_namespace(company_id) for company_id in set(company_ids)))
+    return updated
@@ -1,9 +1,18 @@
 #jobsboard/companies/test.py
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
 from django.test import TestCase
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
 from django.contrib.auth import get_user_model
-from companies.models import Industry, Company
+from api.testing import QueryBudgetMixin
+from applications.models import Application
+from companies.models import Industry, Company, CompanyStats
+from jobs.models import Job
+from jobs.tasks import process_job_schedule
 
 User = get_user_model()
 
@@ -31,6 +40,15 @@ class IndustryAPITestCase(TestCase):
         response = self.client.get(self.industry_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_industry_list_cached_until_write(self):
+        self.client.get(self.industry_url)
+        with self.assertNumQueries(0):
+            self.client.get(self.industry_url)
+
+        Industry.objects.create(name="Finance")
+        response = self.client.get(self.industry_url)
+        self.assertEqual(response.data["count"], 2)
+
     def test_create_industry(self):
         self.client.force_authenticate(user=self.user)
         data = {"name": "Finance"}
@@ -150,6 +168,166 @@ class CompanyAPITestCase(APITestCase):
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+    def test_company_conditional_get(self):
+        url = f"{self.company_url}{self.company.pk}/"
+        etag = self.client.get(url)["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.company.name = "Renamed Co"
+        self.company.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["name"], "Renamed Co")
+
     def test_list_companies_public(self):
         response = self.client.get(self.company_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class CompanyQueryBudgetTestCase(QueryBudgetMixin, APITestCase):
+    def setUp(self):
+        self.industry = Industry.objects.create(name="Tech")
+        self.add_companies(1)
+
+    def add_companies(self, count):
+        start = Company.objects.count()
+        for i in range(start, start + count):
+            owner = User.objects.create_user(
+                username=f"owner{i}",
+                email=f"owner{i}@example.com",
+                password="password",
+                role="employer"
+            )
+            Company.objects.create(
+                name=f"Company {i}",
+                description="Budget test company",
+                industry=self.industry,
+                owner=owner
+            )
+
+    def test_company_list_query_budget(self):
+        """Owner usernames are joined in, not fetched per company"""
+        self.assertQueryBudget("/api/companies/", 2, self.add_companies)
+
+
+class CompanyStatsTestCase(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create_user(
+            username="statsowner",
+            email="statsowner@example.com",
+            password="password",
+            role="employer"
+        )
+        self.seeker = User.objects.create_user(
+            username="statsseeker",
+            email="statsseeker@example.com",
+            password="password",
+            role="seeker"
+        )
+        industry = Industry.objects.create(name="Tech")
+        self.company = Company.objects.create(
+            name="Stats Co", description="Stats test company", industry=industry, owner=self.owner
+        )
+        self.other = Company.objects.create(
+            name="Other Co", description="Other test company", industry=industry, owner=self.owner
+        )
+        self.job = self.create_job()
+
+    def create_job(self, status="open", company=None):
+        return Job.objects.create(
+            title="Stats Job", company=company or self.company, location="Remote", status=status
+        )
+
+    def apply(self, job, username, status="pending"):
+        applicant = User.objects.create_user(
+            username=username, email=f"{username}@example.com", password="password", role="seeker"
+        )
+        return Application.objects.create(job=job, applicant=applicant, status=status)
+
+    def assertStats(self, company, open_jobs, applications, hires):
+        stats = CompanyStats.objects.get(company=company)
+        self.assertEqual((stats.open_jobs, stats.applications, stats.hires), (open_jobs, applications, hires))
+
+    def test_job_status_transitions_move_open_jobs(self):
+        self.assertStats(self.company, 1, 0, 0)
+        draft = self.create_job(status="draft")
+        self.assertStats(self.company, 1, 0, 0)
+
+        draft.status = "open"
+        draft.save()
+        self.job.status = "closed"
+        self.job.save()
+        self.job.title = "Renamed"
+        self.job.save()
+        self.assertStats(self.company, 1, 0, 0)
+
+        draft.delete()
+        self.assertStats(self.company, 0, 0, 0)
+
+    def test_application_writes_move_applications_and_hires(self):
+        first = self.apply(self.job, "applicant1")
+        self.apply(self.job, "applicant2", status="accepted")
+        self.assertStats(self.company, 1, 2, 1)
+
+        first.status = "accepted"
+        first.save()
+        self.assertStats(self.company, 1, 2, 2)
+        first.status = "rejected"
+        first.save()
+        self.assertStats(self.company, 1, 2, 1)
+
+        first.delete()
+        self.assertStats(self.company, 1, 1, 1)
+        # Deleting the job removes its applications from the counters too
+        self.job.delete()
+        self.assertStats(self.company, 0, 0, 0)
+
+    def test_moving_a_job_moves_its_counts(self):
+        self.apply(self.job, "applicant1", status="accepted")
+        self.job.company = self.other
+        self.job.save()
+        self.assertStats(self.company, 0, 0, 0)
+        self.assertStats(self.other, 1, 1, 1)
+
+    def test_bulk_writes_and_rebuild_command(self):
+        # A set-based UPDATE bypasses the signals...
+        Job.objects.filter(pk=self.job.pk).update(status="closed")
+        self.assertStats(self.company, 1, 0, 0)
+        # ...the scheduler recounts the companies it touched
+        self.create_job(status="draft")
+        Job.objects.filter(status="draft").update(publish_at=timezone.now() - timedelta(minutes=1))
+        process_job_schedule()
+        self.assertStats(self.company, 1, 0, 0)
+
+        CompanyStats.objects.filter(company=self.company).update(open_jobs=42, hires=7)
+        CompanyStats.objects.filter(company=self.other).delete()
+        out = StringIO()
+        call_command("rebuild_company_stats", stdout=out)
+        self.assertIn("Rebuilt stats for 2 companies", out.getvalue())
+        self.assertStats(self.company, 1, 0, 0)
+        self.assertStats(self.other, 0, 0, 0)
+
+    def test_company_api_exposes_stats(self):
+        self.apply(self.job, "applicant1", status="accepted")
+        url = f"/api/companies/{self.company.pk}/"
+        response = self.client.get(url)
+        self.assertEqual(response.data["stats"], {"open_jobs": 1, "applications": 1, "hires": 1})
+
+        # Counter changes invalidate the company's ETag
+        etag = response["ETag"]
+        self.create_job()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["stats"]["open_jobs"], 2)
+
+    def test_stats_changes_keep_other_companies_etags(self):
+        url = f"/api/companies/{self.other.pk}/"
+        detail_etag = self.client.get(url)["ETag"]
+        list_etag = self.client.get("/api/companies/")["ETag"]
+
+        self.apply(self.job, "applicant1")
+        self.create_job()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=detail_etag).status_code, status.HTTP_304_NOT_MODIFIED)
+        response = self.client.get("/api/companies/", HTTP_IF_NONE_MATCH=list_etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -5,7 +5,10 @@ from rest_framework.response import Response
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
+from api.cache import CachedListMixin
+from api.conditional import ConditionalGetMixin
 from .models import Industry, Company
+from .stats import COMPANY_STATS_NAMESPACE, company_stats_namespace
 from .serializers import IndustrySerializer, CompanySerializer
 
 logger = logging.getLogger(__name__)
@@ -19,13 +22,15 @@ logger = logging.getLogger(__name__)
 # - Authenticated users can create/update industries.
 # - Only admins can delete industries.
 # - Includes logging for create/update/delete actions.
-class IndustryViewSet(viewsets.ModelViewSet):
+# - List responses are cached until an industry is saved or deleted.
+class IndustryViewSet(CachedListMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing industries.
     """
     queryset = Industry.objects.all().order_by("id")
     serializer_class = IndustrySerializer
     authentication_classes = [JWTAuthentication]
+    cache_namespaces = ("industries",)
 
     def get_permissions(self):
         if self.action in ['list', 'retrieve']:
@@ -109,14 +114,25 @@ class IsEmployerOrAdmin(permissions.BasePermission):
 # - Admins have full access including delete.
 # - Logs all create, update, and delete operations.
 # - Requires JWT authentication and role-based permissions.
-class CompanyViewSet(viewsets.ModelViewSet):
+# - Conditional GET: ETags follow company writes (companies/signals.py);
+#   a company's own ETag also follows its stats (companies/stats.py), so
+#   an application elsewhere does not invalidate it or the list. List
+#   counters are refreshed with the next company write.
+class CompanyViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing companies.
     """
-    queryset = Company.objects.all()
+    queryset = Company.objects.select_related("owner", "stats")
     serializer_class = CompanySerializer
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsEmployerOrAdmin]
+    etag_namespaces = ("companies",)
+
+    def get_etag_namespaces(self, request):
+        if self.action == "retrieve":
+            pk = self.kwargs[self.lookup_url_kwarg or self.lookup_field]
+            return (*self.etag_namespaces, COMPANY_STATS_NAMESPACE, company_stats_namespace(pk))
+        return self.etag_namespaces
 
     def perform_create(self, serializer):
         company = serializer.save(owner=self.request.user)
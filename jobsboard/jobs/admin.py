@@ -1,6 +1,6 @@
 # jobsboard/jobs/admin.py
 from django.contrib import admin
-from .models import Job, Skill, JobSkill
+from .models import Job, Skill, JobSkill, SeekerSkill, SavedSearch
 
 @admin.register(Skill)
 class SkillAdmin(admin.ModelAdmin):
@@ -19,3 +19,14 @@ class JobAdmin(admin.ModelAdmin):
 class JobSkillAdmin(admin.ModelAdmin):
     list_display = ('id', 'job', 'skill')
     search_fields = ('job__title', 'skill__name')
+
+@admin.register(SeekerSkill)
+class SeekerSkillAdmin(admin.ModelAdmin):
+    list_display = ('id', 'user', 'skill')
+    search_fields = ('user__username', 'skill__name')
+
+@admin.register(SavedSearch)
+class SavedSearchAdmin(admin.ModelAdmin):
+    list_display = ('id', 'user', 'name', 'is_active', 'created_at')
+    list_filter = ('is_active',)
+    search_fields = ('user__username', 'name')
@@ -0,0 +1,183 @@
+# jobsboard/jobs/alerts.py
+import logging
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from notifications.models import Notification
+from notifications.signals import bump_notification_versions
+from .models import Job, JobSkill, SavedSearch, SavedSearchCriterion
+
+logger = logging.getLogger(__name__)
+
+# Single-valued job attributes that saved searches can require
+DISCRETE_CRITERIA = ("employment_type", "work_location_type", "experience_level", "industry")
+SKILL_CRITERION = "skill"
+
+# Job titles listed in one alert before "and N more"
+ALERT_TITLES_SHOWN = 5
+
+JOB_ALERT_COLUMNS = (
+    "id", "title", "location", "salary_min", "salary_max",
+    "employment_type", "work_location_type", "experience_level", "industry_id",
+)
+
+
+def _job_value(job, kind):
+    value = job["industry_id"] if kind == "industry" else job[kind]
+    return None if value in (None, "") else str(value)
+
+
+def index_saved_search(search):
+    """
+    Rewrite the search's SavedSearchCriterion rows and criteria_count
+    from its fields. Call after saving the search and setting its skills.
+    """
+    criteria = [
+        SavedSearchCriterion(search=search, kind=kind, value=str(value))
+        for kind, value in (
+            ("employment_type", search.employment_type),
+            ("work_location_type", search.work_location_type),
+            ("experience_level", search.experience_level),
+            ("industry", search.industry_id),
+        )
+        if value not in (None, "")
+    ]
+    skill_ids = list(search.skills.values_list("id", flat=True))
+    criteria += [SavedSearchCriterion(search=search, kind=SKILL_CRITERION, value=str(pk)) for pk in skill_ids]
+
+    with transaction.atomic():
+        SavedSearchCriterion.objects.filter(search=search).delete()
+        SavedSearchCriterion.objects.bulk_create(criteria)
+        search.criteria_count = len({criterion.kind for criterion in criteria})
+        SavedSearch.objects.filter(pk=search.pk).update(criteria_count=search.criteria_count)
+
+
+def _passes_filters(search, job):
+    """The non-indexed criteria: partial title/location match and salary bounds, as in JobFilter."""
+    if search.title and search.title.lower() not in job["title"].lower():
+        return False
+    if search.location and search.location.lower() not in job["location"].lower():
+        return False
+    if search.min_salary is not None and (job["salary_min"] is None or job["salary_min"] < search.min_salary):
+        return False
+    if search.max_salary is not None and (job["salary_max"] is None or job["salary_max"] > search.max_salary):
+        return False
+    return True
+
+
+def match_saved_searches(jobs, job_skills):
+    """
+    {SavedSearch: [job, ...]} for a batch of jobs (`.values()` dicts with
+    JOB_ALERT_COLUMNS) and their skill ids ({job id: [skill id]}).
+
+    One query reads the postings of just the batch's attribute values from
+    the criteria index; a search matches a job when the job hits all of its
+    criteria kinds (any one skill counts for the skill kind). Cost grows
+    with the batch, not with the number of saved searches; only searches
+    without discrete criteria are checked against every job.
+    """
+    terms = defaultdict(set)
+    for job in jobs:
+        for kind in DISCRETE_CRITERIA:
+            value = _job_value(job, kind)
+            if value is not None:
+                terms[kind].add(value)
+        terms[SKILL_CRITERION].update(str(pk) for pk in job_skills.get(job["id"], ()))
+    terms = {kind: values for kind, values in terms.items() if values}
+
+    postings = defaultdict(list)
+    if terms:
+        lookup = Q()
+        for kind, values in terms.items():
+            lookup |= Q(kind=kind, value__in=values)
+        rows = SavedSearchCriterion.objects.filter(lookup, search__is_active=True).values_list("search_id", "kind", "value")
+        for search_id, kind, value in rows:
+            postings[(kind, value)].append(search_id)
+
+    hits = defaultdict(lambda: defaultdict(set))  # job id -> search id -> criteria kinds hit
+    for job in jobs:
+        job_hits = hits[job["id"]]
+        for kind in DISCRETE_CRITERIA:
+            for search_id in postings.get((kind, _job_value(job, kind)), ()):
+                job_hits[search_id].add(kind)
+        for skill_id in job_skills.get(job["id"], ()):
+            for search_id in postings.get((SKILL_CRITERION, str(skill_id)), ()):
+                job_hits[search_id].add(SKILL_CRITERION)
+
+    candidate_ids = {search_id for job_hits in hits.values() for search_id in job_hits}
+    searches = {
+        search.pk: search
+        for search in SavedSearch.objects.filter(Q(pk__in=candidate_ids) | Q(criteria_count=0), is_active=True)
+    }
+    wildcards = [search for search in searches.values() if search.criteria_count == 0]
+
+    matches = defaultdict(list)
+    for job in jobs:
+        for search_id, kinds in hits[job["id"]].items():
+            search = searches.get(search_id)
+            if search is not None and len(kinds) == search.criteria_count and _passes_filters(search, job):
+                matches[search].append(job)
+        for search in wildcards:
+            if _passes_filters(search, job):
+                matches[search].append(job)
+    return matches
+
+
+def build_alert(search, jobs):
+    """One notification per saved search and batch, listing the new jobs."""
+    titles = ", ".join(job["title"] for job in jobs[:ALERT_TITLES_SHOWN])
+    if len(jobs) > ALERT_TITLES_SHOWN:
+        titles += f" and {len(jobs) - ALERT_TITLES_SHOWN} more"
+    count = f"{len(jobs)} new job{'s' if len(jobs) > 1 else ''}"
+    return Notification(
+        user_id=search.user_id,
+        title=f"{count} for \"{search.name}\"",
+        message=f"New jobs matching your saved search: {titles}.",
+        link=f"/api/jobs/{jobs[0]['id']}/",
+        type="info",
+    )
+
+
+def process_job_alerts(batch_size):
+    """
+    Match open jobs not yet processed against saved searches, `batch_size`
+    jobs at a time, and notify the searches' owners with bulk_create.
+    Each batch is marked processed in the same transaction.
+    Returns {"jobs": processed, "notifications": created}.
+    """
+    processed = notified = 0
+    while True:
+        with transaction.atomic():
+            jobs = list(
+                Job.objects.filter(status="open", alerts_processed_at__isnull=True)
+                .order_by("id")
+                .select_for_update(skip_locked=True)
+                .values(*JOB_ALERT_COLUMNS)[:batch_size]
+            )
+            if not jobs:
+                break
+            job_ids = [job["id"] for job in jobs]
+            job_skills = defaultdict(list)
+            for job_id, skill_id in JobSkill.objects.filter(job_id__in=job_ids).values_list("job_id", "skill_id"):
+                job_skills[job_id].append(skill_id)
+
+            matches = match_saved_searches(jobs, job_skills)
+            notifications = Notification.objects.bulk_create(
+                [build_alert(search, matched) for search, matched in matches.items()]
+            )
+            Job.objects.filter(pk__in=job_ids).update(alerts_processed_at=timezone.now())
+
+        if notifications:
+            # bulk_create sends no post_save for the notification ETags
+            bump_notification_versions(notification.user_id for notification in notifications)
+        processed += len(jobs)
+        notified += len(notifications)
+        if len(jobs) < batch_size:
+            break
+
+    if processed:
+        logger.info(f"Job alerts: {processed} new jobs, {notified} notifications")
+    return {"jobs": processed, "notifications": notified}
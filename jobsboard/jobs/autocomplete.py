@@ -0,0 +1,99 @@
+# jobsboard/jobs/autocomplete.py
+import heapq
+import threading
+from bisect import bisect_left
+
+from django.db.models import Count
+
+from api.cache import get_namespace_versions
+from .models import Skill
+
+# Cache namespaces whose versions the index is built for: skill writes bump
+# "skills", JobSkill writes (signals and bulk paths) bump "skill-usage"
+SKILL_INDEX_NAMESPACES = ("skills", "skill-usage")
+
+# Prefixes up to this length get their ranked suggestions precomputed; they
+# match too many skills to rank per request
+PRECOMPUTED_PREFIX_LENGTH = 3
+
+MAX_SUGGESTIONS = 50
+
+
+# ---------------------------------------------------------
+# SkillPrefixIndex
+# ---------------------------------------------------------
+# In-memory, per-process prefix index over skill names for autocomplete.
+# - Every skill is reachable from the start of its name and of each later
+#   word ("Amazon Web Services" matches "ama", "web" and "serv").
+# - Suggestions are ranked by the number of jobs using the skill, then name.
+# - Short prefixes read a precomputed top-MAX_SUGGESTIONS list; longer ones
+#   bisect a sorted key list, so a lookup never touches the database.
+# - Rebuilt (one query) when the versions of SKILL_INDEX_NAMESPACES move.
+class SkillPrefixIndex:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version = None
+        # (sorted keys, rank of each key's skill, suggestions by rank, {short prefix: suggestions}),
+        # swapped in as a whole so readers never see half a rebuild
+        self.state = ([], [], [], {})
+
+    def sync(self):
+        """Rebuild the index if a skill or job skill changed since it was built."""
+        versions = get_namespace_versions(SKILL_INDEX_NAMESPACES)
+        version = tuple(versions[namespace] for namespace in SKILL_INDEX_NAMESPACES)
+        if version == self.version:
+            return
+        with self.lock:
+            if version != self.version:
+                self._build(Skill.objects.annotate(job_count=Count("job_skills")).values_list("id", "name", "job_count"))
+                self.version = version
+
+    def _build(self, skills):
+        # (rank key, suggestion): best ranked first when sorted
+        ranked = sorted(((-job_count, name.lower(), skill_id), (skill_id, name, job_count))
+                        for skill_id, name, job_count in skills)
+        postings = []
+        top = {}
+        for rank, (rank_key, suggestion) in enumerate(ranked):
+            for key in self._keys(suggestion[1]):
+                postings.append((key, rank))
+                for length in range(1, min(len(key), PRECOMPUTED_PREFIX_LENGTH) + 1):
+                    candidates = top.setdefault(key[:length], [])
+                    # Skills arrive best first: the list fills in rank order
+                    if len(candidates) < MAX_SUGGESTIONS and (not candidates or candidates[-1] != rank):
+                        candidates.append(rank)
+        postings.sort()
+        suggestions = [suggestion for _, suggestion in ranked]
+        self.state = (
+            [key for key, _ in postings],
+            [rank for _, rank in postings],
+            suggestions,
+            {prefix: [suggestions[rank] for rank in ranks] for prefix, ranks in top.items()},
+        )
+
+    @staticmethod
+    def _keys(name):
+        words = name.lower().split()
+        return {" ".join(words[i:]) for i in range(len(words))}
+
+    def search(self, query, limit=10):
+        """[(id, name, job count)] of the best `limit` skills matching the prefix `query`."""
+        prefix = " ".join(query.lower().split())
+        if not prefix:
+            return []
+        keys, entries, suggestions, top = self.state
+        if len(prefix) <= PRECOMPUTED_PREFIX_LENGTH:
+            return top.get(prefix, [])[:limit]
+
+        start = bisect_left(keys, prefix)
+        end = bisect_left(keys, prefix + "\uffff", start)
+        return [suggestions[rank] for rank in heapq.nsmallest(limit, set(entries[start:end]))]
+
+
+skill_index = SkillPrefixIndex()
+
+
+def autocomplete_skills(query, limit=10):
+    """Skills whose name (or a word of it) starts with `query`, most used first."""
+    skill_index.sync()
+    return skill_index.search(query, limit)
@@ -0,0 +1,63 @@
+# jobsboard/jobs/changes.py
+from functools import partial
+from itertools import chain
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from api.cache import bump_namespace_version, get_namespace_version
+
+# Cache namespace whose version numbers the job change log entries
+JOB_CHANGES_NAMESPACE = "job-changes"
+
+# Readers further behind than this many entries start over instead
+MAX_PENDING_CHANGES = 1000
+
+
+# ---------------------------------------------------------
+# Job change log
+# ---------------------------------------------------------
+# Shared feed of "these jobs changed" for the derived job indexes
+# (jobs/matching.py in each web process, jobs/similarity.py on disk).
+# - Every entry bumps the JOB_CHANGES_NAMESPACE version and stores the
+#   changed job ids under the new version for JOBS_CHANGE_LOG_TIMEOUT seconds.
+# - A reader remembers the last version it applied and asks for the ids
+#   changed since; a missing entry (expired, evicted, or an explicit "anything
+#   may have changed") tells it to rebuild from scratch.
+# - Needs a shared cache (CACHE_URL) to reach other processes.
+def _change_key(version):
+    return f"{JOB_CHANGES_NAMESPACE}:{version}"
+
+
+def record_job_changes(job_ids=None):
+    """
+    Record that these jobs changed (text, skills, status, level or salary),
+    once the current transaction commits. `None` means anything may have
+    changed: readers rebuild.
+    """
+    transaction.on_commit(partial(_record_job_changes, None if job_ids is None else list(job_ids)))
+
+
+def _record_job_changes(job_ids):
+    version = bump_namespace_version(JOB_CHANGES_NAMESPACE)
+    if job_ids is not None:
+        cache.set(_change_key(version), job_ids, settings.JOBS_CHANGE_LOG_TIMEOUT)
+
+
+def get_job_changes_version():
+    return get_namespace_version(JOB_CHANGES_NAMESPACE)
+
+
+def get_job_changes(since, version):
+    """
+    Ids of the jobs changed after version `since` up to `version`, or None
+    when they cannot all be known and the reader must rebuild.
+    """
+    if since is None or not 0 <= version - since <= MAX_PENDING_CHANGES:
+        return None
+    keys = [_change_key(v) for v in range(since + 1, version + 1)]
+    found = cache.get_many(keys)
+    if len(found) < len(keys):
+        return None
+    return set(chain.from_iterable(found.values()))
@@ -0,0 +1,73 @@
+# jobsboard/jobs/facets.py
+from django.db.models import Count, Q
+
+from .models import Job, JobSkill
+
+# Salary buckets on salary_min: (key, lower bound inclusive, upper bound exclusive)
+SALARY_BUCKETS = [
+    ("under_30k", None, 30000),
+    ("30k_60k", 30000, 60000),
+    ("60k_100k", 60000, 100000),
+    ("100k_plus", 100000, None),
+]
+
+CHOICE_FACETS = {
+    "employment_type": Job.EMPLOYMENT_TYPE_CHOICES,
+    "work_location_type": Job.WORK_LOCATION_TYPE_CHOICES,
+    "experience_level": Job.EXPERIENCE_LEVEL_CHOICES,
+}
+
+
+def _salary_bucket_filter(lower, upper):
+    condition = Q()
+    if lower is not None:
+        condition &= Q(salary_min__gte=lower)
+    if upper is not None:
+        condition &= Q(salary_min__lt=upper)
+    return condition
+
+
+def compute_job_facets(queryset):
+    """
+    Facet counts for the jobs matched by `queryset`, in three queries:
+    - one conditional aggregate for the total, choice fields and salary buckets
+    - one GROUP BY for industries (denormalized Job.industry)
+    - one GROUP BY for skills (JobSkill)
+    """
+    matched = Job.objects.filter(pk__in=queryset.order_by().values("pk"))
+
+    aggregates = {"total": Count("pk")}
+    for field, choices in CHOICE_FACETS.items():
+        for value, _label in choices:
+            aggregates[f"{field}__{value}"] = Count("pk", filter=Q(**{field: value}))
+    for key, lower, upper in SALARY_BUCKETS:
+        aggregates[f"salary__{key}"] = Count("pk", filter=_salary_bucket_filter(lower, upper))
+    counts = matched.aggregate(**aggregates)
+
+    facets = {"count": counts["total"]}
+    for field, choices in CHOICE_FACETS.items():
+        facets[field] = {value: counts[f"{field}__{value}"] for value, _label in choices}
+    facets["salary"] = {key: counts[f"salary__{key}"] for key, _lower, _upper in SALARY_BUCKETS}
+
+    industries = (
+        matched.filter(industry__isnull=False)
+        .values("industry_id", "industry__name")
+        .annotate(count=Count("pk"))
+        .order_by("-count", "industry__name")
+    )
+    facets["industry"] = [
+        {"id": row["industry_id"], "name": row["industry__name"], "count": row["count"]}
+        for row in industries
+    ]
+
+    skills = (
+        JobSkill.objects.filter(job__in=matched.values("pk"))
+        .values("skill_id", "skill__name")
+        .annotate(count=Count("pk"))
+        .order_by("-count", "skill__name")
+    )
+    facets["skills"] = [
+        {"id": row["skill_id"], "name": row["skill__name"], "count": row["count"]}
+        for row in skills
+    ]
+    return facets
@@ -1,7 +1,33 @@
 #jobsboard/jobs/filters.py
 import django_filters
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django_filters.constants import EMPTY_VALUES
+
+from api.db import is_postgres
 from .models import Job
 
+
+# ---------------------------------------------------------
+# TrigramCharFilter
+# ---------------------------------------------------------
+# Text filter with an opt-in fuzzy mode (`?fuzzy=true`).
+# - Default: case-insensitive partial match (icontains).
+# - Fuzzy on PostgreSQL: pg_trgm word similarity (`%>` operator), which is served
+#   by the gin_trgm_ops indexes and tolerates typos ("pyhton developer", "Nairbi").
+#   The threshold is settings.JOBS_TRIGRAM_SIMILARITY_THRESHOLD (see jobs/signals.py).
+# - Fuzzy on other databases (SQLite in tests): falls back to icontains.
+class TrigramCharFilter(django_filters.CharFilter):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("lookup_expr", "icontains")
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES or not self.parent.fuzzy_enabled or not is_postgres(qs.db):
+            return super().filter(qs, value)
+        self.parent.similarity_terms.append((self.field_name, value))
+        return self.get_method(qs)(**{f"{self.field_name}__trigram_word_similar": value})
+
+
 class JobFilter(django_filters.FilterSet):
     # Numeric filters for salary
     min_salary = django_filters.NumberFilter(field_name="salary_min", lookup_expr="gte")
@@ -13,10 +39,14 @@ class JobFilter(django_filters.FilterSet):
     experience_level = django_filters.ChoiceFilter(choices=Job.EXPERIENCE_LEVEL_CHOICES)
     status = django_filters.ChoiceFilter(choices=Job.JOB_STATUS_CHOICES)
 
-    # Text search for location
-    location = django_filters.CharFilter(field_name="location", lookup_expr="icontains")
-    title = django_filters.CharFilter(field_name="title", lookup_expr="icontains")
-    industry = django_filters.CharFilter(field_name="industry__name", lookup_expr="icontains")  # if using ForeignKey to Industry
+    # Text filters (partial match, or typo-tolerant with ?fuzzy=true)
+    location = TrigramCharFilter(field_name="location")
+    title = TrigramCharFilter(field_name="title")
+    industry = TrigramCharFilter(field_name="industry__name")
+
+    # Exact industry match on the denormalized column (no join)
+    industry_id = django_filters.NumberFilter(field_name="industry_id")
+    fuzzy = django_filters.BooleanFilter(method="filter_fuzzy", label="Fuzzy text matching")
 
 
     class Meta:
@@ -30,6 +60,30 @@ class JobFilter(django_filters.FilterSet):
             "min_salary",
             "max_salary",
             "title",
-            "industry"
+            "industry",
+            "industry_id",
+            "fuzzy",
         ]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.similarity_terms = []
+
+    @property
+    def fuzzy_enabled(self):
+        return bool(self.form.cleaned_data.get("fuzzy"))
+
+    def filter_fuzzy(self, queryset, name, value):
+        # Flag only: read by the TrigramCharFilter fields.
+        return queryset
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if not self.similarity_terms:
+            return queryset
+
+        # Best fuzzy matches first
+        similarity = sum(
+            TrigramWordSimilarity(value, field_name) for field_name, value in self.similarity_terms
+        )
+        return queryset.annotate(fuzzy_similarity=similarity).order_by("-fuzzy_similarity", "-id")
@@ -0,0 +1,263 @@
+# jobsboard/jobs/importers.py
+import csv
+import io
+import json
+from itertools import islice
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from rest_framework import serializers
+
+from api.cache import bump_namespace
+from companies.models import Company
+from companies.stats import refresh_company_stats
+from .changes import record_job_changes
+from .models import Job, JobSkill
+from .search import update_search_vectors
+from .skills import create_missing_skills
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# Separator for several skills in one CSV cell ("Python; Django")
+CSV_SKILL_SEPARATOR = ";"
+
+
+class JobImportError(Exception):
+    """The file cannot be imported, or read further (unknown format, missing columns, bad encoding)."""
+
+
+# ---------------------------------------------------------
+# JobImportRowSerializer
+# ---------------------------------------------------------
+# Validates one imported row without touching the database.
+# - `company` is the id or name of an existing company, resolved per chunk
+#   by JobImporter.
+# - `description` may be a list of paragraphs or a single string;
+#   `skills` a list of names or a CSV_SKILL_SEPARATOR-separated string.
+class JobImportRowSerializer(serializers.Serializer):
+    title = serializers.CharField(max_length=255)
+    description = serializers.JSONField(required=False)
+    location = serializers.CharField(max_length=255)
+    employment_type = serializers.ChoiceField(choices=Job.EMPLOYMENT_TYPE_CHOICES)
+    work_location_type = serializers.ChoiceField(choices=Job.WORK_LOCATION_TYPE_CHOICES)
+    experience_level = serializers.ChoiceField(choices=Job.EXPERIENCE_LEVEL_CHOICES)
+    status = serializers.ChoiceField(choices=Job.JOB_STATUS_CHOICES, default="open")
+    salary_min = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    salary_max = serializers.DecimalField(max_digits=12, decimal_places=2, required=False)
+    closing_date = serializers.DateTimeField(required=False)
+    publish_at = serializers.DateTimeField(required=False)
+    company = serializers.CharField(max_length=255)
+    skills = serializers.JSONField(required=False)
+
+    def validate_description(self, value):
+        if isinstance(value, str):
+            return [value] if value.strip() else []
+        if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+            raise serializers.ValidationError("Expected a string or a list of strings.")
+        return value
+
+    def validate_skills(self, value):
+        if isinstance(value, str):
+            value = value.split(CSV_SKILL_SEPARATOR)
+        if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+            raise serializers.ValidationError("Expected a list of skill names.")
+        names = list(dict.fromkeys(name.strip() for name in value if name.strip()))
+        too_long = [name for name in names if len(name) > 50]
+        if too_long:
+            raise serializers.ValidationError(f"Skill names too long: {', '.join(too_long)}.")
+        return names
+
+    def validate(self, attrs):
+        salary_min, salary_max = attrs.get("salary_min"), attrs.get("salary_max")
+        if salary_min is not None and salary_max is not None and salary_min > salary_max:
+            raise serializers.ValidationError({"salary_max": "Must be greater than or equal to salary_min."})
+        return attrs
+
+
+# -------------------------
+# Streaming parsers
+# -------------------------
+def _text_stream(stream):
+    """Text view of a binary or text file object, read lazily."""
+    if isinstance(stream, io.TextIOBase):
+        return stream
+    return io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+
+
+def iter_csv_rows(stream):
+    """Yield (line number, row dict) from a CSV file with a header row."""
+    reader = csv.DictReader(_text_stream(stream))
+    missing = {"title", "company"} - set(reader.fieldnames or ())
+    if missing:
+        raise JobImportError(f"Missing CSV columns: {', '.join(sorted(missing))}.")
+    for row in reader:
+        # Empty cells mean "not given"; cells beyond the header are ignored
+        yield reader.line_num, {key: value for key, value in row.items() if key and value not in ("", None)}
+
+
+def iter_ndjson_rows(stream):
+    """Yield (line number, row dict) from a newline-delimited JSON file; blank lines are skipped."""
+    for line_number, line in enumerate(_text_stream(stream), start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield line_number, JobImportError(f"Invalid JSON: {e}")
+            continue
+        if not isinstance(row, dict):
+            yield line_number, JobImportError("Expected a JSON object.")
+            continue
+        yield line_number, row
+
+
+PARSERS = {"csv": iter_csv_rows, "ndjson": iter_ndjson_rows}
+
+
+# ---------------------------------------------------------
+# ImportReport
+# ---------------------------------------------------------
+# Outcome of an import: counts plus per-row errors.
+# - Errors are kept in memory up to `max_errors` (None: no limit); the rest
+#   are only counted, so a huge file full of bad rows stays cheap.
+# - `error_stream`, when given, receives every error as one JSON line.
+class ImportReport:
+    def __init__(self, max_errors=None, error_stream=None):
+        self.max_errors = max_errors
+        self.error_stream = error_stream
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+
+    def add_error(self, line, errors):
+        self.failed += 1
+        entry = {"line": line, "errors": errors}
+        if self.error_stream is not None:
+            self.error_stream.write(json.dumps(entry, default=str) + "\n")
+        if self.max_errors is None or len(self.errors) < self.max_errors:
+            self.errors.append(entry)
+
+    def as_dict(self):
+        return {
+            "created": self.created,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": len(self.errors) < self.failed,
+        }
+
+
+# ---------------------------------------------------------
+# JobImporter
+# ---------------------------------------------------------
+# Streams jobs from a CSV or NDJSON file into the database.
+# - Rows are parsed lazily and handled `chunk_size` at a time, so memory use
+#   does not depend on the file size.
+# - Per chunk: rows are validated without queries, companies and skills
+#   are resolved with one lookup each, and jobs plus their JobSkill links
+#   are written with bulk_create in one transaction.
+# - Companies must exist (they are created through the companies API, which
+#   validates them); `owner` limits them to the ones that user owns.
+# - bulk_create skips Job.save() and signals: the denormalized industry,
+#   search vectors, the match index, company stats and the "jobs" cache
+#   namespace are handled here, for each chunk as it commits.
+# - A file that becomes unreadable midway raises JobImportError; the
+#   chunks before it stay imported and counted in the report.
+class JobImporter:
+    def __init__(self, owner=None, created_by=None, chunk_size=None):
+        self.owner = owner
+        self.created_by = created_by or owner
+        self.chunk_size = chunk_size or settings.JOBS_IMPORT_CHUNK_SIZE
+
+    def run(self, stream, file_format, report=None):
+        if file_format not in PARSERS:
+            raise JobImportError(f"Unknown format {file_format!r}, expected one of: {', '.join(IMPORT_FORMATS)}.")
+        report = report if report is not None else ImportReport()
+        rows = PARSERS[file_format](stream)
+        while True:
+            try:
+                chunk = list(islice(rows, self.chunk_size))
+            except (csv.Error, UnicodeDecodeError) as e:
+                raise JobImportError(f"Cannot read the file: {e}") from e
+            if not chunk:
+                break
+            self.import_chunk(chunk, report)
+        return report
+
+    def import_chunk(self, chunk, report):
+        valid = []
+        for line, data in chunk:
+            if isinstance(data, JobImportError):
+                report.add_error(line, {"non_field_errors": [str(data)]})
+                continue
+            serializer = JobImportRowSerializer(data=data)
+            if serializer.is_valid():
+                valid.append((line, serializer.validated_data))
+            else:
+                report.add_error(line, serializer.errors)
+        if not valid:
+            return
+
+        companies = self.resolve_companies(valid)
+        rows = []
+        for line, data in valid:
+            company = companies.get(data["company"])
+            if isinstance(company, str):
+                report.add_error(line, {"company": [company]})
+            else:
+                rows.append((data, company))
+        if not rows:
+            return
+
+        skills = create_missing_skills(name for data, _ in rows for name in data.get("skills", ()))
+        with transaction.atomic():
+            jobs = Job.objects.bulk_create([self.build_job(data, company) for data, company in rows])
+            JobSkill.objects.bulk_create(
+                [
+                    JobSkill(job=job, skill=skills[name])
+                    for job, (data, _) in zip(jobs, rows)
+                    for name in data.get("skills", ())
+                ],
+                ignore_conflicts=True,
+            )
+            update_search_vectors(Job.objects.filter(pk__in=[job.pk for job in jobs]))
+            record_job_changes(job.pk for job in jobs)
+            refresh_company_stats({job.company_id for job in jobs})
+        # Per chunk: each one is committed on its own, even if a later one fails
+        bump_namespace("jobs", "skill-usage")
+        report.created += len(jobs)
+
+    def build_job(self, data, company):
+        fields = {key: value for key, value in data.items() if key not in ("company", "skills")}
+        return Job(company=company, industry_id=company.industry_id, created_by=self.created_by, **fields)
+
+    def resolve_companies(self, valid):
+        """
+        {company reference: Company or error message} for the chunk's rows,
+        with one company lookup.
+        """
+        refs = {data["company"].strip() for _, data in valid}
+        ids = {int(ref) for ref in refs if ref.isdigit()}
+        names = {ref for ref in refs if not ref.isdigit()}
+
+        queryset = Company.objects.filter(Q(pk__in=ids) | Q(name__in=names)).only("id", "name", "industry_id")
+        if self.owner is not None:
+            queryset = queryset.filter(owner=self.owner)
+        by_id, by_name = {}, {}
+        for company in queryset:
+            by_id[company.pk] = company
+            by_name.setdefault(company.name, []).append(company)
+
+        resolved = {}
+        for ref in refs:
+            if ref.isdigit():
+                resolved[ref] = by_id.get(int(ref), f"Unknown company id {ref}.")
+            elif len(by_name.get(ref, ())) > 1:
+                resolved[ref] = f"Company name {ref!r} is ambiguous, use its id."
+            elif ref in by_name:
+                resolved[ref] = by_name[ref][0]
+            else:
+                resolved[ref] = f"Unknown company {ref!r}."
+
+        # Rows may write the reference with surrounding spaces
+        return {data["company"]: resolved[data["company"].strip()] for _, data in valid}
@@ -0,0 +1,120 @@
+# jobsboard/jobs/management/commands/benchmark_list_serializers.py
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+
+from api.fastpath import FastListSerializer
+from applications.models import Application
+from applications.serializers import ApplicationSerializer
+from companies.models import Company, Industry
+from jobs.models import Job, JobSkill, Skill
+from jobs.serializers import JobSerializer, JOB_LIST_FIELDS
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare ModelSerializer and FastListSerializer on a page of jobs and "
+        "applications (query + serialization), and check the output is byte-identical."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=100, help="Rows per page (default 100)")
+        parser.add_argument("--repeat", type=int, default=20, help="Timed runs per case (default 20)")
+        parser.add_argument(
+            "--create", type=int, default=0,
+            help="Create this many sample jobs/applications first; rolled back afterwards",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if options["create"]:
+                self.create_sample_data(options["create"])
+            self.run(options["rows"], options["repeat"])
+            transaction.set_rollback(True)
+
+    def run(self, rows, repeat):
+        context = {"request": RequestFactory().get("/api/")}
+        cases = [
+            ("jobs (compact list)", JobSerializer, Job.objects.all(), {"fields": JOB_LIST_FIELDS}),
+            ("jobs (all fields)", JobSerializer, Job.objects.select_related("industry").prefetch_related("skills"), {}),
+            (
+                "applications",
+                ApplicationSerializer,
+                Application.objects.select_related("job", "applicant", "reviewed_by").prefetch_related("files"),
+                {},
+            ),
+        ]
+        for label, serializer_class, queryset, kwargs in cases:
+            queryset = queryset.order_by("-id")
+
+            def drf():
+                return serializer_class(list(queryset[:rows]), many=True, context=context, **kwargs).data
+
+            def fast():
+                compiled = FastListSerializer(serializer_class(context=context, **kwargs))
+                return compiled.serialize(compiled.values(queryset)[:rows])
+
+            expected, actual = drf(), fast()
+            if not expected:
+                self.stdout.write(self.style.WARNING(f"{label}: no rows, skipped (use --create)"))
+                continue
+            if JSONRenderer().render(expected) != JSONRenderer().render(actual):
+                raise CommandError(f"{label}: fast path output differs from {serializer_class.__name__}")
+
+            drf_ms = self.time(drf, repeat)
+            fast_ms = self.time(fast, repeat)
+            self.stdout.write(
+                f"{label}: {len(expected)} rows | serializer {drf_ms:.2f} ms | "
+                f"fast path {fast_ms:.2f} ms | {drf_ms / fast_ms:.1f}x"
+            )
+        self.stdout.write(self.style.SUCCESS("Outputs are byte-identical."))
+
+    def time(self, func, repeat):
+        """Median wall time of `func` in milliseconds."""
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    def create_sample_data(self, count):
+        owner = User.objects.create_user(
+            username="benchmark-owner", email="benchmark-owner@example.com", role=User.ROLE_EMPLOYER
+        )
+        seeker = User.objects.create_user(
+            username="benchmark-seeker", email="benchmark-seeker@example.com", role=User.ROLE_SEEKER
+        )
+        company = Company.objects.create(
+            name="Benchmark Co",
+            description="Sample company for benchmarks",
+            industry=Industry.objects.create(name="Benchmarks"),
+            owner=owner,
+        )
+        skills = [Skill.objects.get_or_create(name=f"benchmark-skill-{i}")[0] for i in range(5)]
+        jobs = Job.objects.bulk_create(
+            Job(
+                title=f"Benchmark job {i}",
+                description=["A paragraph of job description text. " * 20] * 5,
+                location="Nairobi",
+                employment_type="full_time",
+                work_location_type="hybrid",
+                experience_level="mid",
+                status="open",
+                salary_min=50000,
+                salary_max=90000,
+                company=company,
+                industry_id=company.industry_id,
+            )
+            for i in range(count)
+        )
+        JobSkill.objects.bulk_create(JobSkill(job=job, skill=skill) for job in jobs for skill in skills)
+        Application.objects.bulk_create(
+            Application(job=job, applicant=seeker, status="pending", cover_letter="Sample cover letter")
+            for job in jobs
+        )
@@ -0,0 +1,22 @@
+# jobsboard/jobs/management/commands/build_similar_jobs_index.py
+from django.core.management.base import BaseCommand
+
+from jobs.similarity import build_index, refresh_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the TF-IDF index behind /api/jobs/{id}/similar/ into "
+        "JOBS_SIMILARITY_INDEX_DIR. Also scheduled as Celery beat tasks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--incremental", action="store_true",
+            help="Only re-vectorize jobs changed since the last run (falls back to a full build when needed)",
+        )
+
+    def handle(self, *args, **options):
+        summary = refresh_index() if options["incremental"] else build_index()
+        kind = "Full build" if summary["full"] else "Incremental update"
+        self.stdout.write(self.style.SUCCESS(f"{kind}: {summary['jobs']} jobs vectorized."))
@@ -0,0 +1,58 @@
+# jobsboard/jobs/management/commands/import_jobs.py
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.importers import IMPORT_FORMATS, ImportReport, JobImportError, JobImporter
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Import jobs from a CSV (with a header row) or NDJSON file. The file is "
+        "streamed and written in chunks; rows that fail validation are reported "
+        "and skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import, or - for standard input")
+        parser.add_argument(
+            "--format", choices=IMPORT_FORMATS,
+            help="File format (default: from the file extension, csv for standard input)",
+        )
+        parser.add_argument(
+            "--owner",
+            help="Only import into companies this user owns",
+        )
+        parser.add_argument("--chunk-size", type=int, help="Rows per batch (default JOBS_IMPORT_CHUNK_SIZE)")
+        parser.add_argument("--report", help="Write row errors to this file, one JSON object per line")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or ("ndjson" if path.endswith((".ndjson", ".jsonl")) else "csv")
+
+        owner = None
+        if options["owner"]:
+            try:
+                owner = User.objects.get(username=options["owner"])
+            except User.DoesNotExist:
+                raise CommandError(f"User {options['owner']} does not exist.")
+
+        # Errors go to the report file (or stderr) as they happen, none are kept in memory
+        error_stream = open(options["report"], "w", encoding="utf-8") if options["report"] else self.stderr
+        report = ImportReport(max_errors=0, error_stream=error_stream)
+        importer = JobImporter(owner=owner, chunk_size=options["chunk_size"])
+        try:
+            if path == "-":
+                importer.run(sys.stdin.buffer, file_format, report)
+            else:
+                with open(path, "rb") as stream:
+                    importer.run(stream, file_format, report)
+        except JobImportError as e:
+            raise CommandError(f"Cannot import {path}: {e} ({report.created} jobs imported before the error)")
+        finally:
+            if options["report"]:
+                error_stream.close()
+
+        style = self.style.SUCCESS if not report.failed else self.style.WARNING
+        self.stdout.write(style(f"Imported {report.created} jobs, {report.failed} rows failed."))
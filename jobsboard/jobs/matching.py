@@ -0,0 +1,201 @@
+# jobsboard/jobs/matching.py
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from .changes import get_job_changes, get_job_changes_version
+from .models import Job, JobSkill, SeekerSkill
+
+EXPERIENCE_RANK = {"entry": 0, "mid": 1, "senior": 2, "lead": 3}
+MAX_EXPERIENCE_GAP = max(EXPERIENCE_RANK.values())
+UNKNOWN_LEVEL = -1
+
+WORD_BITS = 64
+
+
+def _bit_masks(columns):
+    return np.left_shift(np.uint64(1), (columns % WORD_BITS).astype(np.uint64))
+
+
+# One immutable state of the index; writers build a new one and swap it in
+MatchSnapshot = namedtuple(
+    "MatchSnapshot", ("row_of", "column_of", "job_ids", "bits", "skill_counts", "levels", "salary_max", "active")
+)
+
+EMPTY_SNAPSHOT = MatchSnapshot(
+    row_of={},
+    column_of={},
+    job_ids=np.zeros(0, np.int64),
+    bits=np.zeros((0, 1), np.uint64),
+    skill_counts=np.zeros(0, np.int32),
+    levels=np.zeros(0, np.int8),
+    salary_max=np.zeros(0, np.float64),
+    active=np.zeros(0, bool),
+)
+
+
+# ---------------------------------------------------------
+# SkillMatchIndex
+# ---------------------------------------------------------
+# In-memory, per-process arrays describing every open job, for ranking
+# without ORM queries or per-job Python work:
+# - `bits`: one row per job, the job's skill set as a bitset (uint64 words,
+#   one bit per skill column), so overlap with a seeker is AND + popcount.
+# - `skill_counts`, `levels` and `salary_max`: per-job arrays for the
+#   coverage, experience and salary terms of the score.
+# - Kept current incrementally from the job change log (jobs/changes.py):
+#   sync() reloads just the jobs changed since its last version. An unknown
+#   change set or an index older than JOBS_MATCH_INDEX_MAX_AGE triggers a
+#   rebuild (which also drops rows of jobs that stopped being open).
+# - The arrays live in a MatchSnapshot that is never modified: sync()
+#   builds a new one under the lock and swaps it in, and rank() reads the
+#   current one once, so request threads never see a half-applied change.
+class SkillMatchIndex:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        """Forget everything; the next sync() rebuilds."""
+        self.version = None
+        self.built_at = 0.0
+        self.snapshot = EMPTY_SNAPSHOT
+
+    # -------------------------
+    # Loading
+    # -------------------------
+    def sync(self):
+        """Bring the index up to date with the latest recorded job changes."""
+        version = get_job_changes_version()
+        with self.lock:
+            if version == self.version and time.monotonic() - self.built_at < settings.JOBS_MATCH_INDEX_MAX_AGE:
+                return
+            changed = self._pending_changes(version)
+            if changed is None:
+                self._rebuild()
+            else:
+                self._refresh(changed)
+            self.version = version
+
+    def _pending_changes(self, version):
+        if time.monotonic() - self.built_at >= settings.JOBS_MATCH_INDEX_MAX_AGE:
+            return None
+        return get_job_changes(self.version, version)
+
+    def _rebuild(self):
+        jobs = Job.objects.filter(status="open").values_list("id", "experience_level", "salary_max")
+        links = JobSkill.objects.filter(job__status="open").values_list("job_id", "skill_id")
+        self.snapshot = self._load(EMPTY_SNAPSHOT, list(jobs), list(links))
+        self.built_at = time.monotonic()
+
+    def _refresh(self, job_ids):
+        jobs = list(Job.objects.filter(pk__in=job_ids, status="open").values_list("id", "experience_level", "salary_max"))
+        open_ids = {job_id for job_id, _, _ in jobs}
+        links = list(JobSkill.objects.filter(job_id__in=open_ids).values_list("job_id", "skill_id"))
+        # Jobs deleted, closed or drafted keep their row, switched off
+        self.snapshot = self._load(self.snapshot, jobs, links, gone=job_ids - open_ids)
+
+    @staticmethod
+    def _load(snapshot, jobs, links, gone=()):
+        """A new MatchSnapshot: `snapshot` with `jobs` (re)loaded and the `gone` job ids switched off."""
+        row_of = dict(snapshot.row_of)
+        for job_id, _, _ in jobs:
+            row_of.setdefault(job_id, len(row_of))
+        column_of = dict(snapshot.column_of)
+        for _, skill_id in links:
+            column_of.setdefault(skill_id, len(column_of))
+
+        # Copies of the old arrays, grown to the new jobs and skills
+        size, old_size = len(row_of), len(snapshot.job_ids)
+        extra = size - old_size
+        bits = np.zeros((size, max(1, -(-len(column_of) // WORD_BITS))), np.uint64)
+        bits[:old_size, :snapshot.bits.shape[1]] = snapshot.bits
+        job_ids = np.concatenate([snapshot.job_ids, np.zeros(extra, np.int64)])
+        skill_counts = np.concatenate([snapshot.skill_counts, np.zeros(extra, np.int32)])
+        levels = np.concatenate([snapshot.levels, np.full(extra, UNKNOWN_LEVEL, np.int8)])
+        salary_max = np.concatenate([snapshot.salary_max, np.full(extra, np.nan)])
+        active = np.concatenate([snapshot.active, np.zeros(extra, bool)])
+
+        active[[row_of[job_id] for job_id in gone if job_id in row_of]] = False
+        rows = np.fromiter((row_of[job_id] for job_id, _, _ in jobs), np.int64, len(jobs))
+        job_ids[rows] = [job_id for job_id, _, _ in jobs]
+        levels[rows] = [EXPERIENCE_RANK.get(level, UNKNOWN_LEVEL) for _, level, _ in jobs]
+        salary_max[rows] = [np.nan if salary is None else float(salary) for _, _, salary in jobs]
+        active[rows] = True
+        bits[rows] = 0
+        skill_counts[rows] = 0
+
+        link_rows = np.fromiter((row_of[job_id] for job_id, _ in links), np.int64, len(links))
+        columns = np.fromiter((column_of[skill_id] for _, skill_id in links), np.int64, len(links))
+        np.bitwise_or.at(bits, (link_rows, columns // WORD_BITS), _bit_masks(columns))
+        np.add.at(skill_counts, link_rows, 1)
+        return MatchSnapshot(row_of, column_of, job_ids, bits, skill_counts, levels, salary_max, active)
+
+    # -------------------------
+    # Scoring
+    # -------------------------
+    def rank(self, skill_ids, experience_level=None, expected_salary=None, limit=20):
+        """
+        [(job id, score)] for the best `limit` open jobs sharing at least one
+        skill with `skill_ids`, best first. Score, with JOBS_MATCH_WEIGHTS:
+        - skills: share of the job's skills the seeker has
+        - experience: 1 for the same level, down to 0 three levels apart
+        - salary: 1 when salary_max reaches the expected salary, else the ratio
+        Jobs without a level or salary_max get 0.5 for that term.
+        """
+        snapshot = self.snapshot
+        columns = np.array(
+            [snapshot.column_of[skill_id] for skill_id in skill_ids if skill_id in snapshot.column_of], np.int64
+        )
+        if not len(columns) or not len(snapshot.job_ids):
+            return []
+        seeker = np.zeros(snapshot.bits.shape[1], np.uint64)
+        np.bitwise_or.at(seeker, columns // WORD_BITS, _bit_masks(columns))
+
+        weights = settings.JOBS_MATCH_WEIGHTS
+        overlap = np.bitwise_count(snapshot.bits & seeker).sum(axis=1, dtype=np.int32)
+        score = weights["skills"] * overlap / np.maximum(snapshot.skill_counts, 1)
+
+        if experience_level is not None:
+            levels = snapshot.levels
+            gap = np.abs(levels - EXPERIENCE_RANK[experience_level])
+            fit = np.where(levels == UNKNOWN_LEVEL, 0.5, 1 - gap / MAX_EXPERIENCE_GAP)
+            score += weights["experience"] * fit
+        if expected_salary:
+            salary = snapshot.salary_max
+            fit = np.where(np.isnan(salary), 0.5, np.clip(salary / float(expected_salary), 0, 1))
+            score += weights["salary"] * fit
+
+        candidates = np.flatnonzero((overlap > 0) & snapshot.active)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-score[candidates], limit - 1)[:limit]]
+        # Best score first, newest job first on ties
+        order = np.lexsort((-snapshot.job_ids[candidates], -score[candidates]))
+        top = candidates[order]
+        return list(zip(snapshot.job_ids[top].tolist(), score[top].tolist()))
+
+match_index = SkillMatchIndex()
+
+
+def recommend_jobs(user, experience_level=None, expected_salary=None, limit=20):
+    """
+    [(Job, score)] of open jobs matching the user's SeekerSkills, best first.
+    Ranks with the in-memory index, then loads only the top jobs, dropping
+    any that closed since the index last saw them.
+    """
+    match_index.sync()
+    skill_ids = list(SeekerSkill.objects.filter(user=user).values_list("skill_id", flat=True))
+    # Over-fetch so jobs closed in the meantime do not shorten the list
+    ranked = match_index.rank(skill_ids, experience_level, expected_salary, limit=limit * 2)
+    if not ranked:
+        return []
+
+    jobs = Job.objects.filter(pk__in=[job_id for job_id, _ in ranked], status="open").filter(
+        Q(closing_date__isnull=True) | Q(closing_date__gt=timezone.now())
+    ).in_bulk()
+    return [(jobs[job_id], score) for job_id, score in ranked if job_id in jobs][:limit]
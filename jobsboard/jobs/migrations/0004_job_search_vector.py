@@ -0,0 +1,46 @@
+# Generated by Django 4.2 on 2026-10-18 05:05
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+from api.db import AddPostgresIndex
+
+
+def populate_search_vectors(apps, schema_editor):
+    """Backfill the weighted search vector for existing jobs (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    Job = apps.get_model("jobs", "Job")
+    Company = apps.get_model("companies", "Company")
+    company_name = Subquery(Company.objects.filter(pk=OuterRef("company_id")).values("name")[:1])
+    Job.objects.update(
+        search_vector=(
+            SearchVector("title", weight="A", config="english")
+            + SearchVector(company_name, weight="B", config="english")
+            + SearchVector("description", weight="C", config="english")
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0002_initial'),
+        ('jobs', '0003_alter_skill_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        AddPostgresIndex(
+            model_name='job',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='idx_jobs_search_vector'),
+        ),
+        migrations.RunPython(populate_search_vectors, migrations.RunPython.noop),
+    ]
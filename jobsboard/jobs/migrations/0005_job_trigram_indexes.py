@@ -0,0 +1,26 @@
+# Generated by Django 4.2 on 2026-10-18 05:20
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+from api.db import AddPostgresIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_job_search_vector'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddPostgresIndex(
+            model_name='job',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='idx_jobs_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        AddPostgresIndex(
+            model_name='job',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['location'], name='idx_jobs_location_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
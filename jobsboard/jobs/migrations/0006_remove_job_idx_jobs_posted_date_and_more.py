@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-18 05:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_job_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='job',
+            name='idx_jobs_posted_date',
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['posted_date', 'id'], name='idx_jobs_posted_date_id'),
+        ),
+    ]
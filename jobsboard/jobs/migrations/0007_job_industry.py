@@ -0,0 +1,31 @@
+# Generated by Django 4.2 on 2026-10-18 05:11
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+
+def populate_job_industry(apps, schema_editor):
+    """Copy each company's industry onto its jobs."""
+    Job = apps.get_model("jobs", "Job")
+    Company = apps.get_model("companies", "Company")
+    Job.objects.update(
+        industry_id=Subquery(Company.objects.filter(pk=OuterRef("company_id")).values("industry_id")[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0003_industry_name_trigram_index'),
+        ('jobs', '0006_remove_job_idx_jobs_posted_date_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='industry',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='jobs', to='companies.industry'),
+        ),
+        migrations.RunPython(populate_job_industry, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 4.2 on 2026-10-18 05:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_job_industry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='publish_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('status', 'open')), fields=['closing_date'], name='idx_jobs_open_closing'),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('status', 'draft')), fields=['publish_at'], name='idx_jobs_draft_publish'),
+        ),
+    ]
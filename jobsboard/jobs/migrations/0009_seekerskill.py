@@ -0,0 +1,28 @@
+# Generated by Django 4.2 on 2026-10-18 05:37
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('jobs', '0008_job_publish_at_and_schedule_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeekerSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='seeker_skills', to='jobs.skill')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='seeker_skills', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['id'],
+                'unique_together': {('user', 'skill')},
+            },
+        ),
+    ]
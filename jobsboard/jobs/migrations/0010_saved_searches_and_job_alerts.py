@@ -0,0 +1,94 @@
+# Generated by Django 4.2 on 2026-10-18 05:45
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+def mark_existing_jobs_processed(apps, schema_editor):
+    """Jobs posted before saved searches existed must not trigger alerts; drafts still will once published."""
+    Job = apps.get_model("jobs", "Job")
+    Job.objects.exclude(status="draft").update(alerts_processed_at=django.utils.timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('companies', '0003_industry_name_trigram_index'),
+        ('jobs', '0009_seekerskill'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SavedSearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('employment_type', models.CharField(blank=True, choices=[('full_time', 'Full Time'), ('part_time', 'Part Time'), ('contract', 'Contract'), ('internship', 'Internship'), ('temporary', 'Temporary')], max_length=20)),
+                ('work_location_type', models.CharField(blank=True, choices=[('onsite', 'Onsite'), ('remote', 'Remote'), ('hybrid', 'Hybrid')], max_length=20)),
+                ('experience_level', models.CharField(blank=True, choices=[('entry', 'Entry'), ('mid', 'Mid'), ('senior', 'Senior'), ('lead', 'Lead')], max_length=20)),
+                ('title', models.CharField(blank=True, max_length=255)),
+                ('location', models.CharField(blank=True, max_length=255)),
+                ('min_salary', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True)),
+                ('max_salary', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('criteria_count', models.PositiveSmallIntegerField(default=0, editable=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SavedSearchCriterion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(max_length=30)),
+                ('value', models.CharField(max_length=50)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='alerts_processed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(mark_existing_jobs_processed, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('alerts_processed_at__isnull', True), ('status', 'open')), fields=['id'], name='idx_jobs_alert_pending'),
+        ),
+        migrations.AddField(
+            model_name='savedsearchcriterion',
+            name='search',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='criteria', to='jobs.savedsearch'),
+        ),
+        migrations.AddField(
+            model_name='savedsearch',
+            name='industry',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='saved_searches', to='companies.industry'),
+        ),
+        migrations.AddField(
+            model_name='savedsearch',
+            name='skills',
+            field=models.ManyToManyField(blank=True, related_name='saved_searches', to='jobs.skill'),
+        ),
+        migrations.AddField(
+            model_name='savedsearch',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='saved_searches', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='savedsearchcriterion',
+            index=models.Index(fields=['kind', 'value'], name='idx_saved_search_criteria'),
+        ),
+        migrations.AddIndex(
+            model_name='savedsearch',
+            index=models.Index(fields=['user'], name='idx_saved_searches_user'),
+        ),
+        migrations.AddIndex(
+            model_name='savedsearch',
+            index=models.Index(condition=models.Q(('criteria_count', 0), ('is_active', True)), fields=['id'], name='idx_saved_searches_wildcard'),
+        ),
+    ]
@@ -1,5 +1,10 @@
 from django.db import models
+from django.db.models import Q
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+
+from api.tracking import TrackedFieldsMixin
 
 
 # ---------------------------------------------------------
@@ -26,9 +31,21 @@ class Skill(models.Model):
 # - Includes job details like title, description, location, salary, and status.
 # - Supports classification by employment type, work location, and experience level.
 # - Linked to a company and associated with required skills (via JobSkill).
+# - Stores the company's industry directly (`industry`) for join-free filtering.
 # - Tracks metadata such as creator, posting date, and closing date.
-# - Indexed for efficient querying by company, status, and posted date.
-class Job(models.Model):
+# - Open jobs past their closing date are closed, and drafts with a due
+#   `publish_at` are opened, by the periodic task in jobs/tasks.py.
+# - Open jobs not yet matched against saved searches have no
+#   `alerts_processed_at`; jobs/alerts.py picks them up in batches.
+# - Keeps a weighted full-text `search_vector` (title > company name > description),
+#   maintained by signals in jobs/signals.py and GIN-indexed on PostgreSQL.
+# - Indexed for efficient querying by company, industry, status, and posted date.
+# - Title and location carry pg_trgm GIN indexes for fuzzy filtering (see jobs/filters.py).
+# - Remembers its stored status and company (TrackedFieldsMixin) for the
+#   company stats signals.
+class Job(TrackedFieldsMixin, models.Model):
+    tracked_fields = ("status", "company_id")
+
     # Enum choices
     EMPLOYMENT_TYPE_CHOICES = [
         ("full_time", "Full Time"),
@@ -67,12 +84,24 @@ class Job(models.Model):
     salary_max = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True)
     posted_date = models.DateTimeField(auto_now_add=True)
     closing_date = models.DateTimeField(blank=True, null=True)
+    # Draft jobs with a publish time are opened by jobs.tasks.process_job_schedule
+    publish_at = models.DateTimeField(blank=True, null=True)
     status = models.CharField(max_length=20, choices=JOB_STATUS_CHOICES)
     company = models.ForeignKey(
         'companies.Company',
         on_delete=models.CASCADE,
         related_name="jobs"
     )
+    # Denormalized copy of company.industry, kept in sync by save() and
+    # jobs/signals.py, so industry filters and output need no company join.
+    industry = models.ForeignKey(
+        'companies.Industry',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="jobs"
+    )
     skills = models.ManyToManyField(
         "Skill",
         related_name="jobs",
@@ -85,16 +114,32 @@ class Job(models.Model):
         blank=True,
         related_name="created_jobs"
     )
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+    # Set once the job has been matched against saved searches (jobs/alerts.py)
+    alerts_processed_at = models.DateTimeField(null=True, blank=True, editable=False)
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        self.industry_id = self.company.industry_id
+        super().save(*args, **kwargs)
+
     class Meta:
         ordering = ["id"]
         indexes = [
             models.Index(fields=['company'], name='idx_jobs_company'),
             models.Index(fields=['status'], name='idx_jobs_status'),
-            models.Index(fields=['posted_date'], name='idx_jobs_posted_date'),
+            models.Index(fields=['posted_date', 'id'], name='idx_jobs_posted_date_id'),
+            # Partial indexes: only the rows the scheduler can act on
+            models.Index(fields=['closing_date'], name='idx_jobs_open_closing', condition=Q(status='open')),
+            models.Index(fields=['publish_at'], name='idx_jobs_draft_publish', condition=Q(status='draft')),
+            models.Index(
+                fields=['id'], name='idx_jobs_alert_pending', condition=Q(status='open', alerts_processed_at__isnull=True)
+            ),
+            GinIndex(fields=['search_vector'], name='idx_jobs_search_vector'),
+            GinIndex(fields=['title'], name='idx_jobs_title_trgm', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['location'], name='idx_jobs_location_trgm', opclasses=['gin_trgm_ops']),
         ]
 
 
@@ -127,3 +172,103 @@ class JobSkill(models.Model):
 
     def __str__(self):
         return f"{self.job.title} - {self.skill.name}"
+
+
+# ---------------------------------------------------------
+# SeekerSkill Model
+# ---------------------------------------------------------
+# A skill a job seeker has, used to rank open jobs for them
+# (see jobs/matching.py and /api/jobs/recommended/).
+# - Each record links one user with one skill, at most once.
+class SeekerSkill(models.Model):
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='seeker_skills'
+    )
+    skill = models.ForeignKey(
+        'Skill',
+        on_delete=models.CASCADE,
+        related_name='seeker_skills'
+    )
+
+    class Meta:
+        unique_together = ('user', 'skill')
+        ordering = ["id"]
+
+    def __str__(self):
+        return f"{self.user} - {self.skill.name}"
+
+
+
+# ---------------------------------------------------------
+# SavedSearch Model
+# ---------------------------------------------------------
+# A job seeker's saved job filter, alerted about new matching jobs.
+# - Mirrors JobFilter: blank/null criteria match anything; `skills` match
+#   jobs requiring at least one of them; salaries bound salary_min/salary_max.
+# - Discrete criteria (employment type, location type, level, industry,
+#   skills) are also stored as SavedSearchCriterion rows, an inverted index
+#   read by jobs/alerts.py; `criteria_count` is how many of those criteria
+#   kinds a job has to hit.
+class SavedSearch(models.Model):
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='saved_searches'
+    )
+    name = models.CharField(max_length=100)
+    employment_type = models.CharField(max_length=20, choices=Job.EMPLOYMENT_TYPE_CHOICES, blank=True)
+    work_location_type = models.CharField(max_length=20, choices=Job.WORK_LOCATION_TYPE_CHOICES, blank=True)
+    experience_level = models.CharField(max_length=20, choices=Job.EXPERIENCE_LEVEL_CHOICES, blank=True)
+    industry = models.ForeignKey(
+        'companies.Industry',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='saved_searches'
+    )
+    skills = models.ManyToManyField('Skill', blank=True, related_name='saved_searches')
+    title = models.CharField(max_length=255, blank=True)
+    location = models.CharField(max_length=255, blank=True)
+    min_salary = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True)
+    max_salary = models.DecimalField(max_digits=12, decimal_places=2, blank=True, null=True)
+    is_active = models.BooleanField(default=True)
+    criteria_count = models.PositiveSmallIntegerField(default=0, editable=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=['user'], name='idx_saved_searches_user'),
+            # Searches without discrete criteria are checked against every new job
+            models.Index(
+                fields=['id'], name='idx_saved_searches_wildcard', condition=Q(criteria_count=0, is_active=True)
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user} - {self.name}"
+
+
+# ---------------------------------------------------------
+# SavedSearchCriterion Model
+# ---------------------------------------------------------
+# One discrete criterion of a saved search, e.g. ("skill", "12"):
+# the inverted index from job attribute values to saved searches.
+class SavedSearchCriterion(models.Model):
+    search = models.ForeignKey(
+        'SavedSearch',
+        on_delete=models.CASCADE,
+        related_name='criteria'
+    )
+    kind = models.CharField(max_length=30)
+    value = models.CharField(max_length=50)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['kind', 'value'], name='idx_saved_search_criteria'),
+        ]
+
+    def __str__(self):
+        return f"{self.search_id}: {self.kind}={self.value}"
@@ -5,22 +5,22 @@ from users.models import User
 class JobPermission(permissions.BasePermission):
     """
     - Public: can list/retrieve jobs
-    - Job Seeker: can list/retrieve jobs + apply
+    - Job Seeker: can list/retrieve jobs + apply + get recommendations
     - Recruiter/Admin: full access (create, update, delete)
     """
 
     def has_permission(self, request, view):
-        # Everyone can list/retrieve
-        if view.action in ["list", "retrieve"]:
+        # Everyone can list/retrieve, read facet counts, similar jobs and skill suggestions
+        if view.action in ["list", "retrieve", "facets", "similar", "autocomplete"]:
             return True
 
         # Must be authenticated beyond this point
         if not (request.user and request.user.is_authenticated):
             return False
 
-        # Job Seekers: only allowed to 'apply' action
+        # Job Seekers: only allowed to apply and get recommended jobs
         if request.user.role == User.ROLE_SEEKER:
-            return view.action == "apply"
+            return view.action in ["apply", "recommended"]
 
         # Recruiters & Admins: full access
         return request.user.role in [User.ROLE_EMPLOYER, User.ROLE_ADMIN]
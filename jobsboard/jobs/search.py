@@ -0,0 +1,62 @@
+# jobsboard/jobs/search.py
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, OuterRef, Subquery
+from rest_framework import filters
+
+from api.db import is_postgres
+from companies.models import Company
+
+# Text search configuration used for both indexing and querying.
+SEARCH_CONFIG = "english"
+
+
+def job_search_vector():
+    """
+    Weighted search vector for a job row:
+    - A: job title
+    - B: company name
+    - C: description text (JSON list of paragraphs)
+    """
+    company_name = Subquery(
+        Company.objects.filter(pk=OuterRef("company_id")).values("name")[:1]
+    )
+    return (
+        SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector(company_name, weight="B", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def update_search_vectors(queryset):
+    """
+    Recompute `search_vector` for every job in the queryset with a single UPDATE.
+    No-op on databases without full-text search support (e.g. SQLite in tests).
+    Returns the number of rows updated.
+    """
+    if not is_postgres(queryset.db):
+        return 0
+    return queryset.update(search_vector=job_search_vector())
+
+
+# ---------------------------------------------------------
+# JobSearchFilter
+# ---------------------------------------------------------
+# Drop-in replacement for DRF's SearchFilter on the jobs endpoint.
+# - PostgreSQL: matches `?search=` against the GIN-indexed `search_vector`
+#   (websearch syntax: quotes, OR, -exclusions) and orders by relevance.
+# - Other databases: falls back to SearchFilter's icontains over `search_fields`.
+class JobSearchFilter(filters.SearchFilter):
+    def filter_queryset(self, request, queryset, view):
+        if not is_postgres(queryset.db):
+            return super().filter_queryset(request, queryset, view)
+
+        terms = request.query_params.get(self.search_param, "").replace("\x00", "").strip()
+        if not terms:
+            return queryset
+
+        query = SearchQuery(terms, search_type="websearch", config=SEARCH_CONFIG)
+        return (
+            queryset.filter(search_vector=query)
+            .annotate(search_rank=SearchRank(F("search_vector"), query))
+            .order_by("-search_rank", "-posted_date", "-id")
+        )
@@ -1,7 +1,10 @@
 from django.shortcuts import render
 from rest_framework import serializers
 
-from .models import Skill, Job, JobSkill
+from .alerts import index_saved_search
+from .autocomplete import MAX_SUGGESTIONS
+from .models import Skill, Job, JobSkill, SeekerSkill, SavedSearch
+from .skills import find_skills, save_skills, set_job_skills
 
 
 # ---------------------------------------------------------
@@ -16,18 +19,110 @@ class SkillSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
+# ---------------------------------------------------------
+# SkillListField
+# ---------------------------------------------------------
+# Job skills as a list of skill ids on output (unchanged), and a list of
+# skill ids (integers or digit strings) and/or names (strings) on input.
+# - All references are resolved with one query; unknown ids are rejected.
+# - Unknown names come back as unsaved Skill instances, created on save.
+class SkillListField(serializers.ManyRelatedField):
+    def __init__(self, **kwargs):
+        kwargs.setdefault("child_relation", serializers.PrimaryKeyRelatedField(queryset=Skill.objects.all()))
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if isinstance(data, (str, dict)) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+
+        ids, names = [], []
+        for item in data:
+            if isinstance(item, int) and not isinstance(item, bool):
+                ids.append(item)
+            elif isinstance(item, str) and item.strip().isdigit():
+                # Form and multipart posts send ids as strings
+                ids.append(int(item))
+            elif isinstance(item, str) and item.strip():
+                names.append(item.strip())
+            else:
+                raise serializers.ValidationError(f"Invalid skill {item!r}: expected a skill id or name.")
+
+        max_length = Skill._meta.get_field("name").max_length
+        too_long = [name for name in names if len(name) > max_length]
+        if too_long:
+            raise serializers.ValidationError(
+                f"Skill names longer than {max_length} characters: {', '.join(too_long)}."
+            )
+
+        by_id, by_name = find_skills(ids, names)
+        unknown = [pk for pk in ids if pk not in by_id]
+        if unknown:
+            raise serializers.ValidationError(f"Unknown skill ids: {', '.join(map(str, unknown))}.")
+
+        skills = {}
+        for pk in ids:
+            skills.setdefault(pk, by_id[pk])
+        for name in names:
+            skill = by_name.get(name) or Skill(name=name)
+            skills.setdefault(skill.pk or name, skill)
+        return list(skills.values())
+
+
 # ---------------------------------------------------------
 # JobSerializer
 # ---------------------------------------------------------
 # Serializes Job model data.
-# - Includes all job fields from the model.
-# - Adds a read-only `industry` field sourced from the related company's industry.
+# - Includes all job fields from the model, except the internal search
+#   vector and alert bookkeeping.
+# - Adds a read-only `industry` name from the job's denormalized industry
+#   (views select_related("industry"), so no per-row lookups).
+# - Accepts an optional `fields` argument to serialize only a subset of fields
+#   (sparse fieldsets, see JobViewSet and JOB_LIST_FIELDS).
+# - `skills` takes ids and/or names and is saved as one JobSkill diff
+#   (see jobs/skills.py), so the query count does not grow with the list.
 class JobSerializer(serializers.ModelSerializer):
-    industry = serializers.CharField(source="company.industry.name", read_only=True)
+    industry = serializers.CharField(source="industry.name", read_only=True, default=None)
+    skills = SkillListField(required=False)
 
     class Meta:
         model = Job
-        fields = "__all__"
+        exclude = ["search_vector", "alerts_processed_at"]
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    def create(self, validated_data):
+        skills = validated_data.pop("skills", None)
+        job = super().create(validated_data)
+        if skills is not None:
+            set_job_skills(job, save_skills(skills), created=True)
+        return job
+
+    def update(self, instance, validated_data):
+        skills = validated_data.pop("skills", None)
+        job = super().update(instance, validated_data)
+        if skills is not None:
+            set_job_skills(job, save_skills(skills))
+        return job
+
+
+# Compact job representation used by list responses unless `?fields=` is given
+JOB_LIST_FIELDS = (
+    "id",
+    "title",
+    "company",
+    "location",
+    "salary_min",
+    "salary_max",
+    "employment_type",
+    "posted_date",
+)
 
 
 # ---------------------------------------------------------
@@ -45,3 +140,81 @@ class JobSkillSerializer(serializers.ModelSerializer):
         model = JobSkill
         fields = ['id', 'job', 'job_title', 'skill', 'skill_name']
         read_only_fields = ['id', 'job_title', 'skill_name']
+
+
+# ---------------------------------------------------------
+# SeekerSkillSerializer
+# ---------------------------------------------------------
+# Serializes a job seeker's skills (used for job recommendations).
+# - The user is always the requesting seeker, set by the view.
+# - Rejects a skill the seeker already has.
+class SeekerSkillSerializer(serializers.ModelSerializer):
+    skill_name = serializers.CharField(source="skill.name", read_only=True)
+
+    class Meta:
+        model = SeekerSkill
+        fields = ['id', 'skill', 'skill_name']
+        read_only_fields = ['id', 'skill_name']
+
+    def validate_skill(self, value):
+        user = self.context["request"].user
+        if SeekerSkill.objects.filter(user=user, skill=value).exists():
+            raise serializers.ValidationError("You already have this skill.")
+        return value
+
+
+# ---------------------------------------------------------
+# JobRecommendationQuerySerializer
+# ---------------------------------------------------------
+# Validates the query parameters of /api/jobs/recommended/.
+class JobRecommendationQuerySerializer(serializers.Serializer):
+    experience_level = serializers.ChoiceField(choices=Job.EXPERIENCE_LEVEL_CHOICES, required=False)
+    expected_salary = serializers.DecimalField(max_digits=12, decimal_places=2, min_value=0, required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=20)
+
+
+# ---------------------------------------------------------
+# SimilarJobsQuerySerializer
+# ---------------------------------------------------------
+# Validates the query parameters of /api/jobs/{id}/similar/.
+class SimilarJobsQuerySerializer(serializers.Serializer):
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=10)
+
+
+# ---------------------------------------------------------
+# SkillAutocompleteQuerySerializer
+# ---------------------------------------------------------
+# Query parameters of /api/skills/autocomplete/.
+class SkillAutocompleteQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=50, trim_whitespace=False)
+    limit = serializers.IntegerField(min_value=1, max_value=MAX_SUGGESTIONS, default=10)
+
+
+# ---------------------------------------------------------
+# SavedSearchSerializer
+# ---------------------------------------------------------
+# Serializes a seeker's saved job search (alert).
+# - Criteria use the JobFilter names and meanings; blank ones match anything.
+# - `skills` are skill ids; a job needs at least one of them.
+# - Saving re-indexes the search's discrete criteria (jobs/alerts.py).
+class SavedSearchSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SavedSearch
+        fields = [
+            'id', 'name', 'employment_type', 'work_location_type', 'experience_level',
+            'industry', 'skills', 'title', 'location', 'min_salary', 'max_salary',
+            'is_active', 'created_at',
+        ]
+        read_only_fields = ['id', 'created_at']
+
+    def validate(self, attrs):
+        min_salary = attrs.get("min_salary", getattr(self.instance, "min_salary", None))
+        max_salary = attrs.get("max_salary", getattr(self.instance, "max_salary", None))
+        if min_salary is not None and max_salary is not None and min_salary > max_salary:
+            raise serializers.ValidationError({"max_salary": "Must be greater than or equal to min_salary."})
+        return attrs
+
+    def save(self, **kwargs):
+        search = super().save(**kwargs)
+        index_saved_search(search)
+        return search
@@ -0,0 +1,121 @@
+# jobsboard/jobs/signals.py
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from api.cache import bump_namespace
+from companies.models import Company, Industry
+from companies.stats import adjust_company_stats, refresh_company_stats
+from .changes import record_job_changes
+from .models import Job, JobSkill, Skill
+from .search import update_search_vectors
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_search_vector(sender, instance, **kwargs):
+    """
+    After saving a job, rebuild its weighted search vector.
+    Uses a queryset UPDATE, so it does not re-trigger post_save.
+    """
+    update_search_vectors(Job.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=Company)
+def refresh_company_jobs_search_vector(sender, instance, created, **kwargs):
+    """
+    The company name is part of every job's search vector,
+    so refresh all of the company's jobs when it is saved.
+    """
+    if created:
+        return
+    update_search_vectors(Job.objects.filter(company=instance))
+
+
+@receiver(post_save, sender=Company)
+def sync_company_jobs_industry(sender, instance, created, **kwargs):
+    """
+    Keep the denormalized Job.industry in step with the company's industry.
+    A single UPDATE touching only the jobs that are out of date.
+    """
+    if created:
+        return
+    Job.objects.filter(company=instance).exclude(industry_id=instance.industry_id).update(
+        industry_id=instance.industry_id
+    )
+
+
+@receiver([post_save, post_delete], sender=Job)
+@receiver([post_save, post_delete], sender=JobSkill)
+@receiver([post_save, post_delete], sender=Company)
+@receiver([post_save, post_delete], sender=Industry)
+def invalidate_jobs_cache(sender, **kwargs):
+    """
+    Any write that can change a job listing or its facet counts
+    moves the "jobs" cache namespace to a new version.
+    """
+    bump_namespace("jobs")
+
+
+@receiver([post_save, post_delete], sender=Job)
+def refresh_job_match_index(sender, instance, **kwargs):
+    """A job's status, level or salary feed its match score."""
+    record_job_changes([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=JobSkill)
+def refresh_job_skill_match_index(sender, instance, **kwargs):
+    """Reload the job's skill bitset in the match index."""
+    record_job_changes([instance.job_id])
+
+
+@receiver([post_save, post_delete], sender=JobSkill)
+def invalidate_skill_usage(sender, **kwargs):
+    """Job counts per skill rank the autocomplete index (jobs/autocomplete.py)."""
+    bump_namespace("skill-usage")
+
+
+@receiver(post_save, sender=Job)
+def update_company_stats_on_job_save(sender, instance, created, raw=False, **kwargs):
+    """
+    A job opening, closing or changing company moves the open job counters.
+    The stored status and company come from the loaded row (TrackedFieldsMixin).
+    """
+    if raw:
+        return
+    old_company_id = instance.loaded_value("company_id")
+    if not created and old_company_id != instance.company_id:
+        # The job's applications move too: recount both companies
+        refresh_company_stats([old_company_id, instance.company_id])
+        return
+    adjust_company_stats(
+        instance.company_id,
+        open_jobs=(instance.status == "open") - (instance.loaded_value("status") == "open"),
+    )
+
+
+@receiver(post_delete, sender=Job)
+def update_company_stats_on_job_delete(sender, instance, **kwargs):
+    """Deleting an open job lowers the open job counter (its applications signal on their own)."""
+    adjust_company_stats(instance.company_id, open_jobs=-(instance.status == "open"))
+
+
+@receiver([post_save, post_delete], sender=Skill)
+def invalidate_skills_cache(sender, **kwargs):
+    """Skill writes invalidate the cached skill list."""
+    bump_namespace("skills")
+
+
+@receiver(connection_created)
+def set_trigram_threshold(sender, connection, **kwargs):
+    """
+    Apply the fuzzy-filter threshold to every new PostgreSQL connection.
+    The `%>` operator reads this setting, so matching stays index-backed.
+    """
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SET pg_trgm.word_similarity_threshold = %s",
+            [settings.JOBS_TRIGRAM_SIMILARITY_THRESHOLD],
+        )
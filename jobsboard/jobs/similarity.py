@@ -0,0 +1,371 @@
+# jobsboard/jobs/similarity.py
+import fcntl
+import json
+import logging
+import math
+import os
+import re
+import shutil
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from .changes import get_job_changes, get_job_changes_version
+from .models import Job, JobSkill
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or our that the this to we will with you your".split()
+)
+# Title and skill terms count this many times more than description terms
+EMPHASIS = 2
+
+# Jobs read per query while vectorizing
+BATCH_SIZE = 2000
+
+STATE_FILE = "current.json"
+# flock()ed by the writer that owns the index directory
+LOCK_FILE = ".writer.lock"
+SEGMENT_ARRAYS = ("job_ids", "indptr", "indices", "data", "term_indptr", "term_docs", "term_weights")
+
+
+# -------------------------
+# Text -> terms
+# -------------------------
+def tokenize(text):
+    return [token for token in TOKEN_RE.findall(text.lower()) if len(token) > 1 and token not in STOP_WORDS]
+
+
+def job_terms(title, description, skill_names):
+    """Term counts for a job: title and skills weigh EMPHASIS times the description."""
+    if isinstance(description, list):
+        description = " ".join(item for item in description if isinstance(item, str))
+    terms = Counter(tokenize(description or ""))
+    for token in tokenize(" ".join([title or "", *skill_names])):
+        terms[token] += EMPHASIS
+    return terms
+
+
+def iter_job_terms(queryset):
+    """Yield (job id, term counts) for the jobs of `queryset`, two queries per BATCH_SIZE jobs."""
+    rows = queryset.order_by("id").values_list("id", "title", "description").iterator(chunk_size=BATCH_SIZE)
+    while True:
+        batch = list(islice(rows, BATCH_SIZE))
+        if not batch:
+            return
+        skills = {}
+        links = JobSkill.objects.filter(job_id__in=[job_id for job_id, _, _ in batch]).values_list("job_id", "skill__name")
+        for job_id, name in links:
+            skills.setdefault(job_id, []).append(name)
+        for job_id, title, description in batch:
+            yield job_id, job_terms(title, description, skills.get(job_id, ()))
+
+
+def tfidf_vector(terms, vocabulary, idf):
+    """L2-normalized sublinear TF-IDF vector as sorted (columns, weights) arrays."""
+    pairs = sorted(
+        (vocabulary[term], (1 + math.log(count)) * float(idf[vocabulary[term]]))
+        for term, count in terms.items()
+        if term in vocabulary
+    )
+    columns = np.array([column for column, _ in pairs], np.int32)
+    weights = np.array([weight for _, weight in pairs], np.float32)
+    norm = np.linalg.norm(weights)
+    if norm:
+        weights /= norm
+    return columns, weights
+
+
+# ---------------------------------------------------------
+# Segment
+# ---------------------------------------------------------
+# One immutable, memory-mapped slice of the index, stored as .npy files:
+# - rows (CSR: job_ids/indptr/indices/data) to look up a job's own vector;
+# - postings (CSC: term_indptr/term_docs/term_weights) to score every job
+#   against a query vector by walking only the query's terms.
+# - job_ids are sorted, so a job's row is a binary search away.
+class Segment:
+    def __init__(self, path):
+        for name in SEGMENT_ARRAYS:
+            setattr(self, name, np.load(Path(path) / f"{name}.npy", mmap_mode="r"))
+
+    def __len__(self):
+        return len(self.job_ids)
+
+    def row_of(self, job_id):
+        row = int(np.searchsorted(self.job_ids, job_id))
+        if row < len(self.job_ids) and self.job_ids[row] == job_id:
+            return row
+        return None
+
+    def vector(self, row):
+        start, end = self.indptr[row], self.indptr[row + 1]
+        return np.asarray(self.indices[start:end]), np.asarray(self.data[start:end])
+
+    def scores(self, columns, weights):
+        """Dot product of the query vector with every row, from the query terms' postings."""
+        starts = np.asarray(self.term_indptr[columns], np.int64)
+        lengths = np.asarray(self.term_indptr[columns + 1], np.int64) - starts
+        total = int(lengths.sum())
+        if not total:
+            return np.zeros(len(self), np.float32)
+        # Positions of all the postings of all the query terms, in one array
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+        contributions = self.term_weights[positions] * np.repeat(weights, lengths)
+        return np.bincount(self.term_docs[positions], weights=contributions, minlength=len(self))
+
+    @staticmethod
+    def write(path, rows, vocabulary_size):
+        """Write [(job id, columns, weights)] (sorted by job id) as a segment directory."""
+        path = Path(path)
+        path.mkdir(parents=True)
+        lengths = np.array([len(columns) for _, columns, _ in rows], np.int64)
+        indices = np.concatenate([columns for _, columns, _ in rows] or [np.zeros(0, np.int32)]).astype(np.int32)
+        data = np.concatenate([weights for _, _, weights in rows] or [np.zeros(0, np.float32)]).astype(np.float32)
+        nnz_rows = np.repeat(np.arange(len(rows), dtype=np.int32), lengths)
+
+        order = np.argsort(indices, kind="stable")
+        arrays = {
+            "job_ids": np.array([job_id for job_id, _, _ in rows], np.int64),
+            "indptr": np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64),
+            "indices": indices,
+            "data": data,
+            "term_indptr": np.concatenate([[0], np.cumsum(np.bincount(indices, minlength=vocabulary_size))]).astype(np.int64),
+            "term_docs": nnz_rows[order],
+            "term_weights": data[order],
+        }
+        for name, array in arrays.items():
+            np.save(path / f"{name}.npy", array)
+
+
+# ---------------------------------------------------------
+# SimilarJobsIndex
+# ---------------------------------------------------------
+# TF-IDF vectors of open jobs (title, description and skill names) for
+# "similar jobs", built offline into JOBS_SIMILARITY_INDEX_DIR:
+# - `base`: every open job at the last full build, plus the vocabulary
+#   and IDF weights of that build.
+# - `delta`: jobs changed since (from the job change log, jobs/changes.py),
+#   re-vectorized with the base vocabulary; a job with no terms there is
+#   deleted or no longer open. Delta rows replace the job's base row.
+# - `current.json` names the live segments; writers replace it atomically
+#   and readers reload when it changes.
+# - One writer at a time (LOCK_FILE), from reading current.json to
+#   replacing it, so a build and a refresh cannot publish over each other.
+# Request time is a sparse dot product over the postings of the query
+# job's terms; no job text is read.
+class SimilarJobsIndex:
+    def __init__(self, directory, state):
+        directory = Path(directory)
+        self.state = state
+        self.base = Segment(directory / state["base"])
+        self.delta = Segment(directory / state["delta"]) if state.get("delta") else None
+        self.idf = np.load(directory / state["base"] / "idf.npy", mmap_mode="r")
+        with open(directory / state["base"] / "vocabulary.json", encoding="utf-8") as f:
+            self.vocabulary = {term: column for column, term in enumerate(json.load(f))}
+        self.superseded = (
+            np.isin(self.base.job_ids, self.delta.job_ids) if self.delta is not None else np.zeros(len(self.base), bool)
+        )
+
+    def vector_for(self, job):
+        """The job's indexed vector, or one computed from its own text when it is not indexed."""
+        for segment in (self.delta, self.base):
+            row = segment.row_of(job.pk) if segment is not None else None
+            if row is not None:
+                return segment.vector(row)
+        terms = job_terms(job.title, job.description, [skill.name for skill in job.skills.all()])
+        return tfidf_vector(terms, self.vocabulary, self.idf)
+
+    def similar(self, job, limit):
+        """[(job id, cosine similarity)] of the `limit` most similar indexed jobs, best first."""
+        columns, weights = self.vector_for(job)
+        if not len(columns):
+            return []
+        base_scores = np.where(self.superseded, 0, self.base.scores(columns, weights))
+        job_ids, scores = np.asarray(self.base.job_ids), base_scores
+        if self.delta is not None:
+            job_ids = np.concatenate([job_ids, self.delta.job_ids])
+            scores = np.concatenate([scores, self.delta.scores(columns, weights)])
+
+        candidates = np.flatnonzero((scores > 0) & (job_ids != job.pk))
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        top = candidates[np.lexsort((-job_ids[candidates], -scores[candidates]))]
+        return list(zip(job_ids[top].tolist(), scores[top].tolist()))
+
+
+# -------------------------
+# Building
+# -------------------------
+def _index_dir(directory=None):
+    return Path(directory or settings.JOBS_SIMILARITY_INDEX_DIR)
+
+
+def _read_state(directory):
+    try:
+        with open(directory / STATE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+@contextmanager
+def _writer_lock(directory):
+    """Hold the index directory's exclusive writer lock (blocks until the other writer is done)."""
+    with open(directory / LOCK_FILE, "w") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _write_state(directory, state, previous):
+    """
+    Switch readers to the segments named in `state`, then delete the
+    segments of the `previous` state that it no longer names. Call with
+    the writer lock held.
+    """
+    tmp = directory / f".{STATE_FILE}.{os.getpid()}-{time.time_ns()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp, directory / STATE_FILE)
+    # Processes still mapping a removed segment keep reading it until they reload
+    live = (state["base"], state.get("delta"))
+    for name in (previous["base"], previous.get("delta")) if previous else ():
+        if name and name not in live:
+            shutil.rmtree(directory / name, ignore_errors=True)
+
+
+def _segment_name(kind):
+    return f"{kind}-{time.time_ns()}"
+
+
+def build_index(directory=None):
+    """Full rebuild: vocabulary, IDF and vectors of every open job. Returns a summary."""
+    directory = _index_dir(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    with _writer_lock(directory):
+        return _build_index(directory, _read_state(directory))
+
+
+def _build_index(directory, previous):
+    # Read before the jobs: later changes are picked up by refresh_index()
+    version = get_job_changes_version()
+    open_jobs = Job.objects.filter(status="open")
+
+    document_frequency = Counter()
+    count = 0
+    for _, terms in iter_job_terms(open_jobs):
+        document_frequency.update(terms.keys())
+        count += 1
+    vocabulary = [term for term, _ in document_frequency.most_common(settings.JOBS_SIMILARITY_MAX_TERMS)]
+    columns = {term: column for column, term in enumerate(vocabulary)}
+    idf = np.array(
+        [math.log((1 + count) / (1 + document_frequency[term])) + 1 for term in vocabulary], np.float32
+    )
+
+    rows = [(job_id, *tfidf_vector(terms, columns, idf)) for job_id, terms in iter_job_terms(open_jobs)]
+    name = _segment_name("base")
+    Segment.write(directory / name, rows, len(vocabulary))
+    np.save(directory / name / "idf.npy", idf)
+    with open(directory / name / "vocabulary.json", "w", encoding="utf-8") as f:
+        json.dump(vocabulary, f)
+
+    _write_state(directory, {"base": name, "delta": None, "changes_version": version}, previous)
+    logger.info(f"Similar jobs index built: {len(rows)} jobs, {len(vocabulary)} terms")
+    return {"full": True, "jobs": len(rows)}
+
+
+def refresh_index(directory=None):
+    """
+    Apply the job change log to the delta segment, or rebuild when there is
+    no index, the changes are unknown, or the delta grew past
+    JOBS_SIMILARITY_MAX_DELTA jobs. Returns a summary.
+    """
+    directory = _index_dir(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    with _writer_lock(directory):
+        state = _read_state(directory)
+        if state is None:
+            return _build_index(directory, state)
+        version = get_job_changes_version()
+        changed = get_job_changes(state["changes_version"], version)
+        if changed is None:
+            return _build_index(directory, state)
+        if not changed:
+            if version != state["changes_version"]:
+                _write_state(directory, {**state, "changes_version": version}, state)
+            return {"full": False, "jobs": 0}
+
+        index = SimilarJobsIndex(directory, state)
+        job_ids = changed | (set(index.delta.job_ids.tolist()) if index.delta is not None else set())
+        if len(job_ids) > settings.JOBS_SIMILARITY_MAX_DELTA:
+            return _build_index(directory, state)
+
+        vectors = {
+            job_id: tfidf_vector(terms, index.vocabulary, index.idf)
+            for job_id, terms in iter_job_terms(Job.objects.filter(pk__in=job_ids, status="open"))
+        }
+        empty = (np.zeros(0, np.int32), np.zeros(0, np.float32))
+        rows = [(job_id, *vectors.get(job_id, empty)) for job_id in sorted(job_ids)]
+        name = _segment_name("delta")
+        Segment.write(directory / name, rows, len(index.vocabulary))
+
+        _write_state(directory, {**state, "delta": name, "changes_version": version}, state)
+    logger.info(f"Similar jobs index refreshed: {len(changed)} changed jobs, {len(rows)} in delta")
+    return {"full": False, "jobs": len(changed)}
+
+
+# -------------------------
+# Reading
+# -------------------------
+_loaded = {}
+_lock = threading.Lock()
+
+
+def load_index(directory=None):
+    """The live SimilarJobsIndex of this process, reloaded when current.json changes; None before the first build."""
+    directory = _index_dir(directory)
+    try:
+        stat = os.stat(directory / STATE_FILE)
+    except FileNotFoundError:
+        return None
+    # current.json is replaced, never rewritten in place: a new inode means a new state
+    stamp = (stat.st_ino, stat.st_mtime_ns)
+    with _lock:
+        cached = _loaded.get(directory)
+        if cached is None or cached[0] != stamp:
+            state = _read_state(directory)
+            if state is None:
+                return None
+            cached = _loaded[directory] = (stamp, SimilarJobsIndex(directory, state))
+        return cached[1]
+
+
+def similar_jobs(job, limit=10):
+    """
+    [(Job, similarity)] of open jobs most similar to `job`, best first.
+    Loads only the top jobs, dropping any that closed since the last refresh.
+    """
+    index = load_index()
+    if index is None:
+        logger.warning("Similar jobs requested before the index was built (manage.py build_similar_jobs_index)")
+        return []
+    ranked = index.similar(job, limit * 2)
+    if not ranked:
+        return []
+    jobs = Job.objects.filter(pk__in=[job_id for job_id, _ in ranked], status="open").filter(
+        Q(closing_date__isnull=True) | Q(closing_date__gt=timezone.now())
+    ).in_bulk()
+    return [(jobs[job_id], score) for job_id, score in ranked if job_id in jobs][:limit]
@@ -0,0 +1,68 @@
+# jobsboard/jobs/skills.py
+from django.db.models import Q
+
+from api.cache import bump_namespace
+from .changes import record_job_changes
+from .models import JobSkill, Skill
+
+
+def find_skills(ids=(), names=()):
+    """
+    Look up skills by id and by exact name in a single query.
+    Returns ({id: Skill}, {name: Skill}).
+    """
+    ids, names = set(ids), set(names)
+    if not ids and not names:
+        return {}, {}
+    found = list(Skill.objects.filter(Q(pk__in=ids) | Q(name__in=names)))
+    return {skill.pk: skill for skill in found}, {skill.name: skill for skill in found}
+
+
+def create_missing_skills(names):
+    """
+    Return {name: Skill} for `names`, creating the ones that do not exist.
+    At most one INSERT and one SELECT, whatever the number of names.
+    """
+    names = set(names)
+    if not names:
+        return {}
+    _, existing = find_skills(names=names)
+    missing = names - set(existing)
+    if not missing:
+        return existing
+
+    # ignore_conflicts: another request may create the same name concurrently
+    Skill.objects.bulk_create([Skill(name=name) for name in missing], ignore_conflicts=True)
+    bump_namespace("skills")
+    _, skills = find_skills(names=names)
+    return skills
+
+
+def save_skills(skills):
+    """Persist unsaved Skill instances (new names) from SkillListField, keeping order."""
+    created = create_missing_skills(skill.name for skill in skills if skill.pk is None)
+    return [skill if skill.pk is not None else created[skill.name] for skill in skills]
+
+
+def set_job_skills(job, skills, created=False):
+    """
+    Make `skills` the job's exact skill set as one diff:
+    bulk-insert missing JobSkill rows and bulk-delete removed ones.
+    Pass created=True for a new job to skip reading its (empty) current set.
+    """
+    wanted = {skill.pk for skill in skills}
+    current = set() if created else set(JobSkill.objects.filter(job=job).values_list("skill_id", flat=True))
+
+    to_add = wanted - current
+    to_remove = current - wanted
+    if to_add:
+        JobSkill.objects.bulk_create(
+            [JobSkill(job=job, skill_id=skill_id) for skill_id in sorted(to_add)],
+            ignore_conflicts=True,
+        )
+    if to_remove:
+        JobSkill.objects.filter(job=job, skill_id__in=to_remove).delete()
+    if to_add:
+        # bulk_create bypasses the JobSkill post_save signals
+        bump_namespace("jobs", "skill-usage")
+        record_job_changes([job.pk])
@@ -0,0 +1,92 @@
+# jobsboard/jobs/tasks.py
+import logging
+
+from celery import shared_task
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+
+from api.cache import bump_namespace
+from companies.stats import refresh_company_stats
+from .alerts import process_job_alerts
+from .changes import record_job_changes
+from .models import Job
+from .similarity import build_index, refresh_index
+
+logger = logging.getLogger(__name__)
+
+
+def _update_in_batches(queryset, order_by, batch_size, **changes):
+    """
+    Apply `changes` to every row of `queryset` with one short UPDATE per batch.
+    Each batch selects due ids through the matching partial index, so only
+    due rows are read and locked, then recounts the stats of the batch's
+    companies and records the batch in the job change log, so the derived
+    indexes update just those jobs. Returns the number of rows updated.
+    """
+    total = 0
+    while True:
+        rows = list(queryset.order_by(order_by).values_list("id", "company_id")[:batch_size])
+        if not rows:
+            return total
+        ids = [job_id for job_id, _ in rows]
+        # Re-apply the filter so rows changed since the SELECT are left alone
+        total += queryset.filter(id__in=ids).update(**changes)
+        refresh_company_stats({company_id for _, company_id in rows})
+        record_job_changes(ids)
+        if len(ids) < batch_size:
+            return total
+
+
+def close_expired_jobs(now, batch_size):
+    """Close open jobs whose closing date has passed."""
+    due = Job.objects.filter(status="open", closing_date__lte=now)
+    return _update_in_batches(due, "closing_date", batch_size, status="closed")
+
+
+def publish_scheduled_jobs(now, batch_size):
+    """Open draft jobs whose publish time has come; they are listed as posted then."""
+    due = Job.objects.filter(status="draft", publish_at__lte=now)
+    return _update_in_batches(due, "publish_at", batch_size, status="open", posted_date=F("publish_at"))
+
+
+@shared_task
+def process_job_schedule(batch_size=None):
+    """
+    Periodic task (see api/celery.py): publish due drafts, then close
+    expired jobs. Set-based UPDATEs do not send post_save, so the jobs
+    cache namespace is bumped here (and the changed jobs recorded per batch).
+    """
+    batch_size = batch_size or settings.JOBS_SCHEDULE_BATCH_SIZE
+    now = timezone.now()
+    published = publish_scheduled_jobs(now, batch_size)
+    closed = close_expired_jobs(now, batch_size)
+
+    if published or closed:
+        bump_namespace("jobs")
+        logger.info(f"Job schedule: published {published}, closed {closed}")
+    return {"published": published, "closed": closed}
+
+
+@shared_task
+def build_similar_jobs_index():
+    """Periodic task (see api/celery.py): rebuild the similar-jobs index from scratch."""
+    return build_index()
+
+
+@shared_task
+def refresh_similar_jobs_index():
+    """
+    Periodic task (see api/celery.py): re-vectorize the jobs changed since
+    the last run into the index's delta segment (or rebuild when needed).
+    """
+    return refresh_index()
+
+
+@shared_task
+def send_job_alerts(batch_size=None):
+    """
+    Periodic task (see api/celery.py): match newly opened jobs against saved
+    searches, one batch of jobs at a time, and notify the seekers.
+    """
+    return process_job_alerts(batch_size or settings.JOBS_ALERT_BATCH_SIZE)
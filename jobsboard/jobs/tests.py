@@ -1,11 +1,43 @@
 # jobsboard/jobs/tests.py
+import csv
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+from datetime import timedelta
+from pathlib import Path
+from unittest import skipUnless
+from unittest.mock import patch
+
+import numpy as np
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from django.urls import reverse
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from rest_framework.test import APIClient
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from django.contrib.auth import get_user_model
+from api.cache import get_namespace_version
+from api.testing import FastListAssertionsMixin, QueryBudgetMixin
 from companies.models import Company, Industry
-from jobs.models import Job, Skill, JobSkill
+from jobs.models import Job, Skill, JobSkill, SeekerSkill, SavedSearch
+from jobs.alerts import index_saved_search
+from jobs.autocomplete import skill_index
+from jobs.importers import JobImporter
+from jobs.matching import match_index
+from jobs import similarity
+from jobs.changes import _record_job_changes, get_job_changes, get_job_changes_version
+from jobs.similarity import build_index, load_index, refresh_index
+from jobs.serializers import JobSerializer, JOB_LIST_FIELDS
+from jobs.tasks import process_job_schedule, send_job_alerts
+from notifications.models import Notification
 
 User = get_user_model()
 
@@ -73,6 +105,153 @@ class JobAPITestCase(TestCase):
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+    def test_filter_jobs_by_industry(self):
+        """Industry filters use the job's own industry column"""
+        other = Industry.objects.create(name="Finance")
+        for params in ({"industry": "health"}, {"industry_id": self.industry.id}):
+            response = self.client.get(reverse("job-list"), {**params, "fields": "id,industry"})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual([job["id"] for job in response.data["results"]], [self.job.id])
+            self.assertEqual(response.data["results"][0]["industry"], "Healthcare")
+
+        response = self.client.get(reverse("job-list"), {"industry_id": other.id})
+        self.assertEqual(response.data["count"], 0)
+
+    def test_company_industry_change_updates_jobs(self):
+        """Moving a company to another industry moves its jobs too"""
+        other = Industry.objects.create(name="Finance")
+        self.company.industry = other
+        self.company.save()
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.industry_id, other.id)
+
+    def test_list_jobs_cached_until_write(self):
+        """Job list pages come from cache until a job is saved"""
+        url = reverse("job-list")
+        self.client.get(url, {"page": 1, "status": ""})
+        with self.assertNumQueries(0):
+            response = self.client.get(url, {"status": "", "page": 1})
+        self.assertEqual(response.data["count"], 1)
+
+        self.job.title = "Renamed Job"
+        self.job.save()
+        response = self.client.get(url, {"page": 1})
+        self.assertEqual(response.data["results"][0]["title"], "Renamed Job")
+
+    def test_list_jobs_conditional_get(self):
+        """A matching If-None-Match gets 304 without touching the database"""
+        url = reverse("job-list")
+        etag = self.client.get(url)["ETag"]
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+        self.job.status = "closed"
+        self.job.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_jobs_compact_by_default(self):
+        """Lists ship the compact representation and never load descriptions"""
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse("job-list"))
+        self.assertEqual(
+            set(response.data["results"][0]),
+            {"id", "title", "company", "location", "salary_min", "salary_max", "employment_type", "posted_date"},
+        )
+        self.assertFalse(any('"description"' in query["sql"] for query in context.captured_queries))
+
+    def test_retrieve_job_full_by_default(self):
+        """The detail endpoint keeps the full payload"""
+        response = self.client.get(reverse("job-detail", args=[self.job.id]))
+        self.assertEqual(response.data["description"], "Test job description")
+        self.assertEqual(response.data["industry"], "Healthcare")
+        self.assertIn("skills", response.data)
+
+    def test_sparse_fieldsets(self):
+        """?fields= selects the serialized fields; unknown names are rejected"""
+        response = self.client.get(reverse("job-list"), {"fields": "id,description"})
+        self.assertEqual(response.data["results"], [{"id": self.job.id, "description": "Test job description"}])
+
+        response = self.client.get(reverse("job-detail", args=[self.job.id]), {"fields": "title"})
+        self.assertEqual(response.data, {"title": "Test Job"})
+
+        response = self.client.get(reverse("job-list"), {"fields": "id,search_vector"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def create_more_jobs(self, count):
+        for i in range(count):
+            Job.objects.create(
+                title=f"Extra Job {i}",
+                description="Extra job description",
+                company=self.company,
+                employment_type="full_time",
+                location="Remote",
+            )
+
+    def test_list_jobs_page_number_by_default(self):
+        """Old clients keep page-number pagination with a total count"""
+        self.create_more_jobs(11)
+        response = self.client.get(reverse("job-list"), {"page": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 12)
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_list_jobs_exact_count_on_small_tables(self):
+        response = self.client.get(reverse("job-list"))
+        self.assertEqual(response.data["count"], 1)
+        self.assertFalse(response.data["count_is_estimate"])
+
+    @skipUnless(connection.vendor == "postgresql", "row estimates require PostgreSQL")
+    @override_settings(API_ESTIMATED_COUNT_THRESHOLD=5)
+    def test_list_jobs_estimated_count_on_large_tables(self):
+        """Past the threshold the planner's estimate replaces COUNT(*), unless the filter is selective"""
+        self.create_more_jobs(11)
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {Job._meta.db_table}")
+
+        response = self.client.get(reverse("job-list"))
+        self.assertTrue(response.data["count_is_estimate"])
+        self.assertEqual(response.data["count"], 12)
+        # The size check is the only query besides the page itself
+        self.assertEqual(len(self.captured_list_queries()), 2)
+
+        response = self.client.get(reverse("job-list"), {"employment_type": "full_time"})
+        self.assertTrue(response.data["count_is_estimate"])
+
+        response = self.client.get(reverse("job-list"), {"min_salary": 40000})
+        self.assertFalse(response.data["count_is_estimate"])
+        self.assertEqual(response.data["count"], 1)
+
+        # Pages past an estimate are served rather than rejected
+        response = self.client.get(reverse("job-list"), {"page": 3})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [])
+        self.assertIsNone(response.data["next"])
+
+    def captured_list_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            self.client.get(reverse("job-list"), {"page": 2})
+        return context.captured_queries
+
+    def test_list_jobs_cursor_pagination(self):
+        """?pagination=cursor walks every job newest first, without a count"""
+        self.create_more_jobs(11)
+        response = self.client.get(reverse("job-list"), {"pagination": "cursor"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+
+        seen = [job["id"] for job in response.data["results"]]
+        response = self.client.get(response.data["next"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        seen += [job["id"] for job in response.data["results"]]
+
+        self.assertIsNone(response.data["next"])
+        expected = Job.objects.order_by("-posted_date", "-id").values_list("id", flat=True)
+        self.assertEqual(seen, list(expected))
+
 
 class JobSkillAPITestCase(TestCase):
     def setUp(self):
@@ -116,8 +295,1052 @@ class JobSkillAPITestCase(TestCase):
             skill=self.skill
         )
 
+    def test_list_skills_cached_until_write(self):
+        """Skill list is served from cache and refreshed after a skill write"""
+        self.client.get(reverse("skill-list"))
+        with self.assertNumQueries(0):
+            self.client.get(reverse("skill-list"))
+
+        Skill.objects.create(name="Rust")
+        response = self.client.get(reverse("skill-list"))
+        self.assertEqual(response.data["count"], 2)
+
     def test_list_job_skills(self):
         """Anyone (public) can list job skills"""
         response = self.client.get(reverse("jobskill-list"))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertGreaterEqual(len(response.data), 1)
+
+
+class JobQueryBudgetTestCase(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.owner = User.objects.create_user(
+            username="budgetowner",
+            email="budgetowner@example.com",
+            password="testpass123",
+            role=User.ROLE_EMPLOYER,
+        )
+        self.company = Company.objects.create(
+            name="Budget Company",
+            description="Budget company description",
+            industry=Industry.objects.create(name="IT"),
+            owner=self.owner,
+        )
+        self.skills = [Skill.objects.create(name=name) for name in ("Python", "Django")]
+        self.add_jobs(1)
+
+    def add_jobs(self, count):
+        for i in range(count):
+            job = Job.objects.create(
+                title=f"Budget Job {i}",
+                description="Budget job description",
+                company=self.company,
+                employment_type="full_time",
+                location="Remote",
+            )
+            for skill in self.skills:
+                JobSkill.objects.create(job=job, skill=skill)
+
+    def test_job_list_query_budget(self):
+        """Count, page and one skills prefetch, whatever the page size"""
+        self.assertQueryBudget(reverse("job-list"), 3, self.add_jobs)
+
+    def test_job_skill_list_query_budget(self):
+        """Job titles and skill names come from a single joined query"""
+        self.client.force_authenticate(user=self.owner)
+        # count + page + request log
+        self.assertQueryBudget(reverse("jobskill-list"), 3, self.add_jobs)
+
+
+class JobSkillsWriteTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.employer = User.objects.create_user(
+            username="skillsemployer",
+            email="skillsemployer@example.com",
+            password="testpass123",
+            role=User.ROLE_EMPLOYER,
+        )
+        self.company = Company.objects.create(
+            name="Skills Company",
+            description="Skills company description",
+            industry=Industry.objects.create(name="IT"),
+            owner=self.employer,
+        )
+        self.python = Skill.objects.create(name="Python")
+        self.django = Skill.objects.create(name="Django")
+        self.client.force_authenticate(user=self.employer)
+
+    def create_job(self, skills):
+        return self.client.post(reverse("job-list"), {
+            "title": "Backend Engineer",
+            "description": ["Build APIs"],
+            "location": "Nairobi",
+            "employment_type": "full_time",
+            "work_location_type": "remote",
+            "experience_level": "mid",
+            "status": "open",
+            "company": self.company.id,
+            "skills": skills,
+        }, format="json")
+
+    def test_create_job_with_skill_ids_and_names(self):
+        """Skills can be given by id or name; new names become skills"""
+        response = self.create_job([self.python.id, "Django", "Kubernetes", "Django"])
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+
+        kubernetes = Skill.objects.get(name="Kubernetes")
+        # Output stays a list of ids (ordered by skill name)
+        self.assertEqual(response.data["skills"], [self.django.id, kubernetes.id, self.python.id])
+        job = Job.objects.get(pk=response.data["id"])
+        self.assertEqual(set(job.skills.values_list("name", flat=True)), {"Python", "Django", "Kubernetes"})
+
+    def test_create_job_query_count_is_constant(self):
+        """Creating a job costs the same queries for 2 or 12 skills"""
+        with CaptureQueriesContext(connection) as few:
+            self.create_job([self.python.id, "Go"])
+        with CaptureQueriesContext(connection) as many:
+            self.create_job([self.python.id, self.django.id] + [f"Skill {i}" for i in range(10)])
+        self.assertEqual(len(few), len(many))
+
+    def test_update_job_skills_as_diff(self):
+        """PATCHing skills adds and removes only the difference"""
+        job_id = self.create_job([self.python.id, self.django.id]).data["id"]
+        kept = JobSkill.objects.get(job_id=job_id, skill=self.python)
+
+        response = self.client.patch(
+            reverse("job-detail", args=[job_id]), {"skills": ["Python", "Rust"]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(
+            set(JobSkill.objects.filter(job_id=job_id).values_list("skill__name", flat=True)), {"Python", "Rust"}
+        )
+        self.assertTrue(JobSkill.objects.filter(pk=kept.pk).exists())
+
+    def test_unknown_skill_id_rejected(self):
+        response = self.create_job([999999])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("skills", response.data)
+
+    def test_digit_strings_are_skill_ids(self):
+        """Form posts send ids as strings: they link the skill instead of naming a new one"""
+        response = self.create_job([str(self.python.id), f" {self.django.id} "])
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        self.assertEqual(set(response.data["skills"]), {self.python.id, self.django.id})
+        self.assertEqual(Skill.objects.count(), 2)
+
+    def test_too_long_skill_name_rejected(self):
+        response = self.create_job(["x" * 51])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("skills", response.data)
+        self.assertFalse(Skill.objects.filter(name__startswith="xxx").exists())
+
+
+class JobFastListTestCase(FastListAssertionsMixin, TestCase):
+    def setUp(self):
+        owner = User.objects.create_user(
+            username="fastowner",
+            email="fastowner@example.com",
+            password="testpass123",
+            role=User.ROLE_EMPLOYER,
+        )
+        company = Company.objects.create(
+            name="Fast Company",
+            description="Fast company description",
+            industry=Industry.objects.create(name="IT"),
+            owner=owner,
+        )
+        skills = [Skill.objects.create(name=name) for name in ("Rust", "Django", "Python")]
+        job = Job.objects.create(
+            title="Fast Job",
+            description=["First paragraph", "Second paragraph"],
+            company=company,
+            employment_type="full_time",
+            work_location_type="remote",
+            experience_level="senior",
+            status="open",
+            location="Remote",
+            salary_min=50000,
+            salary_max=100000.5,
+            created_by=owner,
+        )
+        for skill in skills:
+            JobSkill.objects.create(job=job, skill=skill)
+        Job.objects.create(title="Bare Job", description=None, company=company, location="Nairobi")
+
+    def test_fast_list_matches_job_serializer(self):
+        """Full and compact job representations are byte-identical"""
+        queryset = Job.objects.all()
+        self.assertFastListIdentical(JobSerializer, queryset)
+        self.assertFastListIdentical(JobSerializer, queryset, fields=JOB_LIST_FIELDS)
+
+    def test_fast_list_endpoint_matches_serializer(self):
+        """The list endpoint renders the same bytes as the DRF serializer"""
+        response = self.client.get(reverse("job-list"), {"fields": ",".join(JobSerializer().fields)})
+        expected = JobSerializer(Job.objects.all(), many=True).data
+        self.assertEqual(response.content, JSONRenderer().render({
+            "count": 2, "count_is_estimate": False, "next": None, "previous": None, "results": expected,
+        }))
+
+
+class JobScheduleTestCase(TestCase):
+    def setUp(self):
+        owner = User.objects.create_user(
+            username="scheduleowner",
+            email="scheduleowner@example.com",
+            password="testpass123",
+            role=User.ROLE_EMPLOYER,
+        )
+        self.company = Company.objects.create(
+            name="Schedule Company",
+            description="Schedule company description",
+            industry=Industry.objects.create(name="IT"),
+            owner=owner,
+        )
+        now = timezone.now()
+        self.expired = [self.create_job("open", closing_date=now - timedelta(days=i + 1)) for i in range(3)]
+        self.running = self.create_job("open", closing_date=now + timedelta(days=1))
+        self.due_draft = self.create_job("draft", publish_at=now - timedelta(minutes=5))
+        self.future_draft = self.create_job("draft", publish_at=now + timedelta(days=1))
+        self.plain_draft = self.create_job("draft")
+
+    def create_job(self, status, **dates):
+        return Job.objects.create(
+            title="Scheduled Job",
+            description="Scheduled job description",
+            company=self.company,
+            location="Remote",
+            status=status,
+            **dates,
+        )
+
+    def status_of(self, job):
+        job.refresh_from_db()
+        return job.status
+
+    def test_closes_expired_and_publishes_due_jobs(self):
+        """Only due rows change, in batches smaller than the backlog"""
+        result = process_job_schedule(batch_size=2)
+        self.assertEqual(result, {"published": 1, "closed": 3})
+
+        self.assertEqual([self.status_of(job) for job in self.expired], ["closed"] * 3)
+        self.assertEqual(self.status_of(self.running), "open")
+        self.assertEqual(self.status_of(self.due_draft), "open")
+        self.assertEqual(self.due_draft.posted_date, self.due_draft.publish_at)
+        self.assertEqual(self.status_of(self.future_draft), "draft")
+        self.assertEqual(self.status_of(self.plain_draft), "draft")
+
+    def test_changed_jobs_are_recorded_for_incremental_indexes(self):
+        """The scheduler logs the ids it changed instead of forcing index rebuilds"""
+        version = get_job_changes_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            process_job_schedule(batch_size=2)
+        changed = get_job_changes(version, get_job_changes_version())
+        self.assertEqual(changed, {job.id for job in self.expired} | {self.due_draft.id})
+
+    def test_nothing_due_is_a_noop(self):
+        process_job_schedule()
+        self.assertEqual(process_job_schedule(), {"published": 0, "closed": 0})
+
+
+class JobImportTestCase(TestCase):
+    CSV_HEADER = "title,company,industry,location,employment_type,work_location_type,experience_level,skills\n"
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("job-import-jobs")
+        self.employer = User.objects.create_user(
+            username="importemployer",
+            email="importemployer@example.com",
+            password="testpass123",
+            role=User.ROLE_EMPLOYER,
+        )
+        self.industry = Industry.objects.create(name="IT")
+        self.company = Company.objects.create(
+            name="Import Company",
+            description="Import company description",
+            industry=self.industry,
+            owner=self.employer,
+        )
+        Skill.objects.create(name="Python")
+
+    def csv_rows(self, count, company="Import Company"):
+        return "".join(
+            f"Job {i},{company},,Nairobi,full_time,remote,mid,Python; Django\n" for i in range(count)
+        )
+
+    def upload(self, content, name="jobs.csv", **data):
+        file = SimpleUploadedFile(name, content.encode("utf-8"))
+        return self.client.post(self.url, {"file": file, **data}, format="multipart")
+
+    def test_csv_import_creates_jobs_and_skills_in_chunks(self):
+        """Queries depend on the number of chunks, not rows"""
+        Skill.objects.create(name="Django")
+        content = self.CSV_HEADER + self.csv_rows(10)
+        with CaptureQueriesContext(connection) as ten_rows:
+            JobImporter(owner=self.employer, chunk_size=5).run(io.BytesIO(content.encode()), "csv")
+        content = self.CSV_HEADER + self.csv_rows(30)
+        with CaptureQueriesContext(connection) as thirty_rows:
+            report = JobImporter(owner=self.employer, chunk_size=15).run(io.BytesIO(content.encode()), "csv")
+
+        self.assertEqual((report.created, report.failed), (30, 0))
+        self.assertEqual(len(thirty_rows), len(ten_rows))
+        self.assertEqual(Job.objects.count(), 40)
+        job = Job.objects.filter(title="Job 3").first()
+        self.assertEqual(job.industry_id, self.industry.id)
+        self.assertEqual(job.created_by, self.employer)
+        self.assertCountEqual(job.skills.values_list("name", flat=True), ["Python", "Django"])
+
+    def test_new_skills_are_created_once(self):
+        content = self.CSV_HEADER + self.csv_rows(4)
+        JobImporter(owner=self.employer, chunk_size=2).run(io.BytesIO(content.encode()), "csv")
+        self.assertEqual(Skill.objects.filter(name="Django").count(), 1)
+        self.assertEqual(JobSkill.objects.filter(skill__name="Django").count(), 4)
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        content = (
+            self.CSV_HEADER
+            + self.csv_rows(2)
+            + "Bad,Import Company,,Nairobi,weekends,remote,mid,\n"
+            + "Orphan,Unknown Co,,Nairobi,full_time,remote,mid,\n"
+        )
+        self.client.force_authenticate(user=self.employer)
+        response = self.upload(content)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual((response.data["created"], response.data["failed"]), (2, 2))
+        errors = {error["line"]: error["errors"] for error in response.data["errors"]}
+        self.assertIn("employment_type", errors[4])
+        self.assertIn("company", errors[5])
+
+    def test_employer_imports_only_into_own_companies(self):
+        """Other owners' companies and unknown names are reported, not created"""
+        other = User.objects.create_user(
+            username="otherowner", email="otherowner@example.com", password="testpass123", role=User.ROLE_EMPLOYER
+        )
+        foreign = Company.objects.create(
+            name="Foreign Co", description="Foreign company description", industry=self.industry, owner=other
+        )
+        rows = [
+            {"title": "Foreign", "company": str(foreign.id), "location": "Nairobi", "employment_type": "contract",
+             "work_location_type": "onsite", "experience_level": "entry"},
+            {"title": "New", "company": "Brand New Co", "location": "Nairobi",
+             "employment_type": "contract", "work_location_type": "onsite", "experience_level": "entry"},
+            {"title": "Own", "company": "Import Company", "location": "Nairobi",
+             "employment_type": "contract", "work_location_type": "onsite", "experience_level": "entry",
+             "skills": ["Python"], "description": ["Line one", "Line two"]},
+        ]
+        content = "\n".join(json.dumps(row) for row in rows) + "\nnot json\n"
+        self.client.force_authenticate(user=self.employer)
+        response = self.upload(content, name="jobs.ndjson")
+
+        self.assertEqual((response.data["created"], response.data["failed"]), (1, 3))
+        errors = {error["line"]: error["errors"] for error in response.data["errors"]}
+        self.assertIn("company", errors[1])
+        self.assertIn("company", errors[2])
+        self.assertFalse(Job.objects.filter(company=foreign).exists())
+        self.assertFalse(Company.objects.filter(name="Brand New Co").exists())
+        job = Job.objects.get(title="Own")
+        self.assertEqual(job.company, self.company)
+        self.assertEqual(job.industry, self.industry)
+        self.assertEqual(job.description, ["Line one", "Line two"])
+
+    def test_seekers_cannot_import(self):
+        seeker = User.objects.create_user(
+            username="importseeker", email="importseeker@example.com", password="testpass123", role=User.ROLE_SEEKER
+        )
+        self.client.force_authenticate(user=seeker)
+        response = self.upload(self.CSV_HEADER + self.csv_rows(1))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_missing_columns_reject_the_file(self):
+        self.client.force_authenticate(user=self.employer)
+        response = self.upload("name,location\nJob,Nairobi\n")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("file", response.data)
+
+    @override_settings(JOBS_IMPORT_CHUNK_SIZE=2)
+    def test_unreadable_file_keeps_and_reports_earlier_chunks(self):
+        """A CSV error midway answers 400 with the count of jobs already committed, whose caches are bumped"""
+        version = get_namespace_version("jobs")
+        oversized = "x" * (csv.field_size_limit() + 1)
+        content = self.CSV_HEADER + self.csv_rows(3) + f"Huge,Import Company,,Nairobi,full_time,remote,mid,{oversized}\n"
+        self.client.force_authenticate(user=self.employer)
+        response = self.upload(content)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("file", response.data)
+        self.assertEqual(response.data["created"], 2)
+        self.assertEqual(Job.objects.count(), 2)
+        self.assertGreater(get_namespace_version("jobs"), version)
+
+    def test_import_command_writes_error_report(self):
+        path = self.write_temp_file(self.CSV_HEADER + self.csv_rows(3) + "No company,,,Nairobi,full_time,remote,mid,\n")
+        report_path = path + ".errors"
+        out = io.StringIO()
+        call_command("import_jobs", path, owner=self.employer.username, report=report_path, stdout=out)
+
+        self.assertIn("Imported 3 jobs, 1 rows failed.", out.getvalue())
+        with open(report_path) as report:
+            errors = [json.loads(line) for line in report]
+        self.assertEqual([error["line"] for error in errors], [5])
+
+    def write_temp_file(self, content):
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        self.addCleanup(lambda: os.path.exists(path + ".errors") and os.remove(path + ".errors"))
+        return path
+
+
+class JobExportTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("job-export")
+        self.employer = User.objects.create_user(
+            username="exportemployer",
+            email="exportemployer@example.com",
+            password="testpass123",
+            role=User.ROLE_EMPLOYER,
+        )
+        company = Company.objects.create(
+            name="Export Company",
+            description="Export company description",
+            industry=Industry.objects.create(name="IT"),
+            owner=self.employer,
+        )
+        python = Skill.objects.create(name="Python")
+        for i, location in enumerate(["Nairobi", "Nairobi", "Mombasa"]):
+            job = Job.objects.create(
+                title=f"Export Job {i}",
+                description=["First paragraph", "Second, with a comma"],
+                company=company,
+                location=location,
+                employment_type="full_time",
+                status="open",
+            )
+            JobSkill.objects.create(job=job, skill=python)
+
+    def test_csv_export_has_all_fields_and_applies_filters(self):
+        self.client.force_authenticate(user=self.employer)
+        response = self.client.get(self.url, {"location": "Nairobi"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+        self.assertEqual([row["title"] for row in rows], ["Export Job 0", "Export Job 1"])
+        self.assertEqual(rows[0]["industry"], "IT")
+        self.assertEqual(json.loads(rows[0]["description"]), ["First paragraph", "Second, with a comma"])
+        self.assertEqual(json.loads(rows[0]["skills"]), [Skill.objects.get().id])
+
+    def test_ndjson_export_with_sparse_fields(self):
+        self.client.force_authenticate(user=self.employer)
+        response = self.client.get(self.url, {"export_format": "ndjson", "fields": "id,title"})
+
+        rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+        self.assertEqual([set(row) for row in rows], [{"id", "title"}] * 3)
+
+    def test_export_requires_employer_or_admin(self):
+        response = self.client.get(self.url)
+        self.assertIn(response.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
+
+    def test_unknown_export_format_is_rejected(self):
+        self.client.force_authenticate(user=self.employer)
+        response = self.client.get(self.url, {"export_format": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class JobMatchingTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("job-recommended")
+        self.seeker = User.objects.create_user(
+            username="matchseeker",
+            email="matchseeker@example.com",
+            password="testpass123",
+            role=User.ROLE_SEEKER,
+        )
+        owner = User.objects.create_user(
+            username="matchowner",
+            email="matchowner@example.com",
+            password="testpass123",
+            role=User.ROLE_EMPLOYER,
+        )
+        self.company = Company.objects.create(
+            name="Match Company",
+            description="Match company description",
+            industry=Industry.objects.create(name="IT"),
+            owner=owner,
+        )
+        self.skills = {name: Skill.objects.create(name=name) for name in ["Python", "Django", "Java", "Go"]}
+        for name in ["Python", "Django"]:
+            SeekerSkill.objects.create(user=self.seeker, skill=self.skills[name])
+
+        self.full_match = self.create_job(["Python", "Django"], "mid")
+        self.partial_match = self.create_job(["Python", "Java", "Go", "Django"], "senior")
+        self.no_match = self.create_job(["Java"], "mid")
+        self.closed_match = self.create_job(["Python", "Django"], "mid", status="closed")
+
+        # The index is per process: start every test from this database
+        match_index.clear()
+        self.client.force_authenticate(user=self.seeker)
+
+    def create_job(self, skills, level, status="open", salary_max=None):
+        job = Job.objects.create(
+            title=f"{level} {' '.join(skills)}",
+            company=self.company,
+            location="Remote",
+            experience_level=level,
+            status=status,
+            salary_max=salary_max,
+        )
+        for name in skills:
+            JobSkill.objects.create(job=job, skill=self.skills[name])
+        return job
+
+    def recommended(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return response.data["results"]
+
+    def test_ranks_open_jobs_by_skill_overlap(self):
+        results = self.recommended()
+        self.assertEqual([job["id"] for job in results], [self.full_match.id, self.partial_match.id])
+        self.assertEqual(results[0]["match_score"], 0.7)
+        self.assertEqual(results[1]["match_score"], 0.35)
+        self.assertEqual(set(results[0]), set(JOB_LIST_FIELDS) | {"match_score"})
+
+    def test_experience_and_salary_fit_change_the_order(self):
+        self.full_match.salary_max = 10000
+        self.full_match.save()
+        lead_match = self.create_job(["Python", "Django"], "lead", salary_max=200000)
+        match_index.clear()
+
+        results = self.recommended(experience_level="lead", expected_salary="100000")
+        self.assertEqual(results[0]["id"], lead_match.id)
+
+    def test_job_skill_changes_refresh_the_index_incrementally(self):
+        self.recommended()
+        built_at = match_index.built_at
+
+        with self.captureOnCommitCallbacks(execute=True):
+            JobSkill.objects.filter(job=self.partial_match, skill__name__in=["Java", "Go"]).delete()
+            JobSkill.objects.create(job=self.no_match, skill=self.skills["Python"])
+        results = self.recommended()
+
+        self.assertEqual(match_index.built_at, built_at)
+        self.assertEqual(
+            [(job["id"], job["match_score"]) for job in results],
+            [(self.partial_match.id, 0.7), (self.full_match.id, 0.7), (self.no_match.id, 0.35)],
+        )
+
+    def test_refresh_swaps_in_a_new_snapshot(self):
+        match_index.sync()
+        before = match_index.snapshot
+        bits, active = before.bits.copy(), before.active.copy()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.no_match.status = "closed"
+            self.no_match.save()
+            self.skills["Rust"] = Skill.objects.create(name="Rust")
+            added = self.create_job(["Rust", "Python"], "mid")
+        match_index.sync()
+
+        # A reader still holding the old snapshot sees it unchanged
+        self.assertIsNot(match_index.snapshot, before)
+        self.assertNotIn(added.id, before.row_of)
+        np.testing.assert_array_equal(before.bits, bits)
+        np.testing.assert_array_equal(before.active, active)
+        self.assertIn(added.id, [job_id for job_id, _ in match_index.rank([self.skills["Rust"].id])])
+
+    def test_ranking_runs_without_queries(self):
+        match_index.sync()
+        with self.assertNumQueries(0):
+            ranked = match_index.rank([skill.id for skill in self.skills.values()], "mid", 50000)
+        self.assertEqual(len(ranked), 3)
+
+    def test_only_seekers_get_recommendations(self):
+        self.client.force_authenticate(user=self.company.owner)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_seeker_manages_own_skills(self):
+        url = reverse("seekerskill-list")
+        response = self.client.post(url, {"skill": self.skills["Go"].id})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = self.client.post(url, {"skill": self.skills["Go"].id})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(url)
+        self.assertEqual([item["skill_name"] for item in response.data["results"]], ["Python", "Django", "Go"])
+
+
+class SimilarJobsTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        index_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, index_dir, ignore_errors=True)
+        settings_override = override_settings(JOBS_SIMILARITY_INDEX_DIR=index_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        owner = User.objects.create_user(
+            username="similarowner",
+            email="similarowner@example.com",
+            password="testpass123",
+            role=User.ROLE_EMPLOYER,
+        )
+        self.company = Company.objects.create(
+            name="Similar Company",
+            description="Similar company description",
+            industry=Industry.objects.create(name="IT"),
+            owner=owner,
+        )
+        python = Skill.objects.create(name="Python")
+        self.backend = self.create_job("Python Backend Developer", ["Build Django REST APIs"], skills=[python])
+        self.django = self.create_job("Senior Django Engineer", ["Python services and REST APIs"], skills=[python])
+        self.frontend = self.create_job("Frontend Developer", ["React and TypeScript interfaces"])
+        self.accountant = self.create_job("Accountant", ["Prepare financial statements"])
+        self.closed = self.create_job("Python Django Developer", ["Django REST APIs"], status="closed")
+
+    def create_job(self, title, description, skills=(), status="open"):
+        job = Job.objects.create(
+            title=title, description=description, company=self.company, location="Remote", status=status
+        )
+        for skill in skills:
+            JobSkill.objects.create(job=job, skill=skill)
+        return job
+
+    def similar(self, job, **params):
+        response = self.client.get(reverse("job-similar", args=[job.id]), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item["id"] for item in response.data["results"]]
+
+    def test_similar_open_jobs_ranked_by_text(self):
+        refresh_index()
+        self.assertEqual(self.similar(self.backend), [self.django.id, self.frontend.id])
+        self.assertEqual(self.similar(self.backend, limit=1), [self.django.id])
+        # A closed job is not indexed, but still gets similar open jobs
+        self.assertEqual(self.similar(self.closed)[0], self.backend.id)
+
+    def test_changed_jobs_go_to_the_delta_segment(self):
+        refresh_index()
+        base = load_index().state["base"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.accountant.title = "Python Django Accountant"
+            self.accountant.save()
+            self.django.status = "closed"
+            self.django.save()
+            added = self.create_job("Django REST Developer", ["Python APIs"])
+        summary = refresh_index()
+
+        self.assertEqual(summary, {"full": False, "jobs": 3})
+        self.assertEqual(load_index().state["base"], base)
+        results = self.similar(self.backend)
+        self.assertEqual(results[0], added.id)
+        self.assertIn(self.accountant.id, results)
+        self.assertNotIn(self.django.id, results)
+
+    def test_scoring_reads_no_job_text(self):
+        refresh_index()
+        index = load_index()
+        with self.assertNumQueries(0):
+            ranked = index.similar(self.backend, 10)
+        self.assertEqual(ranked[0][0], self.django.id)
+
+    def test_empty_before_the_first_build(self):
+        self.assertEqual(self.similar(self.backend), [])
+
+    def test_build_and_refresh_do_not_overlap(self):
+        refresh_index()
+        directory = Path(settings.JOBS_SIMILARITY_INDEX_DIR)
+        old_base = load_index().state["base"]
+        write_segment = similarity.Segment.write
+        refresh = {}
+
+        def run_refresh():
+            # The accountant's new text, without a query from this thread
+            terms = [(self.accountant.id, similarity.job_terms("Python Django Accountant", [], []))]
+            with patch("jobs.similarity.iter_job_terms", return_value=iter(terms)):
+                refresh["summary"] = refresh_index()
+
+        def write_during_refresh(path, rows, vocabulary_size):
+            if "thread" not in refresh:
+                _record_job_changes([self.accountant.id])
+                refresh["thread"] = threading.Thread(target=run_refresh)
+                refresh["thread"].start()
+                # The refresh waits for this build to publish its state
+                refresh["thread"].join(0.2)
+                self.assertTrue(refresh["thread"].is_alive())
+            write_segment(path, rows, vocabulary_size)
+
+        with patch("jobs.similarity.Segment.write", side_effect=write_during_refresh):
+            build_index()
+        refresh["thread"].join()
+
+        self.assertEqual(refresh["summary"], {"full": False, "jobs": 1})
+        state = load_index().state
+        self.assertNotEqual(state["base"], old_base)
+        self.assertIsNotNone(state["delta"])
+        segments = {path.name for path in directory.iterdir() if path.is_dir()}
+        self.assertEqual(segments, {state["base"], state["delta"]})
+        self.assertIn(self.accountant.id, [job_id for job_id, _ in load_index().similar(self.backend, 10)])
+
+
+class JobAlertsTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.seeker = User.objects.create_user(
+            username="alertseeker",
+            email="alertseeker@example.com",
+            password="testpass123",
+            role=User.ROLE_SEEKER,
+        )
+        owner = User.objects.create_user(
+            username="alertowner",
+            email="alertowner@example.com",
+            password="testpass123",
+            role=User.ROLE_EMPLOYER,
+        )
+        self.it = Industry.objects.create(name="IT")
+        self.finance = Industry.objects.create(name="Finance")
+        self.company = Company.objects.create(
+            name="Alert Company",
+            description="Alert company description",
+            industry=self.it,
+            owner=owner,
+        )
+        self.finance_company = Company.objects.create(
+            name="Alert Bank",
+            description="Alert bank description",
+            industry=self.finance,
+            owner=owner,
+        )
+        self.skills = {name: Skill.objects.create(name=name) for name in ["Python", "Django", "Java"]}
+
+    def create_search(self, skills=(), **fields):
+        search = SavedSearch.objects.create(user=self.seeker, name=fields.pop("name", "My search"), **fields)
+        search.skills.set([self.skills[name] for name in skills])
+        index_saved_search(search)
+        return search
+
+    def create_job(self, title="Python Developer", skills=(), company=None, status="open", **fields):
+        fields = {"employment_type": "full_time", "work_location_type": "remote", "experience_level": "mid", **fields}
+        job = Job.objects.create(
+            title=title, company=company or self.company, location="Berlin", status=status, **fields
+        )
+        for name in skills:
+            JobSkill.objects.create(job=job, skill=self.skills[name])
+        return job
+
+    def alerts(self):
+        return list(Notification.objects.filter(user=self.seeker).order_by("id"))
+
+    def test_search_matches_jobs_hitting_every_criterion(self):
+        search = self.create_search(skills=["Python", "Django"], employment_type="full_time", industry=self.it)
+        self.assertEqual(search.criteria_count, 3)
+        self.create_job("Backend Developer", skills=["Django"])
+        self.create_job("Contract Developer", skills=["Python"], employment_type="contract")
+        self.create_job("Java Developer", skills=["Java"])
+        self.create_job("Bank Developer", skills=["Python"], company=self.finance_company)
+
+        self.assertEqual(send_job_alerts(), {"jobs": 4, "notifications": 1})
+        alerts = self.alerts()
+        self.assertEqual(len(alerts), 1)
+        self.assertEqual(alerts[0].title, '1 new job for "My search"')
+        self.assertIn("Backend Developer", alerts[0].message)
+
+    def test_title_and_salary_are_checked_after_matching(self):
+        self.create_search(title="python", min_salary=50000, work_location_type="remote")
+        self.create_job("Python Developer", salary_min=60000)
+        self.create_job("Python Intern", salary_min=20000)
+        self.create_job("Java Developer", salary_min=60000)
+        self.create_job("Python Onsite", salary_min=60000, work_location_type="onsite")
+
+        send_job_alerts()
+        alerts = self.alerts()
+        self.assertEqual(len(alerts), 1)
+        self.assertIn("Python Developer", alerts[0].message)
+        self.assertNotIn("Python Intern", alerts[0].message)
+
+    def test_search_without_discrete_criteria_sees_every_job(self):
+        self.create_search(name="Anything")
+        self.create_search(name="Paused", is_active=False)
+        self.create_job("First")
+        self.create_job("Second")
+
+        self.assertEqual(send_job_alerts(), {"jobs": 2, "notifications": 1})
+        self.assertEqual(self.alerts()[0].title, '2 new jobs for "Anything"')
+
+    def test_each_job_is_alerted_once_and_drafts_wait(self):
+        self.create_search()
+        self.create_job("Published")
+        draft = self.create_job("Draft", status="draft")
+        send_job_alerts()
+        self.assertEqual(send_job_alerts(), {"jobs": 0, "notifications": 0})
+
+        draft.status = "open"
+        draft.save()
+        self.assertEqual(send_job_alerts(), {"jobs": 1, "notifications": 1})
+        self.assertEqual([alert.message for alert in self.alerts()][-1], "New jobs matching your saved search: Draft.")
+
+    def test_batch_is_matched_with_a_fixed_number_of_queries(self):
+        for i in range(5):
+            self.create_search(name=f"Search {i}", skills=["Python"], experience_level="mid")
+        for i in range(6):
+            self.create_job(f"Job {i}", skills=["Python", "Django"])
+
+        # jobs, their skills, criteria postings, candidate searches,
+        # notification insert, processed update (+ savepoint on each side)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(send_job_alerts(batch_size=10), {"jobs": 6, "notifications": 5})
+        statements = [q["sql"] for q in queries.captured_queries if "SAVEPOINT" not in q["sql"]]
+        self.assertEqual(len(statements), 6)
+
+    def test_seeker_manages_saved_searches(self):
+        self.client.force_authenticate(user=self.seeker)
+        url = reverse("savedsearch-list")
+        response = self.client.post(url, {
+            "name": "Django jobs",
+            "skills": [self.skills["Django"].id],
+            "experience_level": "senior",
+        }, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        search = SavedSearch.objects.get(pk=response.data["id"])
+        self.assertEqual(search.criteria_count, 2)
+
+        response = self.client.patch(
+            reverse("savedsearch-detail", args=[search.id]), {"experience_level": ""}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        search.refresh_from_db()
+        self.assertEqual(search.criteria_count, 1)
+
+        response = self.client.post(url, {"name": "Bad", "min_salary": 10, "max_salary": 5}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(user=self.company.owner)
+        self.assertEqual(self.client.get(url).data["results"], [])
+        response = self.client.post(url, {"name": "Employer search"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class SkillAutocompleteTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("skill-autocomplete")
+        owner = User.objects.create_user(
+            username="autocompleteowner",
+            email="autocompleteowner@example.com",
+            password="testpass123",
+            role=User.ROLE_EMPLOYER,
+        )
+        self.company = Company.objects.create(
+            name="Autocomplete Company",
+            description="Autocomplete company description",
+            industry=Industry.objects.create(name="IT"),
+            owner=owner,
+        )
+        self.skills = {
+            name: Skill.objects.create(name=name)
+            for name in ["Java", "JavaScript", "Jakarta EE", "Amazon Web Services", "Python"]
+        }
+        self.create_job(["JavaScript"])
+        self.create_job(["JavaScript", "Jakarta EE"])
+        # The index is per process: start every test from this database
+        skill_index.version = None
+
+    def create_job(self, skills):
+        job = Job.objects.create(title="Autocomplete Job", company=self.company, location="Remote", status="open")
+        for name in skills:
+            JobSkill.objects.create(job=job, skill=self.skills[name])
+        return job
+
+    def suggest(self, q, **params):
+        response = self.client.get(self.url, {"q": q, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return [(item["name"], item["job_count"]) for item in response.data["results"]]
+
+    def test_prefix_matches_ranked_by_job_count(self):
+        self.assertEqual(self.suggest("ja"), [("JavaScript", 2), ("Jakarta EE", 1), ("Java", 0)])
+        self.assertEqual(self.suggest("JAVA"), [("JavaScript", 2), ("Java", 0)])
+        self.assertEqual(self.suggest("javas"), [("JavaScript", 2)])
+        self.assertEqual(self.suggest("ja", limit=1), [("JavaScript", 2)])
+        self.assertEqual(self.suggest("rust"), [])
+
+    def test_matches_the_start_of_later_words(self):
+        self.assertEqual(self.suggest("web"), [("Amazon Web Services", 0)])
+        self.assertEqual(self.suggest("web  serv"), [("Amazon Web Services", 0)])
+        self.assertEqual(self.suggest("ee"), [("Jakarta EE", 1)])
+
+    def test_lookups_run_without_queries(self):
+        skill_index.sync()
+        with self.assertNumQueries(0):
+            self.assertEqual(len(skill_index.search("java")), 2)
+            self.assertEqual(len(skill_index.search("p")), 1)
+
+    def test_skill_and_job_skill_writes_invalidate_the_index(self):
+        self.suggest("ja")
+        self.create_job(["Java"])
+        self.create_job(["Java"])
+        self.create_job(["Java"])
+        self.assertEqual(self.suggest("java")[0], ("Java", 3))
+
+        Skill.objects.create(name="Jamstack")
+        self.assertIn(("Jamstack", 0), self.suggest("jam"))
+
+    def test_query_is_required(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class JobFacetsTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("job-facets")
+        owner = User.objects.create_user(
+            username="facetowner",
+            email="facetowner@example.com",
+            password="testpass123",
+            role=User.ROLE_EMPLOYER,
+        )
+        self.industry = Industry.objects.create(name="IT")
+        self.company = Company.objects.create(
+            name="Facet Company",
+            description="Facet company description",
+            industry=self.industry,
+            owner=owner,
+        )
+        self.python = Skill.objects.create(name="Python")
+        self.create_job("full_time", "remote", 25000, skills=[self.python])
+        self.create_job("full_time", "onsite", 75000, skills=[self.python])
+        self.create_job("contract", "remote", None)
+
+    def create_job(self, employment_type, work_location_type, salary_min, skills=()):
+        job = Job.objects.create(
+            title="Facet Job",
+            description="Facet job description",
+            company=self.company,
+            employment_type=employment_type,
+            work_location_type=work_location_type,
+            experience_level="mid",
+            location="Remote",
+            salary_min=salary_min,
+        )
+        for skill in skills:
+            JobSkill.objects.create(job=job, skill=skill)
+        return job
+
+    def test_facet_counts(self):
+        """Every facet is counted over the matching jobs"""
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(response.data["employment_type"]["full_time"], 2)
+        self.assertEqual(response.data["employment_type"]["contract"], 1)
+        self.assertEqual(response.data["work_location_type"]["remote"], 2)
+        self.assertEqual(response.data["experience_level"]["mid"], 3)
+        self.assertEqual(response.data["salary"], {"under_30k": 1, "30k_60k": 0, "60k_100k": 1, "100k_plus": 0})
+        self.assertEqual(response.data["industry"], [{"id": self.industry.id, "name": "IT", "count": 3}])
+        self.assertEqual(response.data["skills"], [{"id": self.python.id, "name": "Python", "count": 2}])
+
+    def test_facets_respect_filters(self):
+        """Facets take the same filter params as the job list"""
+        response = self.client.get(self.url, {"work_location_type": "remote"})
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(response.data["employment_type"]["full_time"], 1)
+        self.assertEqual(response.data["skills"][0]["count"], 1)
+
+    def test_facets_cached_until_job_write(self):
+        """Repeat requests are served from cache; a job write invalidates them"""
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+        self.create_job("internship", "hybrid", 120000)
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["count"], 4)
+        self.assertEqual(response.data["salary"]["100k_plus"], 1)
+
+
+class JobSearchTestCase(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+        self.employer = User.objects.create_user(
+            username="searchemployer",
+            email="searchemployer@example.com",
+            password="testpass123",
+            role=User.ROLE_EMPLOYER,
+        )
+        self.industry = Industry.objects.create(name="IT")
+        self.company = Company.objects.create(
+            name="Acme Analytics",
+            description="Search company description",
+            industry=self.industry,
+            owner=self.employer,
+        )
+
+        # Title match
+        self.title_job = Job.objects.create(
+            title="Python Developer",
+            description=["Build REST APIs"],
+            company=self.company,
+            employment_type="full_time",
+            location="Nairobi",
+            status="open",
+        )
+
+        # Description-only match
+        self.description_job = Job.objects.create(
+            title="Data Engineer",
+            description=["Maintain Python data pipelines"],
+            company=self.company,
+            employment_type="full_time",
+            location="Nairobi",
+            status="open",
+        )
+
+    def search(self, term):
+        response = self.client.get(reverse("job-list"), {"search": term})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [job["id"] for job in response.data["results"]]
+
+    def test_search_matches_title_and_description(self):
+        """Search finds jobs by title and by description text"""
+        self.assertCountEqual(self.search("python"), [self.title_job.id, self.description_job.id])
+        self.assertEqual(self.search("engineer"), [self.description_job.id])
+
+    @skipUnless(connection.vendor == "postgresql", "full-text ranking requires PostgreSQL")
+    def test_title_match_ranks_first(self):
+        """A title match outranks a description-only match"""
+        self.assertEqual(self.search("python"), [self.title_job.id, self.description_job.id])
+
+    @skipUnless(connection.vendor == "postgresql", "full-text ranking requires PostgreSQL")
+    def test_company_rename_refreshes_search_vector(self):
+        """Saving a company refreshes the search vectors of its jobs"""
+        self.company.name = "Globex"
+        self.company.save()
+        self.assertCountEqual(self.search("globex"), [self.title_job.id, self.description_job.id])
+
+    def filter_jobs(self, **params):
+        response = self.client.get(reverse("job-list"), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [job["id"] for job in response.data["results"]]
+
+    def test_fuzzy_filter_matches_partial_text(self):
+        """?fuzzy=true still returns plain partial matches"""
+        self.assertEqual(self.filter_jobs(title="python", fuzzy="true"), [self.title_job.id])
+
+    @skipUnless(connection.vendor == "postgresql", "trigram matching requires PostgreSQL")
+    def test_fuzzy_filter_tolerates_typos(self):
+        """Trigram matching tolerates misspelled titles and locations"""
+        self.assertEqual(self.filter_jobs(title="pyhton developer", fuzzy="true"), [self.title_job.id])
+        self.assertCountEqual(
+            self.filter_jobs(location="Nairbi", fuzzy="true"),
+            [self.title_job.id, self.description_job.id],
+        )
+        self.assertEqual(self.filter_jobs(title="pyhton developer"), [])
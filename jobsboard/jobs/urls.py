@@ -1,12 +1,14 @@
 # jobsboard/jobs/urls.py
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import SkillViewSet, JobViewSet, JobSkillViewSet
+from .views import SkillViewSet, JobViewSet, JobSkillViewSet, SeekerSkillViewSet, SavedSearchViewSet
 
 router = DefaultRouter()
 router.register(r'skills', SkillViewSet, basename='skill')
 router.register(r'jobs', JobViewSet, basename='job')
 router.register(r'job-skills', JobSkillViewSet, basename='jobskill')
+router.register(r'seeker-skills', SeekerSkillViewSet, basename='seekerskill')
+router.register(r'saved-searches', SavedSearchViewSet, basename='savedsearch')
 
 urlpatterns = [
     path("", include(router.urls)),
@@ -1,28 +1,45 @@
 # jobsboard/jobs/views.py
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.exceptions import PermissionDenied, ValidationError
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
+from django.conf import settings
+from django.core.cache import cache
 import logging
 
 from .permissions import JobPermission
-from .models import Skill, Job, JobSkill
+from .models import Skill, Job, JobSkill, SeekerSkill, SavedSearch
 from users.models import User
 from .filters import JobFilter
-from .serializers import SkillSerializer, JobSerializer, JobSkillSerializer
+from .search import JobSearchFilter
+from .serializers import (
+    SkillSerializer, JobSerializer, JobSkillSerializer, SeekerSkillSerializer, SavedSearchSerializer,
+    JobRecommendationQuerySerializer, SimilarJobsQuerySerializer, SkillAutocompleteQuerySerializer, JOB_LIST_FIELDS,
+)
+from .autocomplete import autocomplete_skills
+from .facets import compute_job_facets
+from .importers import IMPORT_FORMATS, ImportReport, JobImportError, JobImporter
+from .matching import recommend_jobs
+from .similarity import similar_jobs
+from api.cache import CachedListMixin, normalized_query_params, versioned_key
+from api.conditional import ConditionalGetMixin
+from api.export import StreamingExportMixin
+from api.fastpath import FastListMixin
+from api.pagination import EstimatedCountPagination
 
 logger = logging.getLogger(__name__)
 
 # -----------------------------
 # Skill ViewSet
 # -----------------------------
-class SkillViewSet(viewsets.ModelViewSet):
+class SkillViewSet(CachedListMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing skills.
     Public can view, only recruiters/admins can create/update/delete.
@@ -31,6 +48,24 @@ class SkillViewSet(viewsets.ModelViewSet):
     serializer_class = SkillSerializer
     authentication_classes = [JWTAuthentication]
     permission_classes = [JobPermission]
+    cache_namespaces = ("skills",)
+
+    @swagger_auto_schema(query_serializer=SkillAutocompleteQuerySerializer)
+    @action(detail=False, methods=["get"], url_path="autocomplete")
+    def autocomplete(self, request):
+        """
+        Skills whose name, or a word of it, starts with `q`, most used by
+        jobs first. Served from an in-process prefix index (jobs/autocomplete.py),
+        without a database query per keystroke.
+        """
+        params = SkillAutocompleteQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        suggestions = autocomplete_skills(params.validated_data["q"], params.validated_data["limit"])
+        results = [
+            {"id": skill_id, "name": name, "job_count": job_count}
+            for skill_id, name, job_count in suggestions
+        ]
+        return Response({"results": results})
 
     @swagger_auto_schema(security=[{"Bearer": []}])
     def create(self, request, *args, **kwargs):
@@ -52,23 +87,88 @@ class SkillViewSet(viewsets.ModelViewSet):
 # -----------------------------
 # Job ViewSet
 # -----------------------------
-class JobViewSet(viewsets.ModelViewSet):
+class JobViewSet(ConditionalGetMixin, CachedListMixin, FastListMixin, StreamingExportMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing jobs.
     - Public: can view jobs
     - Job Seekers: can view + apply
     - Recruiters/Admins: full CRUD
+    - Lists return a compact representation (JOB_LIST_FIELDS), details the
+      full job; `?fields=a,b,c` picks the fields for either.
+    - Lists are serialized from `.values()` rows (FastListMixin).
+    - `export/` streams the filtered list as CSV or NDJSON, all fields
+      unless `?fields=` is given (StreamingExportMixin).
     """
     queryset = Job.objects.all()
     serializer_class = JobSerializer
     authentication_classes = [JWTAuthentication]
     permission_classes = [JobPermission]
 
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    # `?search=` uses PostgreSQL full-text search ranked by relevance;
+    # search_fields are only used by the icontains fallback on other databases.
+    filter_backends = [DjangoFilterBackend, JobSearchFilter, filters.OrderingFilter]
     filterset_class = JobFilter
     search_fields = ["title", "company__name", "description"]
     ordering_fields = ["salary_min", "salary_max", "posted_date"]
 
+    # `?pagination=cursor` switches to keyset pagination (newest first),
+    # served by the (posted_date, id) index. Page counts on a large table
+    # are planner estimates (`count_is_estimate`).
+    pagination_class = EstimatedCountPagination
+    cursor_ordering = ("-posted_date", "-id")
+
+    # List pages are cached, and ETags change, on any job, job skill,
+    # company or industry write
+    cache_namespaces = ("jobs",)
+    etag_namespaces = ("jobs",)
+
+    export_filename = "jobs"
+
+    def get_serializer_fields(self):
+        """
+        Fields to serialize for this request: `?fields=` when given, the
+        compact JOB_LIST_FIELDS for lists, or None (all fields) otherwise.
+        """
+        if self.action not in ("list", "retrieve", "export"):
+            return None
+        requested = self.request.query_params.get("fields")
+        if not requested:
+            return JOB_LIST_FIELDS if self.action == "list" else None
+
+        fields = [name.strip() for name in requested.split(",") if name.strip()]
+        unknown = set(fields) - set(JobSerializer().fields)
+        if unknown:
+            raise ValidationError({"fields": f"Unknown fields: {', '.join(sorted(unknown))}"})
+        return fields
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault("fields", self.get_serializer_fields())
+        return super().get_serializer(*args, **kwargs)
+
+    def get_queryset(self):
+        """
+        Load only what the serializer will output: unrequested columns are
+        deferred, and the industry join / skills prefetch are added only
+        when those fields are serialized (constant queries per page).
+        """
+        queryset = super().get_queryset()
+        fields = self.get_serializer_fields()
+        if fields is None or "industry" in fields:
+            queryset = queryset.select_related("industry")
+        if fields is None or "skills" in fields:
+            queryset = queryset.prefetch_related("skills")
+        if fields is None:
+            return queryset
+
+        # Ordering columns stay loaded for cursor pagination positions
+        columns = {"id", *self.ordering_fields}
+        for name in fields:
+            if name == "industry":
+                columns.update({"industry", "industry__name"})
+            elif name != "skills":
+                columns.add(name)
+        return queryset.only(*columns)
+
     def get_permissions(self):
         # Allow Swagger to see POST endpoint
         if getattr(self, '_swagger_fake_view', False):
@@ -117,6 +217,103 @@ class JobViewSet(viewsets.ModelViewSet):
             logger.error(f"Error creating job by {request.user}: {str(e)}", exc_info=True)
             raise
 
+    @action(detail=False, methods=["get"], url_path="facets")
+    def facets(self, request):
+        """
+        Facet counts for the jobs matching the current filters/search:
+        employment type, work location type, experience level, salary bucket,
+        industry and skill. Cached per filter set until a job-related write.
+        """
+        params = normalized_query_params(request, ignore={"page", "cursor", "pagination", "ordering"})
+        cache_key = versioned_key("jobs", "facets", params)
+
+        data = cache.get(cache_key)
+        if data is None:
+            data = compute_job_facets(self.filter_queryset(self.get_queryset()))
+            cache.set(cache_key, data, settings.JOBS_FACETS_CACHE_TIMEOUT)
+        return Response(data)
+
+    @swagger_auto_schema(security=[{"Bearer": []}], query_serializer=JobRecommendationQuerySerializer)
+    @action(detail=False, methods=["get"], url_path="recommended")
+    def recommended(self, request):
+        """
+        "Jobs for you": open jobs ranked by overlap with the seeker's skills
+        (see SeekerSkillViewSet), optionally weighted by `experience_level`
+        and `expected_salary` fit. Compact job fields plus `match_score`.
+        """
+        if request.user.role != User.ROLE_SEEKER:
+            raise PermissionDenied("Only job seekers get job recommendations.")
+        params = JobRecommendationQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        ranked = recommend_jobs(request.user, **params.validated_data)
+        serializer = JobSerializer(
+            [job for job, _ in ranked], many=True, fields=JOB_LIST_FIELDS, context=self.get_serializer_context()
+        )
+        results = [
+            {**item, "match_score": round(score, 4)}
+            for item, (_, score) in zip(serializer.data, ranked)
+        ]
+        return Response({"results": results})
+
+    @swagger_auto_schema(query_serializer=SimilarJobsQuerySerializer)
+    @action(detail=True, methods=["get"], url_path="similar")
+    def similar(self, request, pk=None):
+        """
+        Open jobs most similar to this one by title, description and skills
+        (TF-IDF cosine, see jobs/similarity.py). Compact job fields plus
+        `similarity`. Empty until the index has been built.
+        """
+        job = self.get_object()
+        params = SimilarJobsQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        ranked = similar_jobs(job, **params.validated_data)
+        serializer = JobSerializer(
+            [similar for similar, _ in ranked], many=True, fields=JOB_LIST_FIELDS, context=self.get_serializer_context()
+        )
+        results = [
+            {**item, "similarity": round(score, 4)}
+            for item, (_, score) in zip(serializer.data, ranked)
+        ]
+        return Response({"results": results})
+
+    @swagger_auto_schema(security=[{"Bearer": []}])
+    @action(detail=False, methods=["post"], url_path="import", parser_classes=[MultiPartParser])
+    def import_jobs(self, request):
+        """
+        Bulk-create jobs from an uploaded CSV or NDJSON `file` (see jobs/importers.py).
+        - `file_format`: csv or ndjson (default: from the file name).
+        - Companies must exist: employers import into their own companies,
+          admins into any company. Rows naming other companies are reported.
+        - Returns counts and the first JOBS_IMPORT_MAX_REPORTED_ERRORS row errors.
+          A file that cannot be read to the end gives 400 with a `file` error,
+          still counting the jobs created before it.
+        """
+        upload = request.FILES.get("file")
+        if upload is None:
+            raise ValidationError({"file": "Upload a CSV or NDJSON file."})
+        file_format = request.data.get("file_format") or (
+            "ndjson" if upload.name.endswith((".ndjson", ".jsonl")) else "csv"
+        )
+        if file_format not in IMPORT_FORMATS:
+            raise ValidationError({"file_format": f"Expected one of: {', '.join(IMPORT_FORMATS)}."})
+
+        owner = request.user if request.user.role == User.ROLE_EMPLOYER else None
+        importer = JobImporter(owner=owner, created_by=request.user)
+        report = ImportReport(max_errors=settings.JOBS_IMPORT_MAX_REPORTED_ERRORS)
+        logger.info(f"User {request.user} is importing jobs from {upload.name} ({upload.size} bytes)")
+        try:
+            # Large uploads are spooled to disk by Django and read back line by line
+            importer.run(upload.file, file_format, report)
+        except JobImportError as e:
+            logger.warning(f"Job import by {request.user} stopped after {report.created} jobs: {e}")
+            return Response({**report.as_dict(), "file": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        logger.info(f"Job import by {request.user}: {report.created} created, {report.failed} failed")
+
+        response_status = status.HTTP_201_CREATED if report.created else status.HTTP_400_BAD_REQUEST
+        return Response(report.as_dict(), status=response_status)
+
     @swagger_auto_schema(security=[{"Bearer": []}])
     @action(detail=True, methods=["post"], url_path="apply", permission_classes=[IsAuthenticated])
     def apply(self, request, pk=None):
@@ -150,7 +347,7 @@ class JobSkillViewSet(viewsets.ModelViewSet):
     API endpoint for Job-Skill relationships.
     Public can view, recruiters/admins manage.
     """
-    queryset = JobSkill.objects.all()
+    queryset = JobSkill.objects.select_related("job", "skill")
     serializer_class = JobSkillSerializer
     authentication_classes = [JWTAuthentication]
     permission_classes = [JobPermission]
@@ -170,3 +367,77 @@ class JobSkillViewSet(viewsets.ModelViewSet):
     @swagger_auto_schema(security=[{"Bearer": []}])
     def destroy(self, request, *args, **kwargs):
         return super().destroy(request, *args, **kwargs)
+
+
+
+# -----------------------------
+# SeekerSkill ViewSet
+# -----------------------------
+class SeekerSkillViewSet(viewsets.ModelViewSet):
+    """
+    API endpoint for a job seeker's own skills, used by /api/jobs/recommended/.
+    Seekers list, add and remove their skills; nobody sees anyone else's.
+    """
+    serializer_class = SeekerSkillSerializer
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated]
+    http_method_names = ["get", "post", "delete", "head", "options"]
+
+    def get_queryset(self):
+        if getattr(self, "_swagger_fake_view", False):
+            return SeekerSkill.objects.none()
+        return SeekerSkill.objects.filter(user=self.request.user).select_related("skill")
+
+    def perform_create(self, serializer):
+        if self.request.user.role != User.ROLE_SEEKER:
+            raise PermissionDenied("Only job seekers can add skills to their profile.")
+        serializer.save(user=self.request.user)
+
+    @swagger_auto_schema(security=[{"Bearer": []}])
+    def create(self, request, *args, **kwargs):
+        return super().create(request, *args, **kwargs)
+
+    @swagger_auto_schema(security=[{"Bearer": []}])
+    def destroy(self, request, *args, **kwargs):
+        return super().destroy(request, *args, **kwargs)
+
+
+
+# -----------------------------
+# SavedSearch ViewSet
+# -----------------------------
+class SavedSearchViewSet(viewsets.ModelViewSet):
+    """
+    API endpoint for a job seeker's saved searches.
+    New open jobs matching an active search raise a notification
+    (jobs.tasks.send_job_alerts). Seekers only see their own searches.
+    """
+    serializer_class = SavedSearchSerializer
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        if getattr(self, "_swagger_fake_view", False):
+            return SavedSearch.objects.none()
+        return SavedSearch.objects.filter(user=self.request.user).prefetch_related("skills")
+
+    def perform_create(self, serializer):
+        if self.request.user.role != User.ROLE_SEEKER:
+            raise PermissionDenied("Only job seekers can save searches.")
+        serializer.save(user=self.request.user)
+
+    @swagger_auto_schema(security=[{"Bearer": []}])
+    def create(self, request, *args, **kwargs):
+        return super().create(request, *args, **kwargs)
+
+    @swagger_auto_schema(security=[{"Bearer": []}])
+    def update(self, request, *args, **kwargs):
+        return super().update(request, *args, **kwargs)
+
+    @swagger_auto_schema(security=[{"Bearer": []}])
+    def partial_update(self, request, *args, **kwargs):
+        return super().partial_update(request, *args, **kwargs)
+
+    @swagger_auto_schema(security=[{"Bearer": []}])
+    def destroy(self, request, *args, **kwargs):
+        return super().destroy(request, *args, **kwargs)
@@ -1,3 +1,19 @@
 from django.contrib import admin
+from django.utils import timezone
 
-# Register your models here.
+from .models import QueuedEmail
+
+
+@admin.register(QueuedEmail)
+class QueuedEmailAdmin(admin.ModelAdmin):
+    list_display = ("id", "subject", "status", "attempts", "next_attempt_at", "sent_at")
+    list_filter = ("status",)
+    search_fields = ["subject"]
+    readonly_fields = ("attempts", "last_error", "created_at", "sent_at")
+    actions = ["requeue"]
+
+    @admin.action(description="Requeue selected emails")
+    def requeue(self, request, queryset):
+        queryset.exclude(status=QueuedEmail.STATUS_SENT).update(
+            status=QueuedEmail.STATUS_PENDING, attempts=0, next_attempt_at=timezone.now()
+        )
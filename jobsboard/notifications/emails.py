@@ -0,0 +1,120 @@
+# jobsboard/notifications/emails.py
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import QueuedEmail
+
+logger = logging.getLogger(__name__)
+
+# How long a dispatcher owns the emails it claimed; a dispatcher that dies
+# mid-batch leaves them due again after this
+CLAIM_TIMEOUT = timedelta(minutes=5)
+
+
+def queue_emails(messages, from_email=None):
+    """
+    Queue (subject, body, [recipient, ...]) emails with one INSERT; the
+    send_queued_emails task delivers them. Returns the QueuedEmail rows.
+    """
+    from_email = from_email or settings.DEFAULT_FROM_EMAIL
+    return QueuedEmail.objects.bulk_create([
+        QueuedEmail(subject=subject, body=body, from_email=from_email, to=list(to))
+        for subject, body, to in messages
+    ])
+
+
+def queue_email(subject, body, to, from_email=None):
+    """Queue one email for `to` (a list of addresses)."""
+    return queue_emails([(subject, body, to)], from_email)[0]
+
+
+def retry_delay(attempts):
+    """Wait before the next try after `attempts` failed sends: doubles every time."""
+    return timedelta(seconds=settings.EMAIL_DISPATCH_RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def claim_due_emails(batch_size):
+    """
+    Up to `batch_size` due pending emails, claimed for CLAIM_TIMEOUT in a
+    short transaction: concurrent dispatchers skip each other's rows and
+    no lock is held while talking to the SMTP server.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        emails = list(
+            QueuedEmail.objects.filter(status=QueuedEmail.STATUS_PENDING, next_attempt_at__lte=now)
+            .order_by("next_attempt_at")
+            .select_for_update(skip_locked=True)[:batch_size]
+        )
+        if emails:
+            QueuedEmail.objects.filter(pk__in=[email.pk for email in emails]).update(
+                next_attempt_at=now + CLAIM_TIMEOUT
+            )
+    return emails
+
+
+def _reopen(connection):
+    """A failed send may have dropped the SMTP session: start a new one for the next message."""
+    try:
+        connection.close()
+        connection.open()
+    except Exception as e:
+        logger.warning(f"Email dispatch: reconnect failed: {e}")
+
+
+def dispatch_queued_emails(batch_size, connection=None):
+    """
+    Send every due queued email, `batch_size` at a time, over one mail
+    connection (one SMTP handshake for the whole run).
+
+    Messages are handed to the connection one by one so a rejected message
+    fails alone: it is retried after retry_delay(), and dead-lettered
+    (status "failed") after EMAIL_DISPATCH_MAX_ATTEMPTS tries. Results are
+    written with two queries per batch.
+    Returns {"sent": n, "retried": n, "failed": n}.
+    """
+    counts = {"sent": 0, "retried": 0, "failed": 0}
+    connection = connection or get_connection(fail_silently=False)
+    with connection:
+        while True:
+            emails = claim_due_emails(batch_size)
+            if not emails:
+                break
+            sent, failed = [], []
+            for email in emails:
+                message = EmailMessage(email.subject, email.body, email.from_email, email.to, connection=connection)
+                try:
+                    connection.send_messages([message])
+                except Exception as e:
+                    email.last_error = f"{type(e).__name__}: {e}"
+                    failed.append(email)
+                    _reopen(connection)
+                else:
+                    sent.append(email.pk)
+
+            now = timezone.now()
+            if sent:
+                QueuedEmail.objects.filter(pk__in=sent).update(status=QueuedEmail.STATUS_SENT, sent_at=now, last_error="")
+            for email in failed:
+                email.attempts += 1
+                if email.attempts >= settings.EMAIL_DISPATCH_MAX_ATTEMPTS:
+                    email.status = QueuedEmail.STATUS_FAILED
+                    counts["failed"] += 1
+                    logger.error(f"Email {email.pk} dead-lettered after {email.attempts} attempts: {email.last_error}")
+                else:
+                    email.next_attempt_at = now + retry_delay(email.attempts)
+                    counts["retried"] += 1
+            if failed:
+                QueuedEmail.objects.bulk_update(failed, ["status", "attempts", "next_attempt_at", "last_error"])
+            counts["sent"] += len(sent)
+            if len(emails) < batch_size:
+                break
+
+    if any(counts.values()):
+        logger.info(f"Email dispatch: {counts['sent']} sent, {counts['retried']} retried, {counts['failed']} failed")
+    return counts
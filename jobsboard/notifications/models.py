@@ -1,6 +1,7 @@
 #jobsboard/notifications/models.py
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 # ---------------------------------------------------------
 # Notification Model
@@ -40,4 +41,47 @@ class Notification(models.Model):
         ]
 
     def __str__(self):
-        return f"{self.user} - {self.title} ({'Read' if self.is_read else 'Unread'})"
\ No newline at end of file
+        return f"{self.user} - {self.title} ({'Read' if self.is_read else 'Unread'})"
+
+# ---------------------------------------------------------
+# QueuedEmail Model
+# ---------------------------------------------------------
+# An outgoing email waiting for the dispatcher (notifications.emails).
+# - Tasks queue emails instead of opening an SMTP connection each; the
+#   dispatcher sends the due ones in batches over one connection.
+# - A failed send is retried later with a growing delay; after
+#   EMAIL_DISPATCH_MAX_ATTEMPTS it is dead-lettered (status "failed") and
+#   keeps its last error for the admin.
+
+class QueuedEmail(models.Model):
+    STATUS_PENDING = 'pending'
+    STATUS_SENT = 'sent'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, 'Pending'),
+        (STATUS_SENT, 'Sent'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=255)
+    to = models.JSONField(default=list)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # The dispatcher only reads due pending rows
+            models.Index(
+                fields=['next_attempt_at'],
+                name='idx_queued_email_due',
+                condition=models.Q(status='pending'),
+            ),
+        ]
+
+    def __str__(self):
+        return f"{', '.join(self.to)} - {self.subject} ({self.status})"
@@ -0,0 +1,24 @@
+# jobsboard/notifications/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from api.cache import bump_namespace
+from .models import Notification
+
+
+def user_notifications_namespace(user_id):
+    return f"notifications:user:{user_id}"
+
+
+def bump_notification_versions(user_ids):
+    """
+    Invalidate notification ETags for the given users and for the
+    all-notifications scope (admins/employers). Call this after bulk writes,
+    which do not send post_save/post_delete.
+    """
+    bump_namespace("notifications", *(user_notifications_namespace(user_id) for user_id in set(user_ids)))
+
+
+@receiver([post_save, post_delete], sender=Notification)
+def invalidate_notification_versions(sender, instance, **kwargs):
+    bump_notification_versions([instance.user_id])
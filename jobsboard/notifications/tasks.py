@@ -0,0 +1,15 @@
+# jobsboard/notifications/tasks.py
+from celery import shared_task
+from django.conf import settings
+
+from .emails import dispatch_queued_emails
+
+
+@shared_task
+def send_queued_emails():
+    """
+    Deliver the queued emails (notifications.emails) over one SMTP
+    connection. Runs every few seconds from beat, so emails queued in
+    between go out together.
+    """
+    return dispatch_queued_emails(settings.EMAIL_DISPATCH_BATCH_SIZE)
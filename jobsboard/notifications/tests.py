@@ -1,7 +1,18 @@
 # jobsboard/notifications/tests.py
-from django.test import TestCase
+import smtplib
+from datetime import timedelta
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase, override_settings
+from django.utils import timezone
 from django.contrib.auth import get_user_model
-from notifications.models import Notification
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from api.testing import QueryBudgetMixin
+from notifications.emails import dispatch_queued_emails, queue_email, queue_emails
+from notifications.models import Notification, QueuedEmail
 
 User = get_user_model()
 
@@ -55,3 +66,133 @@ class NotificationModelTest(TestCase):
         notification.save()
         updated = Notification.objects.get(id=notification.id)
         self.assertTrue(updated.is_read)
+
+
+class NotificationConditionalGetTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='etaguser',
+            email='etaguser@example.com',
+            password='password123'
+        )
+        self.other = User.objects.create_user(
+            username='otheruser',
+            email='otheruser@example.com',
+            password='password123'
+        )
+        self.notification = Notification.objects.create(user=self.user, title='Hello', message='Message')
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('notification-list')
+
+    def test_unchanged_list_returns_304(self):
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertIn('Authorization', response['Vary'])
+
+    def test_other_users_notifications_keep_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        Notification.objects.create(user=self.other, title='Not yours', message='Message')
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_own_notification_change_returns_200(self):
+        etag = self.client.get(self.url)['ETag']
+        self.notification.is_read = True
+        self.notification.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['results'][0]['is_read'])
+
+
+    def test_detail_304_only_for_an_accessible_object(self):
+        url = reverse('notification-detail', args=[self.notification.id])
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        # Missing or someone else's notification: 404 whatever the If-None-Match
+        hidden = Notification.objects.create(user=self.other, title='Not yours', message='Message')
+        for pk in (hidden.id, 999999):
+            response = self.client.get(reverse('notification-detail', args=[pk]), HTTP_IF_NONE_MATCH='*')
+            self.assertEqual(response.status_code, 404)
+
+
+class NotificationQueryBudgetTest(QueryBudgetMixin, TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='budgetuser',
+            email='budgetuser@example.com',
+            password='password123'
+        )
+        self.client.force_authenticate(user=self.user)
+        self.add_notifications(1)
+
+    def add_notifications(self, count):
+        Notification.objects.bulk_create(
+            Notification(user=self.user, title=f'Notification {i}', message='Message')
+            for i in range(count)
+        )
+
+    def test_notification_list_query_budget(self):
+        # count + page + request log
+        self.assertQueryBudget(reverse('notification-list'), 3, self.add_notifications)
+
+
+
+class FlakyEmailBackend(EmailBackend):
+    """locmem backend that counts connections and refuses addresses at bounce.test."""
+    opened = 0
+
+    def open(self):
+        FlakyEmailBackend.opened += 1
+        return super().open()
+
+    def send_messages(self, messages):
+        for message in messages:
+            if any(address.endswith("@bounce.test") for address in message.to):
+                raise smtplib.SMTPRecipientsRefused({address: (550, b"No such user") for address in message.to})
+        return super().send_messages(messages)
+
+
+@override_settings(
+    EMAIL_BACKEND=f"{__name__}.FlakyEmailBackend",
+    EMAIL_DISPATCH_MAX_ATTEMPTS=2,
+    EMAIL_DISPATCH_RETRY_DELAY=60,
+)
+class QueuedEmailDispatchTest(TestCase):
+    def setUp(self):
+        FlakyEmailBackend.opened = 0
+
+    def test_queued_emails_share_one_connection(self):
+        queue_emails([(f"Subject {i}", "Body", [f"user{i}@example.com"]) for i in range(7)])
+        self.assertEqual(len(mail.outbox), 0)
+
+        counts = dispatch_queued_emails(batch_size=3)
+        self.assertEqual(counts, {"sent": 7, "retried": 0, "failed": 0})
+        self.assertEqual(len(mail.outbox), 7)
+        self.assertEqual(FlakyEmailBackend.opened, 1)
+        self.assertFalse(QueuedEmail.objects.exclude(status=QueuedEmail.STATUS_SENT).exists())
+        # Nothing left to send
+        self.assertEqual(dispatch_queued_emails(batch_size=3)["sent"], 0)
+
+    def test_failed_email_is_retried_then_dead_lettered(self):
+        bounced = queue_email("Bounced", "Body", ["nobody@bounce.test"])
+        queue_email("Delivered", "Body", ["user@example.com"])
+
+        counts = dispatch_queued_emails(batch_size=10)
+        self.assertEqual(counts, {"sent": 1, "retried": 1, "failed": 0})
+        self.assertEqual([message.subject for message in mail.outbox], ["Delivered"])
+        bounced.refresh_from_db()
+        self.assertEqual((bounced.status, bounced.attempts), (QueuedEmail.STATUS_PENDING, 1))
+        self.assertIn("SMTPRecipientsRefused", bounced.last_error)
+        self.assertGreater(bounced.next_attempt_at, timezone.now() + timedelta(seconds=30))
+
+        # Not due yet
+        self.assertEqual(dispatch_queued_emails(batch_size=10)["retried"], 0)
+
+        QueuedEmail.objects.filter(pk=bounced.pk).update(next_attempt_at=timezone.now())
+        self.assertEqual(dispatch_queued_emails(batch_size=10)["failed"], 1)
+        bounced.refresh_from_db()
+        self.assertEqual((bounced.status, bounced.attempts), (QueuedEmail.STATUS_FAILED, 2))
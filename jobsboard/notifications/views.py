@@ -8,6 +8,8 @@ from drf_yasg.utils import swagger_auto_schema
 from .models import Notification
 from .permissions import NotificationPermission
 from .serializers import NotificationSerializer, NotificationCreateSerializer
+from .signals import user_notifications_namespace
+from api.conditional import ConditionalGetMixin
 
 # ---------------------------------------------------------
 # NotificationViewSet
@@ -19,7 +21,9 @@ from .serializers import NotificationSerializer, NotificationCreateSerializer
 # - Supports creating notifications (by recruiters), listing, and marking as read.
 # - Enforces role-based access using NotificationPermission.
 # - Integrates Swagger for API documentation.
-class NotificationViewSet(viewsets.ModelViewSet):
+# - Conditional GET: seekers' ETags follow their own notifications only,
+#   other roles follow all notification writes (see notifications/signals.py).
+class NotificationViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     API endpoint for managing notifications.
     Admin -> sees all
@@ -28,6 +32,13 @@ class NotificationViewSet(viewsets.ModelViewSet):
     """
     queryset = Notification.objects.all()
     permission_classes = [NotificationPermission]
+    etag_per_user = True
+
+    def get_etag_namespaces(self, request):
+        user = request.user
+        if getattr(user, "is_seeker", False) and not user.is_staff:
+            return (user_notifications_namespace(user.pk),)
+        return ("notifications",)
 
     def get_queryset(self):
         # Swagger schema generation uses fake view
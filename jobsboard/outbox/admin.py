@@ -0,0 +1,8 @@
+from django.contrib import admin
+from .models import OutboxMessage
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = ("id", "task", "attempts", "created_at")
+    search_fields = ["task"]
+    readonly_fields = ("task", "args", "kwargs", "attempts", "last_error", "created_at")
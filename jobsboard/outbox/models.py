@@ -0,0 +1,22 @@
+# jobsboard/outbox/models.py
+from django.db import models
+
+# ---------------------------------------------------------
+# OutboxMessage Model
+# ---------------------------------------------------------
+# A Celery task call waiting to be published (transactional outbox).
+# - Written with enqueue_task() in the same transaction as the change that
+#   causes it: a rollback discards it, a commit keeps it.
+# - The relay (outbox.relay) publishes rows in id order and deletes them,
+#   so the table only holds calls not yet handed to the broker.
+# - attempts / last_error record failed publishes (broker down).
+class OutboxMessage(models.Model):
+    task = models.CharField(max_length=255)
+    args = models.JSONField(default=list)
+    kwargs = models.JSONField(default=dict)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.task} ({self.created_at})"
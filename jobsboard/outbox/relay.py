@@ -0,0 +1,68 @@
+# jobsboard/outbox/relay.py
+import logging
+
+from django.db import transaction
+
+from api.celery import app
+from .models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_task(task, *args, **kwargs):
+    """
+    Record a call of the Celery `task` (task object or name) in the outbox,
+    in the caller's transaction; the relay publishes it once committed.
+    Use instead of task.delay() on request paths: no broker round trip, and
+    no task for a change that is rolled back. Arguments must be JSON.
+    """
+    return OutboxMessage.objects.create(task=getattr(task, "name", task), args=list(args), kwargs=kwargs)
+
+
+def publish_messages(messages):
+    """
+    Send `messages` to the broker in order over one producer connection.
+    Stops at the first failure; returns (published ids, (message, error) or None).
+    """
+    published = []
+    message = None
+    try:
+        with app.producer_or_acquire() as producer:
+            for message in messages:
+                app.send_task(message.task, args=message.args, kwargs=message.kwargs, producer=producer)
+                published.append(message.pk)
+    except Exception as e:
+        return published, (message or messages[0], e)
+    return published, None
+
+
+def relay_outbox(batch_size):
+    """
+    Publish committed outbox rows, `batch_size` at a time, oldest first,
+    and delete them in the same transaction. Rows are locked with SKIP
+    LOCKED so relays can run side by side. A batch that fails midway keeps
+    its unpublished rows for the next run; a crash after publishing can
+    send a row twice (at-least-once), never lose one.
+    Returns the number of tasks published.
+    """
+    total = 0
+    while True:
+        with transaction.atomic():
+            messages = list(OutboxMessage.objects.order_by("id").select_for_update(skip_locked=True)[:batch_size])
+            if not messages:
+                break
+            published, failure = publish_messages(messages)
+            OutboxMessage.objects.filter(pk__in=published).delete()
+            if failure is not None:
+                message, error = failure
+                message.attempts += 1
+                message.last_error = f"{type(error).__name__}: {error}"
+                message.save(update_fields=["attempts", "last_error"])
+                logger.error(f"Outbox relay: publishing {message.task} ({message.pk}) failed: {error}")
+        total += len(published)
+        if failure is not None or len(messages) < batch_size:
+            break
+
+    if total:
+        logger.info(f"Outbox relay: {total} tasks published")
+    return total
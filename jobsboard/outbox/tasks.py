@@ -0,0 +1,11 @@
+# jobsboard/outbox/tasks.py
+from celery import shared_task
+from django.conf import settings
+
+from .relay import relay_outbox
+
+
+@shared_task
+def relay_outbox_task():
+    """Publish the task calls committed to the outbox since the last run."""
+    return relay_outbox(settings.OUTBOX_RELAY_BATCH_SIZE)
@@ -0,0 +1,65 @@
+# jobsboard/outbox/tests.py
+from unittest.mock import MagicMock, patch
+
+from django.db import transaction
+from django.test import TestCase
+
+from outbox.models import OutboxMessage
+from outbox.relay import enqueue_task, relay_outbox
+
+
+def broker(fail_after=None):
+    """Stand-in Celery app recording sends; the broker fails after `fail_after` of them."""
+    app = MagicMock()
+    sent = []
+
+    def send_task(name, args=None, kwargs=None, producer=None):
+        if fail_after is not None and len(sent) >= fail_after:
+            raise ConnectionError("broker unavailable")
+        sent.append((name, args, kwargs))
+
+    app.send_task.side_effect = send_task
+    return app, sent
+
+
+class OutboxTest(TestCase):
+    def test_rolled_back_changes_leave_no_task(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                enqueue_task("applications.tasks.send_reviewed_email_task", email="a@example.com")
+                raise RuntimeError
+        self.assertFalse(OutboxMessage.objects.exists())
+
+        with transaction.atomic():
+            enqueue_task("applications.tasks.send_reviewed_email_task", email="a@example.com")
+        self.assertEqual(OutboxMessage.objects.count(), 1)
+
+    def test_relay_publishes_in_order_over_one_producer(self):
+        for i in range(5):
+            enqueue_task("payments.tasks.send_payment_confirmation_email", f"user{i}@example.com", i, "job_post")
+        app, sent = broker()
+        with patch("outbox.relay.app", app):
+            self.assertEqual(relay_outbox(batch_size=2), 5)
+
+        self.assertEqual([args[0] for _, args, _ in sent], [f"user{i}@example.com" for i in range(5)])
+        self.assertEqual(sent[0], ("payments.tasks.send_payment_confirmation_email", ["user0@example.com", 0, "job_post"], {}))
+        # One producer per batch of 2
+        self.assertEqual(app.producer_or_acquire.call_count, 3)
+        self.assertFalse(OutboxMessage.objects.exists())
+
+    def test_broker_failure_keeps_unpublished_rows(self):
+        for i in range(3):
+            enqueue_task("notifications.tasks.send_queued_emails", i)
+        app, sent = broker(fail_after=1)
+        with patch("outbox.relay.app", app):
+            self.assertEqual(relay_outbox(batch_size=10), 1)
+
+        remaining = list(OutboxMessage.objects.order_by("id"))
+        self.assertEqual([message.args for message in remaining], [[1], [2]])
+        self.assertEqual(remaining[0].attempts, 1)
+        self.assertIn("broker unavailable", remaining[0].last_error)
+
+        app, sent = broker()
+        with patch("outbox.relay.app", app):
+            self.assertEqual(relay_outbox(batch_size=10), 2)
+        self.assertEqual([args for _, args, _ in sent], [[1], [2]])
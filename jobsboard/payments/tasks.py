@@ -1,14 +1,13 @@
 # jobsboard/payments/tasks.py
 from celery import shared_task
-from django.core.mail import send_mail
-from django.conf import settings
+
+from notifications.emails import queue_email
 
 @shared_task
 def send_payment_confirmation_email(user_email, amount, payment_type):
-    send_mail(
-        subject=f"Payment Confirmation: {payment_type}",
-        message=f"Your payment of {amount} has been successfully processed.",
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        recipient_list=[user_email],
-        fail_silently=False,
+    # Delivered with the other queued emails by notifications.tasks.send_queued_emails
+    queue_email(
+        f"Payment Confirmation: {payment_type}",
+        f"Your payment of {amount} has been successfully processed.",
+        [user_email],
     )
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-18 05:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('request_logs', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='requestlog',
+            index=models.Index(fields=['user', 'timestamp', 'id'], name='idx_request_logs_user_ts'),
+        ),
+    ]
@@ -9,6 +9,7 @@ from django.conf import settings
 # - Records include user (optional), IP address, endpoint, HTTP method, status code, and timestamp.
 # - Useful for auditing, debugging, and monitoring rate-limiting or suspicious activity.
 # - Orders records by timestamp descending for recent-first queries.
+# - Indexed on (user, timestamp, id) for per-user cursor pagination.
 class RequestLog(models.Model):
     HTTP_METHOD_CHOICES = [
         ('GET', 'GET'),
@@ -34,6 +35,11 @@ class RequestLog(models.Model):
     class Meta:
         db_table = 'request_logs'
         ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['user', 'timestamp', 'id'], name='idx_request_logs_user_ts'),
+            # Unfiltered (admin) cursor walk over (-timestamp, -id)
+            models.Index(fields=['timestamp', 'id'], name='idx_request_logs_ts'),
+        ]
 
     def __str__(self):
         return f"{self.method} {self.endpoint} - {self.status_code}"
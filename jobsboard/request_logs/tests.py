@@ -91,6 +91,27 @@ class RequestLogTests(TestCase):
         response_ids = {log["id"] for log in response.data["results"]}
         self.assertTrue(db_ids.issubset(response_ids))
 
+    def test_list_request_logs_cursor_pagination(self):
+        """?pagination=cursor walks the user's logs newest first, without a count"""
+        RequestLog.objects.bulk_create(
+            RequestLog(user=self.user1, ip_address="127.0.0.1", endpoint=f"/page/{i}/", method="GET", status_code=200)
+            for i in range(11)
+        )
+        # Read before walking: the middleware logs the walk's own requests
+        expected = list(RequestLog.objects.filter(user=self.user1).order_by("-timestamp", "-id").values_list("id", flat=True))
+
+        self.client.force_authenticate(self.user1)
+        response = self.client.get("/api/request-logs/", {"pagination": "cursor"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+
+        seen = [log["id"] for log in response.data["results"]]
+        response = self.client.get(response.data["next"])
+        seen += [log["id"] for log in response.data["results"]]
+
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(seen, expected)
+
     def test_request_log_is_created_manually(self):
         """Manual creation works as expected"""
         log = RequestLog.objects.create(
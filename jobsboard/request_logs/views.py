@@ -7,6 +7,7 @@ from drf_yasg.utils import swagger_auto_schema
 from .models import RequestLog
 from .serializers import RequestLogSerializer
 from .permissions import IsOwnerOrAdmin
+from api.pagination import EstimatedCountPagination
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,11 @@ class RequestLogViewSet(viewsets.ModelViewSet):
     serializer_class = RequestLogSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    # Page numbers by default, keyset pagination with `?pagination=cursor`;
+    # page counts on a large table are planner estimates
+    pagination_class = EstimatedCountPagination
+    cursor_ordering = ("-timestamp", "-id")
+
     def get_queryset(self):
         # Safe for Swagger/OpenAPI schema generation
         if getattr(self, "swagger_fake_view", False):
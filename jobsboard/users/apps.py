@@ -15,7 +15,10 @@ class UsersConfig(AppConfig):
 def reset_profile_sequence(sender, **kwargs):
     """
     Reset sequence for users_profile so new rows get the correct ID.
+    Only PostgreSQL has sequences to reset (SQLite is used for tests).
     """
+    if connection.vendor != "postgresql":
+        return
     with connection.cursor() as cursor:
         cursor.execute("""
             SELECT setval(